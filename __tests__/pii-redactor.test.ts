@@ -1,4 +1,4 @@
-import { redactPII, safeLog } from '../lib/pii-redactor';
+import { redactPII, safeLog, safeDebug } from '../lib/pii-redactor';
 
 describe('PII Redactor', () => {
   describe('redactPII - Pass 1 (Regex)', () => {
@@ -211,4 +211,37 @@ describe('PII Redactor', () => {
       consoleSpy.mockRestore();
     });
   });
+
+  describe('safeDebug', () => {
+    const originalLogLevel = process.env.LOG_LEVEL;
+
+    afterEach(() => {
+      if (originalLogLevel === undefined) {
+        delete process.env.LOG_LEVEL;
+      } else {
+        process.env.LOG_LEVEL = originalLogLevel;
+      }
+    });
+
+    test('should not log unless LOG_LEVEL is debug', () => {
+      const consoleSpy = jest.spyOn(console, 'log').mockImplementation();
+      delete process.env.LOG_LEVEL;
+
+      safeDebug('Chunk received');
+
+      expect(consoleSpy).not.toHaveBeenCalled();
+      consoleSpy.mockRestore();
+    });
+
+    test('should log with redaction when LOG_LEVEL is debug', () => {
+      const consoleSpy = jest.spyOn(console, 'log').mockImplementation();
+      process.env.LOG_LEVEL = 'debug';
+
+      safeDebug('Contact: john@example.com');
+
+      expect(consoleSpy).toHaveBeenCalled();
+      expect(consoleSpy.mock.calls[0][0] as string).toContain('[EMAIL_REDACTED]');
+      consoleSpy.mockRestore();
+    });
+  });
 });
@@ -0,0 +1,60 @@
+import { webcrypto } from 'crypto';
+import { TextEncoder } from 'util';
+import {
+  getAnalysisCacheKey,
+  getCachedAnalysis,
+  setCachedAnalysis,
+  formatCachedAnalysisReplay,
+  type CachedAnalysis,
+} from '../lib/response-cache';
+
+// jsdom lacks SubtleCrypto and TextEncoder; the cache key hash needs both
+if (!globalThis.crypto?.subtle) {
+  Object.defineProperty(globalThis, 'crypto', { value: webcrypto, configurable: true });
+}
+if (!globalThis.TextEncoder) {
+  Object.assign(globalThis, { TextEncoder });
+}
+
+const analysis: CachedAnalysis = {
+  text: JSON.stringify({ strategy: 'File an answer within five days.' }),
+  sources: [{ title: 'Cal. Civ. Proc. Code § 1167' }],
+};
+
+describe('getAnalysisCacheKey', () => {
+  test('should ignore case and whitespace differences', async () => {
+    const a = await getAnalysisCacheKey('  My landlord   EVICTED me ', 'California', ['Lease  Agreement']);
+    const b = await getAnalysisCacheKey('my landlord evicted me', ' california ', ['lease agreement']);
+
+    expect(a).toBe(b);
+  });
+
+  test('should keep document order significant', async () => {
+    const a = await getAnalysisCacheKey('eviction notice', 'California', ['lease', 'notice']);
+    const b = await getAnalysisCacheKey('eviction notice', 'California', ['notice', 'lease']);
+
+    expect(a).not.toBe(b);
+  });
+});
+
+describe('analysis cache storage', () => {
+  // Upstash is not configured in tests, so this exercises the in-memory fallback
+  test('should not store analyses that failed validation', async () => {
+    const key = await getAnalysisCacheKey('invalid analysis', 'Texas');
+
+    expect(await setCachedAnalysis(key, analysis, false)).toBe(false);
+    expect(await getCachedAnalysis(key)).toBeNull();
+  });
+
+  test('should replay a stored analysis as a single complete event', async () => {
+    const key = await getAnalysisCacheKey('valid analysis', 'Texas');
+    expect(await setCachedAnalysis(key, analysis, true)).toBe(true);
+
+    const cached = await getCachedAnalysis(key);
+    expect(cached).toEqual(analysis);
+
+    const lines = formatCachedAnalysisReplay(cached!).split('\n').filter(Boolean);
+    expect(lines).toHaveLength(1);
+    expect(JSON.parse(lines[0])).toEqual({ type: 'complete', result: analysis });
+  });
+});
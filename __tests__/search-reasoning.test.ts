@@ -22,7 +22,7 @@ describe('Search Reasoning Module', () => {
           json: () => Promise.resolve({
             choices: [{
               message: {
-                content: '["local rules of court California civil procedure", "statutory precedents tenant rights California", "case law security deposit California"]'
+                content: '{"queries": ["local rules of court California civil procedure", "statutory precedents tenant rights California", "case law security deposit California"]}'
               }
             }]
           })
@@ -90,7 +90,7 @@ describe('Search Reasoning Module', () => {
           json: () => Promise.resolve({
             choices: [{
               message: {
-                content: '["query1", "query2", "query3"]'
+                content: '{"queries": ["query1", "query2", "query3"]}'
               }
             }]
           })
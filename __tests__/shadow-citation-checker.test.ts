@@ -0,0 +1,69 @@
+import { verifyCitationsWithEarlyCheck, type LiveCitationVerification } from '../lib/shadow-citation-checker';
+
+const mockFetch = global.fetch as jest.MockedFunction<typeof global.fetch>;
+const baseUrl = 'http://localhost:3000';
+
+/**
+ * Citations sent to the verify-citation endpoint, across every request
+ */
+function requestedCitations(): string[] {
+  return mockFetch.mock.calls.flatMap(([, init]) => JSON.parse(String(init?.body)).citations as string[]);
+}
+
+describe('verifyCitationsWithEarlyCheck', () => {
+  beforeEach(() => {
+    mockFetch.mockReset();
+    // The endpoint verifies everything it is sent
+    mockFetch.mockImplementation(async (_url, init) => {
+      const { citations } = JSON.parse(String(init?.body)) as { citations: string[] };
+      return {
+        ok: true,
+        json: async () => ({ results: citations.map(() => ({ is_verified: true, details: 'live' })) }),
+      } as unknown as Response;
+    });
+  });
+
+  test('should reuse the early results without new lookups when the citations match', async () => {
+    const early: LiveCitationVerification[] = [
+      { citation: 'Cal. Civ. Code § 1942', is_verified: true, details: 'early' },
+      { citation: '42 U.S.C. § 1983', is_verified: false, details: 'early' },
+    ];
+
+    const results = await verifyCitationsWithEarlyCheck(
+      ['42 U.S.C. §1983', 'Cal. Civ. Code § 1942'],
+      'California',
+      baseUrl,
+      Promise.resolve(early)
+    );
+
+    expect(mockFetch).not.toHaveBeenCalled();
+    // Reordered and respaced, but matched to the early results and reported against the final text
+    expect(results).toEqual([
+      { citation: '42 U.S.C. §1983', is_verified: false, details: 'early' },
+      { citation: 'Cal. Civ. Code § 1942', is_verified: true, details: 'early' },
+    ]);
+  });
+
+  test('should only look up citations the early check did not cover', async () => {
+    const early: LiveCitationVerification[] = [
+      { citation: 'Cal. Civ. Code § 1942', is_verified: true, details: 'early' },
+    ];
+
+    const results = await verifyCitationsWithEarlyCheck(
+      ['Cal. Civ. Code § 1942', 'Cal. Civ. Proc. Code § 1161'],
+      'California',
+      baseUrl,
+      Promise.resolve(early)
+    );
+
+    expect(requestedCitations()).toEqual(['Cal. Civ. Proc. Code § 1161']);
+    expect(results.map(r => r.details)).toEqual(['early', 'live']);
+  });
+
+  test('should verify every citation when there was no early check', async () => {
+    const results = await verifyCitationsWithEarlyCheck(['Cal. Civ. Code § 1942'], 'California', baseUrl, null);
+
+    expect(requestedCitations()).toEqual(['Cal. Civ. Code § 1942']);
+    expect(results[0]).toMatchObject({ citation: 'Cal. Civ. Code § 1942', is_verified: true });
+  });
+});
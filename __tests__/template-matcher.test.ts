@@ -0,0 +1,75 @@
+import { TemplateMatcher, hasEmergencyKeywords, type MatchableTemplate } from '../lib/template-matcher';
+
+const templates: MatchableTemplate[] = [
+  {
+    title: 'Motion to Dismiss',
+    description: 'Request the court dismiss a complaint for failure to state a claim',
+    templatePath: '/templates/motion-to-dismiss.md',
+    keywords: ['dismiss', 'motion', 'failure to state a claim'],
+  },
+  {
+    title: 'Divorce Complaint',
+    description: 'Petition to dissolve a marriage and divide property',
+    templatePath: '/templates/divorce-complaint.md',
+    keywords: ['divorce', 'marriage', 'dissolution'],
+  },
+  {
+    title: 'Lockout Emergency Pack',
+    description: 'Emergency relief when a landlord changes the locks',
+    templatePath: '/templates/lockout-emergency-pack.md',
+    keywords: ['lockout', 'locks'],
+  },
+];
+
+describe('TemplateMatcher', () => {
+  const matcher = new TemplateMatcher(templates);
+
+  test('should force the emergency template on emergency keywords', () => {
+    const result = matcher.findBestTemplate('My landlord changed locks and I am locked out');
+
+    expect(result.isEmergency).toBe(true);
+    expect(result.template?.title).toBe('Lockout Emergency Pack');
+  });
+
+  test('should pick the template sharing keywords with the input', () => {
+    const result = matcher.findBestTemplate('I want a divorce and to end my marriage');
+
+    expect(result.isEmergency).toBe(false);
+    expect(result.template?.title).toBe('Divorce Complaint');
+  });
+
+  test('should return null when no template is relevant', () => {
+    const result = matcher.findBestTemplate('zzz qqq');
+
+    expect(result.template).toBeNull();
+  });
+
+  test('should still score keywords that only match as a substring', () => {
+    const substringMatcher = new TemplateMatcher([
+      {
+        title: 'Unlawful Detainer Answer',
+        description: 'Tenant response after landlord lawsuit',
+        templatePath: '/templates/unlawful-detainer-answer.md',
+        keywords: ['detainer'],
+      },
+      {
+        title: 'Small Claims Form',
+        description: 'File claim for money owed',
+        templatePath: '/templates/small-claims.md',
+        keywords: ['money'],
+      },
+    ]);
+
+    // "detainers" only contains the keyword; the other template shares the token "for"
+    const result = substringMatcher.findBestTemplate('detainers filed for my apartment');
+
+    expect(result.template?.title).toBe('Unlawful Detainer Answer');
+  });
+});
+
+describe('hasEmergencyKeywords', () => {
+  test('should detect emergency phrases case-insensitively', () => {
+    expect(hasEmergencyKeywords('They SHUT OFF my utilities')).toBe(true);
+    expect(hasEmergencyKeywords('Contract dispute over a warranty')).toBe(false);
+  });
+});
@@ -0,0 +1,84 @@
+import type { NextRequest } from 'next/server';
+import { POST } from '../app/api/verify-citation/route';
+import { CITATION_VERIFICATION } from '../config/constants';
+
+jest.mock('next/server', () => ({
+  NextResponse: {
+    json: (body: unknown, init?: { status?: number }) => ({
+      status: init?.status ?? 200,
+      json: async () => body,
+    }),
+  },
+}));
+
+const mockFetch = global.fetch as jest.MockedFunction<typeof global.fetch>;
+
+function request(body: unknown): NextRequest {
+  return { json: async () => body } as unknown as NextRequest;
+}
+
+async function post(body: unknown): Promise<{ status: number; data: { results?: Array<Record<string, unknown>>; error?: string } }> {
+  const response = await POST(request(body)) as unknown as { status: number; json: () => Promise<never> };
+  return { status: response.status, data: await response.json() };
+}
+
+describe('POST /api/verify-citation', () => {
+  beforeEach(() => {
+    mockFetch.mockReset();
+    // CourtListener only knows Brown v. Board; every other search comes back empty
+    mockFetch.mockImplementation(async (url) => {
+      const known = String(url).includes(encodeURIComponent('347 U.S. 483'));
+      return {
+        ok: true,
+        json: async () => known
+          ? { count: 1, results: [{ caseName: 'Brown v. Board of Education', court_full: 'Supreme Court' }] }
+          : { count: 0, results: [] },
+      } as unknown as Response;
+    });
+  });
+
+  test('should return one result per citation in request order', async () => {
+    const { status, data } = await post({
+      citations: ['999 U.S. 999', '347 U.S. 483'],
+      jurisdiction: 'California',
+      strict_mode: true,
+    });
+
+    expect(status).toBe(200);
+    expect(data.results).toHaveLength(2);
+    expect(data.results?.[0]).toMatchObject({ citation: '999 U.S. 999', is_verified: false, unverified_reason: 'STRICT_MODE' });
+    expect(data.results?.[1]).toMatchObject({ citation: '347 U.S. 483', is_verified: true });
+  });
+
+  test('should keep malformed entries in place and report them unverified', async () => {
+    const { status, data } = await post({
+      citations: [42, '   ', null],
+      jurisdiction: 'California',
+      strict_mode: true,
+    });
+
+    expect(status).toBe(200);
+    expect(data.results).toHaveLength(3);
+    for (const result of data.results ?? []) {
+      expect(result).toMatchObject({ is_verified: false, status_message: 'UNVERIFIED - Empty citation' });
+    }
+    expect(mockFetch).not.toHaveBeenCalled();
+  });
+
+  test('should verify a single citation through the same chain as a batch', async () => {
+    const { status, data } = await post({ citation: '347 U.S. 483', jurisdiction: 'California', strict_mode: true });
+
+    expect(status).toBe(200);
+    expect(data).toMatchObject({ citation: '347 U.S. 483', is_verified: true, confidence_score: 100 });
+  });
+
+  test('should reject batches over the size limit without looking anything up', async () => {
+    const citations = Array.from({ length: CITATION_VERIFICATION.MAX_BATCH_SIZE + 1 }, (_, i) => `${i} U.S. ${i}`);
+
+    const { status, data } = await post({ citations, jurisdiction: 'California', strict_mode: true });
+
+    expect(status).toBe(400);
+    expect(data.error).toBe('Batch too large');
+    expect(mockFetch).not.toHaveBeenCalled();
+  });
+});
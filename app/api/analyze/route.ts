@@ -1,12 +1,14 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { SafetyValidator } from '../../../lib/validation-middleware';
-import { safeLog, safeError, safeWarn, redactPII } from '../../../lib/pii-redactor';
+import { safeLog, safeDebug, safeError, safeWarn, redactPII } from '../../../lib/pii-redactor';
 import { withRateLimit } from '../../../lib/rate-limiter';
 import { getLegalLookupResponse, searchExParteRules } from '../../../src/utils/legal-lookup';
 import { searchLegalRules, isVectorConfigured } from '../../../lib/vector';
 import { saveCheckpoint, generateSessionId } from '../../../lib/analysis-checkpoint';
-import { verifyCitationsLive } from '../../../lib/shadow-citation-checker';
-import { CITATION_VERIFICATION } from '../../../config/constants';
+import { CITATION_VERIFICATION, JSON_STREAM, LEGAL_DATA, LIMITS } from '../../../config/constants';
+import { getAnalysisCacheKey, getCachedAnalysis, setCachedAnalysis, formatCachedAnalysisReplay } from '../../../lib/response-cache';
+import { TemplateMatcher, hasEmergencyKeywords, type MatchableTemplate } from '../../../lib/template-matcher';
+import type { LiveCitationVerification } from '../../../lib/shadow-citation-checker';
 import templateManifest from '../../../public/templates/manifest.json';
 import { readFile } from 'fs/promises';
 import path from 'path';
@@ -24,13 +26,6 @@ interface StandardErrorResponse {
   detail: string;
 }
 
-interface Template {
-  title: string;
-  description: string;
-  templatePath: string;
-  keywords: string[];
-}
-
 interface LegalOutput {
   disclaimer?: string;
   strategy?: string;
@@ -147,127 +142,23 @@ function validateLegalOutputStructure(output: LegalOutput): ValidationResult {
   };
 }
 
-function keywordOverlapScore(userInput: string, templateKeywords: string[]): number {
-  if (!templateKeywords || templateKeywords.length === 0) return 0;
-
-  const userInputLower = userInput.toLowerCase();
-  const userTokens = new Set(userInputLower.split(/\W+/));
-
-  let matchedKeywords = 0;
-
-  for (const keyword of templateKeywords) {
-    const keywordLower = keyword.toLowerCase();
-    if (userTokens.has(keywordLower) || userInputLower.includes(keywordLower)) {
-      matchedKeywords++;
-    }
-  }
-
-  return matchedKeywords / templateKeywords.length;
-}
-
-function hasEmergencyKeywords(userInput: string): boolean {
-  const emergencyKeywords = [
-    "eviction", "lockout", "changed locks", "locked out",
-    "emergency", "immediate", "urgent", "right now", "today",
-    "shut off", "utilities", "no water", "no electricity",
-    "domestic violence", "restraining order", "protective order"
-  ];
-
-  const userInputLower = userInput.toLowerCase();
-  return emergencyKeywords.some(keyword => userInputLower.includes(keyword));
-}
-
-function cosineSimilarity(text1: string, text2: string): number {
-  if (!text1 || !text2) return 0;
-
-  const tokens1 = text1.toLowerCase().split(/\W+/).filter(Boolean);
-  const tokens2 = text2.toLowerCase().split(/\W+/).filter(Boolean);
-
-  const freqMap1 = new Map<string, number>();
-  const freqMap2 = new Map<string, number>();
-
-  for (const token of tokens1) {
-    freqMap1.set(token, (freqMap1.get(token) || 0) + 1);
-  }
-
-  for (const token of tokens2) {
-    freqMap2.set(token, (freqMap2.get(token) || 0) + 1);
-  }
-
-  const allTerms = new Set([...tokens1, ...tokens2]);
-
-  const vec1: number[] = [];
-  const vec2: number[] = [];
-
-  for (const term of allTerms) {
-    vec1.push(freqMap1.get(term) || 0);
-    vec2.push(freqMap2.get(term) || 0);
-  }
-
-  let dotProduct = 0;
-  for (let i = 0; i < vec1.length; i++) {
-    dotProduct += vec1[i] * vec2[i];
-  }
-
-  const magnitude1 = Math.sqrt(vec1.reduce((sum, val) => sum + val * val, 0));
-  const magnitude2 = Math.sqrt(vec2.reduce((sum, val) => sum + val * val, 0));
-
-  if (magnitude1 === 0 || magnitude2 === 0) return 0;
-
-  return dotProduct / (magnitude1 * magnitude2);
-}
-
-function findBestTemplate(userInput: string, templates: Template[]): { template: Template | null, isEmergency: boolean } {
-  if (hasEmergencyKeywords(userInput)) {
-    for (const template of templates) {
-      const templateTitle = template.title?.toLowerCase() || '';
-      const templatePath = template.templatePath?.toLowerCase() || '';
-
-      if (templateTitle.includes('lockout') || templatePath.includes('lockout') || templateTitle.includes('emergency')) {
-        safeLog(`Emergency keywords detected, forcing template: ${template.title}`);
-        return { template, isEmergency: true };
-      }
-    }
-  }
-
-  let bestMatch = null;
-  let highestSimilarity = 0;
-
-  const legalBoostKeywords = [
-    'motion', 'complaint', 'answer', 'discovery', 'subpoena',
-    'eviction', 'unlawful detainer', 'foreclosure', 'bankruptcy',
-    'custody', 'divorce', 'restraining order', 'guardianship',
-    'contract', 'breach', 'damages', 'injunction'
-  ];
-
-  for (const template of templates) {
-    const templateKeywords = template.keywords || [];
-    const keywordScore = keywordOverlapScore(userInput, templateKeywords);
-
-    const titleSimilarity = cosineSimilarity(userInput.toLowerCase(), template.title?.toLowerCase() || '');
-    const descSimilarity = cosineSimilarity(userInput.toLowerCase(), template.description?.toLowerCase() || '');
-
-    let titleBoost = 0;
-    const templateTitle = template.title?.toLowerCase() || '';
-    for (const legalKeyword of legalBoostKeywords) {
-      if (userInput.toLowerCase().includes(legalKeyword) && templateTitle.includes(legalKeyword)) {
-        titleBoost = 0.2;
-        break;
-      }
-    }
+/**
+ * Manifest templates with their term vectors precomputed at module load
+ */
+const templateMatcher = new TemplateMatcher(templateManifest.templates as MatchableTemplate[]);
 
-    const combinedSimilarity = (keywordScore * 0.5) + (titleSimilarity * 0.3) + (descSimilarity * 0.2) + titleBoost;
+/**
+ * Template file contents by path, read from disk once per server instance
+ */
+const templateContentCache = new Map<string, string>();
 
-    if (combinedSimilarity > highestSimilarity) {
-      highestSimilarity = combinedSimilarity;
-      bestMatch = template;
-    }
-  }
+async function loadTemplateContent(templatePath: string): Promise<string> {
+  const cached = templateContentCache.get(templatePath);
+  if (cached !== undefined) return cached;
 
-  return {
-    template: (bestMatch && highestSimilarity > 0.1) ? bestMatch : null,
-    isEmergency: false
-  };
+  const content = await readFile(templatePath, 'utf8');
+  templateContentCache.set(templatePath, content);
+  return content;
 }
 
 const GENERIC_MOTION_TEMPLATE = `# GENERIC MOTION TEMPLATE
@@ -333,6 +224,179 @@ _______________________
 const GLM_API_URL = "https://api.z.ai/api/paas/v4/chat/completions";
 const ANALYSIS_MODEL = process.env.NEXT_PUBLIC_DEFAULT_MODEL || "glm-4.7-flash";
 
+/**
+ * Function-calling schema for the analysis request. Static, so it is built
+ * once at module load rather than on every request.
+ */
+const LEGAL_ANALYSIS_TOOL = {
+  type: 'function' as const,
+  function: {
+    name: 'generate_legal_analysis',
+    description: 'Generate comprehensive legal analysis and strategy for Pro Se litigants',
+    parameters: {
+      type: 'object',
+      properties: {
+        disclaimer: {
+          type: 'string',
+          description: 'Legal disclaimer stating this is information not advice'
+        },
+        strategy: {
+          type: 'string',
+          description: 'Primary legal strategy and analysis'
+        },
+        adversarial_strategy: {
+          type: 'string',
+          description: 'Detailed red-team analysis identifying weaknesses and how opposition will counter each point'
+        },
+        roadmap: {
+          type: 'array',
+          items: {
+            type: 'object',
+            properties: {
+              step: { type: 'number', description: 'Step number' },
+              title: { type: 'string', description: 'Step title' },
+              description: { type: 'string', description: 'Detailed description' },
+              estimated_time: { type: 'string', description: 'Timeframe for completion' },
+              required_documents: { type: 'array', items: { type: 'string' }, description: 'Required documents' },
+              counter_measure: { type: 'string', description: 'Expected opposition response and how to prepare' }
+            },
+            required: ['step', 'title', 'description']
+          }
+        },
+        filing_template: {
+          type: 'string',
+          description: 'Complete filing template with caption, motion body, and certificate of service'
+        },
+        citations: {
+          type: 'array',
+          description: 'Legal citations (minimum 3)',
+          items: {
+            type: 'object',
+            properties: {
+              text: { type: 'string', description: 'Full citation string' },
+              source: { type: 'string', description: 'Type of source (statute, case, rule)' },
+              url: { type: 'string', description: 'URL to citation source' }
+            },
+            required: ['text']
+          }
+        },
+        local_logistics: {
+          type: 'object',
+          description: 'Courthouse information and local requirements',
+          properties: {
+            courthouse_address: { type: 'string' },
+            filing_fees: { type: 'string' },
+            dress_code: { type: 'string' },
+            parking_info: { type: 'string' },
+            hours_of_operation: { type: 'string' },
+            local_rules_url: { type: 'string' }
+          }
+        },
+        procedural_checks: {
+          type: 'array',
+          description: 'Procedural compliance checks',
+          items: { type: 'string' }
+        }
+      },
+      required: ['disclaimer', 'strategy', 'adversarial_strategy', 'roadmap', 'filing_template', 'citations', 'local_logistics', 'procedural_checks']
+    }
+  }
+};
+
+const LEGAL_ANALYSIS_TOOL_CHOICE = {
+  type: 'function' as const,
+  function: {
+    name: 'generate_legal_analysis'
+  }
+};
+
+/**
+ * Fixed opening of the analysis system prompt. It contains nothing
+ * request-specific, so every request shares a byte-identical prefix that the
+ * provider's prompt cache can reuse; per-request context is appended after it.
+ */
+const ANALYSIS_SYSTEM_PROMPT_PREFIX = `You are LawSage, a Pro Se Architect AI helping self-represented litigants.
+
+IMPORTANT LIMITATIONS:
+- You do NOT have web search capabilities. Rely ONLY on the provided RESEARCH CONTEXT and your internal legal knowledge.
+- You do NOT support image analysis. All analysis is text-based.
+- For jurisdiction-specific questions, use the provided context and your training data for the jurisdiction named in the request.
+
+CRITICAL EVIDENCE HANDLING:
+You have been provided with OCR-extracted text from official documents in the 'documents' field.
+1. If the user's description conflicts with the OCR text (e.g., dates, case numbers, or facts), the OCR text is the source of truth.
+2. Explicitly reference documents using [Evidence X] notation in your strategy.
+3. Use the Case Number found in documents to populate the Filing Template.
+4. Cross-reference the user's claims against the extracted evidence to identify contradictions.
+5. If evidence documents exist, your adversarial_strategy should address how the opposition might use these documents.`;
+
+interface GLMStreamEvent {
+  error?: unknown;
+  choices?: Array<{
+    delta?: {
+      content?: string;
+      tool_calls?: Array<{ function?: { arguments?: string } }>;
+    };
+  }>;
+}
+
+/**
+ * Key that follows citations in the tool arguments; once it appears the
+ * citation list is complete
+ */
+const CITATIONS_COMPLETE_MARKER = '"local_logistics"';
+
+/**
+ * Extract the text fragment carried by a GLM streaming event.
+ * Tool-call arguments take precedence; plain content is only used when the
+ * delta carries no tool calls.
+ */
+function extractDeltaText(data: GLMStreamEvent): string {
+  const delta = data.choices?.[0]?.delta;
+  const toolArgs = delta?.tool_calls?.[0]?.function?.arguments;
+  if (toolArgs) return toolArgs;
+  if (delta?.content && !delta.tool_calls) return delta.content;
+  return '';
+}
+
+function escapeRegExp(text: string): string {
+  return text.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+}
+
+/**
+ * Drop duplicate case-folder documents and cap each document and the total
+ * at the prompt budget, so re-uploaded evidence doesn't multiply input tokens
+ */
+function prepareDocumentsForPrompt(documents: string[]): string[] {
+  const seen = new Set<string>();
+  const prepared: string[] = [];
+  let remaining = LIMITS.PROMPT_DOCUMENTS_MAX_CHARS;
+
+  for (const doc of documents) {
+    const text = doc.trim();
+    if (!text || seen.has(text)) continue;
+    seen.add(text);
+
+    const excerpt = text.substring(0, Math.min(LIMITS.OCR_MAX_CHARS, remaining));
+    prepared.push(excerpt);
+    remaining -= excerpt.length;
+    if (remaining <= 0) break;
+  }
+
+  return prepared;
+}
+
+/**
+ * Cap research context at the prompt budget, cutting at the last paragraph
+ * break that fits so a source entry is never left half-included
+ */
+function limitResearchContext(context: string): string {
+  if (context.length <= LIMITS.PROMPT_RESEARCH_MAX_CHARS) return context;
+
+  const cut = context.lastIndexOf('\n\n', LIMITS.PROMPT_RESEARCH_MAX_CHARS);
+  return context.substring(0, cut > 0 ? cut + 2 : LIMITS.PROMPT_RESEARCH_MAX_CHARS);
+}
+
 export async function POST(req: NextRequest) {
   return withRateLimit(async () => {
     try {
@@ -361,6 +425,14 @@ export async function POST(req: NextRequest) {
         );
       }
 
+      // Reject blocked requests before any research, checkpointing or prompt assembly
+      if (!SafetyValidator.redTeamAudit(user_input, jurisdiction)) {
+        return NextResponse.json(
+          { type: "SafetyViolation", detail: "Request blocked: Missing jurisdiction or potential safety violation." } satisfies StandardErrorResponse,
+          { status: 400 }
+        );
+      }
+
       // Generate session ID for checkpoint/resume functionality
       const sessionId = generateSessionId();
 
@@ -371,10 +443,27 @@ export async function POST(req: NextRequest) {
         safeLog(`Processing request for jurisdiction: ${jurisdiction} (session: ${sessionId})`);
       }
 
+      // Identical requests reuse the stored analysis instead of re-running research and the LLM
+      const cacheKey = await getAnalysisCacheKey(user_input, jurisdiction, documents);
+      const cachedAnalysis = await getCachedAnalysis(cacheKey);
+      if (cachedAnalysis) {
+        safeLog(`Serving cached analysis for jurisdiction: ${jurisdiction} (session: ${sessionId})`);
+        return new Response(formatCachedAnalysisReplay(cachedAnalysis), {
+          headers: {
+            'Content-Type': 'application/x-ndjson',
+            'Cache-Control': 'no-cache',
+            'X-RateLimit-Limit': '5',
+            'X-RateLimit-Window': '3600',
+            'X-Session-ID': sessionId,
+            'X-Analysis-Cache': 'HIT'
+          }
+        });
+      }
+
       const isEmergency = hasEmergencyKeywords(user_input);
 
-      // Save initial checkpoint
-      await saveCheckpoint(sessionId, {
+      // Save initial checkpoint alongside the research fan-out below
+      const initialCheckpointPromise = saveCheckpoint(sessionId, {
         step: 'initial',
         jurisdiction,
         accumulatedArgs: '',
@@ -389,23 +478,34 @@ export async function POST(req: NextRequest) {
           // METADATA FILTERING: Detect case category from user input for better RAG filtering
           const detectedCategory = detectCaseCategory(user_input);
           
-          const vectorResults = await searchLegalRules(`${user_input} ${jurisdiction}`, {
-            jurisdiction: jurisdiction !== 'Federal' ? jurisdiction : undefined,
-            category: detectedCategory !== 'General' ? detectedCategory : undefined,  // NEW: Category filter
-            topK: 5,
-            threshold: 40,
-          });
+          // Bounded: the static lookup is ready almost immediately, so a slow
+          // vector index shouldn't hold up the prompt
+          let timeoutId: ReturnType<typeof setTimeout> | undefined;
+          const vectorResults = await Promise.race([
+            searchLegalRules(`${user_input} ${jurisdiction}`, {
+              jurisdiction: jurisdiction !== 'Federal' ? jurisdiction : undefined,
+              category: detectedCategory !== 'General' ? detectedCategory : undefined,  // NEW: Category filter
+              topK: 5,
+              threshold: 40,
+            }),
+            new Promise<never>((_, reject) => {
+              timeoutId = setTimeout(
+                () => reject(new Error(`Vector search timed out after ${LEGAL_DATA.VECTOR_SEARCH_TIMEOUT_MS}ms`)),
+                LEGAL_DATA.VECTOR_SEARCH_TIMEOUT_MS
+              );
+            }),
+          ]).finally(() => clearTimeout(timeoutId));
 
           if (vectorResults.length > 0) {
-            let context = "RELEVANT LEGAL RULES (Vector Search Results):\n\n";
-            vectorResults.forEach((result, index) => {
-              context += `[Source ${index + 1}] ${result.metadata.rule_number} - ${result.metadata.title}\n`;
-              context += `  ${result.metadata.description}\n`;
-              context += `  Jurisdiction: ${result.metadata.jurisdiction}\n`;
-              context += `  Category: ${result.metadata.category}\n`;  // Show category in output
-              context += `  Similarity Score: ${Math.round(result.score)}%\n\n`;
-            });
-            safeLog(`Vector RAG: Found ${vectorResults.length} relevant rules (category filter: ${detectedCategory})`);
+            const sources = vectorResults.map((result, index) =>
+              `[Source ${index + 1}] ${result.metadata.rule_number} - ${result.metadata.title}\n` +
+              `  ${result.metadata.description}\n` +
+              `  Jurisdiction: ${result.metadata.jurisdiction}\n` +
+              `  Category: ${result.metadata.category}\n` +  // Show category in output
+              `  Similarity Score: ${Math.round(result.score)}%\n\n`
+            );
+            const context = `RELEVANT LEGAL RULES (Vector Search Results):\n\n${sources.join('')}`;
+            safeDebug(`Vector RAG: Found ${vectorResults.length} relevant rules (category filter: ${detectedCategory})`);
             return { researchContext: context, vectorResultsCount: vectorResults.length, source: 'vector' as const };
           }
         } catch (vectorError) {
@@ -418,7 +518,7 @@ export async function POST(req: NextRequest) {
         try {
           const staticResponse = await getLegalLookupResponse(`${user_input} ${jurisdiction}`);
           if (staticResponse) {
-            safeLog('Static grounding match found');
+            safeDebug('Static grounding match found');
             return { researchContext: `MANDATORY RESEARCH CONTEXT:\n${(staticResponse as { text: string }).text}\n`, found: true };
           }
         } catch (error) {
@@ -433,12 +533,10 @@ export async function POST(req: NextRequest) {
         try {
           const exParteRules = await searchExParteRules(jurisdiction);
           if (exParteRules.length > 0) {
-            let text = "EX PARTE NOTICE RULES FOR THIS JURISDICTION:\n";
-            exParteRules.forEach(rule => {
-              text += `- ${rule.courthouse}: Notice due by ${rule.notice_time}. Rule: ${rule.rule}\n`;
-            });
-            text += "\n";
-            return { exParteRulesText: text };
+            const lines = exParteRules.map(rule =>
+              `- ${rule.courthouse}: Notice due by ${rule.notice_time}. Rule: ${rule.rule}\n`
+            );
+            return { exParteRulesText: `EX PARTE NOTICE RULES FOR THIS JURISDICTION:\n${lines.join('')}\n` };
           }
         } catch (error) {
           safeWarn('Ex Parte rules search failed:', error);
@@ -448,15 +546,14 @@ export async function POST(req: NextRequest) {
 
       const templateMatchPromise = (async () => {
         try {
-          const templates = templateManifest.templates || [];
-          const { template: bestMatch } = findBestTemplate(user_input, templates);
+          const { template: bestMatch } = templateMatcher.findBestTemplate(user_input);
 
           if (bestMatch) {
             // Load template from filesystem (nodejs runtime)
             const templatePath = path.join(process.cwd(), 'public', bestMatch.templatePath);
             try {
-              const templateContent = await readFile(templatePath, 'utf8');
-              safeLog(`Using template: ${bestMatch.title}`);
+              const templateContent = await loadTemplateContent(templatePath);
+              safeDebug(`Using template: ${bestMatch.title}`);
               return { templateContent, templateName: bestMatch.title };
             } catch (fileError) {
               safeWarn(`Failed to load template from ${templatePath}:`, fileError);
@@ -473,138 +570,37 @@ export async function POST(req: NextRequest) {
         staticLookupPromise,
         exParteRulesPromise,
         templateMatchPromise,
+        initialCheckpointPromise,
       ]);
 
       let researchContext = '';
       if (vectorResult.source === 'vector' && vectorResult.researchContext) {
-        researchContext = vectorResult.researchContext;
+        researchContext = limitResearchContext(vectorResult.researchContext);
       } else if (staticResult.found && staticResult.researchContext) {
-        researchContext = staticResult.researchContext;
+        researchContext = limitResearchContext(staticResult.researchContext);
       }
 
       const exParteRulesText = exParteResult.exParteRulesText;
       const templateContent = templateResult.templateContent;
 
-      // Save checkpoint after research is complete
-      await saveCheckpoint(sessionId, {
+      // Save checkpoint after research is complete; awaited together with the
+      // GLM request so the Redis round-trips don't delay generation
+      const researchCheckpointPromise = saveCheckpoint(sessionId, {
         step: 'research',
         jurisdiction,
         accumulatedArgs: '',
         researchContext: researchContext.substring(0, 500), // Truncate for storage
       });
 
-      if (!SafetyValidator.redTeamAudit(user_input, jurisdiction)) {
-        return NextResponse.json(
-          { type: "SafetyViolation", detail: "Request blocked: Missing jurisdiction or potential safety violation." } satisfies StandardErrorResponse,
-          { status: 400 }
-        );
-      }
-
       let documentsText = "";
-      if (documents && documents.length > 0) {
-        documentsText = "RELEVANT DOCUMENTS FROM VIRTUAL CASE FOLDER (OCR-EXTRACTED EVIDENCE):\n\n";
-        documents.forEach((doc, index) => {
-          documentsText += `Document ${index + 1}: ${doc}\n\n`;
-        });
-        documentsText += "CRITICAL: These are official court documents. Use them to fact-check the user's description.\n\n";
+      const promptDocuments = documents ? prepareDocumentsForPrompt(documents) : [];
+      if (promptDocuments.length > 0) {
+        documentsText = "RELEVANT DOCUMENTS FROM VIRTUAL CASE FOLDER (OCR-EXTRACTED EVIDENCE):\n\n" +
+          promptDocuments.map((doc, index) => `Document ${index + 1}: ${doc}\n\n`).join('') +
+          "CRITICAL: These are official court documents. Use them to fact-check the user's description.\n\n";
       }
 
-      const legalAnalysisTool = {
-        type: 'function' as const,
-        function: {
-          name: 'generate_legal_analysis',
-          description: 'Generate comprehensive legal analysis and strategy for Pro Se litigants',
-          parameters: {
-            type: 'object',
-            properties: {
-              disclaimer: {
-                type: 'string',
-                description: 'Legal disclaimer stating this is information not advice'
-              },
-              strategy: {
-                type: 'string',
-                description: 'Primary legal strategy and analysis'
-              },
-              adversarial_strategy: {
-                type: 'string',
-                description: 'Detailed red-team analysis identifying weaknesses and how opposition will counter each point'
-              },
-              roadmap: {
-                type: 'array',
-                items: {
-                  type: 'object',
-                  properties: {
-                    step: { type: 'number', description: 'Step number' },
-                    title: { type: 'string', description: 'Step title' },
-                    description: { type: 'string', description: 'Detailed description' },
-                    estimated_time: { type: 'string', description: 'Timeframe for completion' },
-                    required_documents: { type: 'array', items: { type: 'string' }, description: 'Required documents' },
-                    counter_measure: { type: 'string', description: 'Expected opposition response and how to prepare' }
-                  },
-                  required: ['step', 'title', 'description']
-                }
-              },
-              filing_template: {
-                type: 'string',
-                description: 'Complete filing template with caption, motion body, and certificate of service'
-              },
-              citations: {
-                type: 'array',
-                description: 'Legal citations (minimum 3)',
-                items: {
-                  type: 'object',
-                  properties: {
-                    text: { type: 'string', description: 'Full citation string' },
-                    source: { type: 'string', description: 'Type of source (statute, case, rule)' },
-                    url: { type: 'string', description: 'URL to citation source' }
-                  },
-                  required: ['text']
-                }
-              },
-              local_logistics: {
-                type: 'object',
-                description: 'Courthouse information and local requirements',
-                properties: {
-                  courthouse_address: { type: 'string' },
-                  filing_fees: { type: 'string' },
-                  dress_code: { type: 'string' },
-                  parking_info: { type: 'string' },
-                  hours_of_operation: { type: 'string' },
-                  local_rules_url: { type: 'string' }
-                }
-              },
-              procedural_checks: {
-                type: 'array',
-                description: 'Procedural compliance checks',
-                items: { type: 'string' }
-              }
-            },
-            required: ['disclaimer', 'strategy', 'adversarial_strategy', 'roadmap', 'filing_template', 'citations', 'local_logistics', 'procedural_checks']
-          }
-        }
-      };
-
-      const tool_choice = {
-        type: 'function' as const,
-        function: {
-          name: 'generate_legal_analysis'
-        }
-      };
-
-      const systemPrompt = `You are LawSage, a Pro Se Architect AI helping self-represented litigants.
-
-IMPORTANT LIMITATIONS:
-- You do NOT have web search capabilities. Rely ONLY on the provided RESEARCH CONTEXT and your internal legal knowledge.
-- You do NOT support image analysis. All analysis is text-based.
-- For jurisdiction-specific questions, use the provided context and your training data for ${jurisdiction}.
-
-CRITICAL EVIDENCE HANDLING:
-You have been provided with OCR-extracted text from official documents in the 'documents' field.
-1. If the user's description conflicts with the OCR text (e.g., dates, case numbers, or facts), the OCR text is the source of truth.
-2. Explicitly reference documents using [Evidence X] notation in your strategy.
-3. Use the Case Number found in documents to populate the Filing Template.
-4. Cross-reference the user's claims against the extracted evidence to identify contradictions.
-5. If evidence documents exist, your adversarial_strategy should address how the opposition might use these documents.
+      const systemPrompt = `${ANALYSIS_SYSTEM_PROMPT_PREFIX}
 
 ${exParteRulesText}
 
@@ -692,7 +688,10 @@ CRITICAL INSTRUCTIONS:
               abortController.abort();
             }, timeoutMs);
 
-            const response = await fetch(GLM_API_URL, {
+            // Load the stream parser while waiting on GLM rather than after
+            const streamingParserPromise = import('../../../lib/streaming-json-parser');
+
+            const [response] = await Promise.all([fetch(GLM_API_URL, {
               method: 'POST',
               headers: {
                 'Content-Type': 'application/json',
@@ -704,14 +703,14 @@ CRITICAL INSTRUCTIONS:
                   { role: "system", content: systemPrompt },
                   { role: "user", content: userPrompt }
                 ],
-                tools: [legalAnalysisTool],
-                tool_choice: tool_choice,
+                tools: [LEGAL_ANALYSIS_TOOL],
+                tool_choice: LEGAL_ANALYSIS_TOOL_CHOICE,
                 temperature: 0.3, // Slightly higher for faster generation
                 max_tokens: 2000, // Reduced from 3500 to fit within timeout
                 stream: true
               }),
               signal: abortController.signal
-            });
+            }), researchCheckpointPromise]);
 
             clearTimeout(timeoutId);
 
@@ -739,6 +738,112 @@ CRITICAL INSTRUCTIONS:
             }
 
             const decoder = new TextDecoder();
+            const { parsePartialJSON } = await streamingParserPromise;
+            let lastProgressiveParseLength = 0;
+
+            // Citations are usually generated before local_logistics, so once
+            // that key streams in verification can run while the model finishes
+            // the remaining sections. The final check only looks up citations
+            // this early check didn't cover, so a different key order costs nothing.
+            let earlyCitationResults: Promise<LiveCitationVerification[]> | null = null;
+            let earlyCitationCheckStarted = false;
+
+            const startEarlyCitationCheck = (previousLength: number) => {
+              const searchFrom = Math.max(0, previousLength - CITATIONS_COMPLETE_MARKER.length);
+              if (accumulatedToolArgs.indexOf(CITATIONS_COMPLETE_MARKER, searchFrom) === -1) return;
+              earlyCitationCheckStarted = true;
+
+              const texts = (parsePartialJSON<LegalOutput>(accumulatedToolArgs)?.citations || [])
+                .map(c => c.text)
+                .filter(text => text?.trim());
+              if (texts.length === 0) return;
+
+              const results = import('../../../lib/shadow-citation-checker')
+                .then(({ verifyCitationsLive }) => verifyCitationsLive(texts, jurisdiction, req.nextUrl.origin));
+              // Awaited once the final citations are known; don't leave a rejection unhandled meanwhile
+              results.catch(() => undefined);
+              earlyCitationResults = results;
+            };
+
+            const handleDeltaText = (text: string) => {
+              const previousLength = accumulatedToolArgs.length;
+              accumulatedToolArgs += text;
+
+              if (!earlyCitationCheckStarted) {
+                startEarlyCitationCheck(previousLength);
+              }
+
+              if (!firstTokenReceived) {
+                firstTokenReceived = true;
+                controller.enqueue(encoder.encode(JSON.stringify({
+                  type: 'status',
+                  message: 'Generating legal analysis...'
+                }) + '\n'));
+              }
+
+              controller.enqueue(encoder.encode(JSON.stringify({
+                type: 'chunk',
+                content: text
+              }) + '\n'));
+
+              // PROGRESSIVE RENDERING: Try to parse and emit completed sections.
+              // Each attempt re-parses the whole buffer, so wait for another
+              // CHUNK_SIZE characters rather than parsing on every token.
+              if (accumulatedToolArgs.length - lastProgressiveParseLength < JSON_STREAM.CHUNK_SIZE) {
+                return;
+              }
+              lastProgressiveParseLength = accumulatedToolArgs.length;
+
+              try {
+                const partialOutput = parsePartialJSON<LegalOutput>(accumulatedToolArgs);
+
+                if (partialOutput) {
+                  const completedSections = Object.keys(partialOutput).filter(
+                    key => partialOutput[key as keyof LegalOutput] !== undefined
+                  );
+
+                  // Only emit if we have new complete sections
+                  if (completedSections.length > lastEmittedSectionCount) {
+                    controller.enqueue(encoder.encode(JSON.stringify({
+                      type: 'progressive',
+                      sections: completedSections,
+                      partial: partialOutput
+                    }) + '\n'));
+                    lastEmittedSectionCount = completedSections.length;
+                  }
+                }
+              } catch (progressiveError) {
+                // Silent fail - don't interrupt stream for progressive rendering
+                if (process.env.NODE_ENV === 'development') {
+                  safeWarn('Progressive parse error:', progressiveError);
+                }
+              }
+            };
+
+            const handleLine = (line: string, isFinal: boolean) => {
+              const trimmedLine = line.trim();
+              if (!trimmedLine.startsWith('data: ') || trimmedLine === 'data: [DONE]') return;
+
+              try {
+                const data: GLMStreamEvent = JSON.parse(trimmedLine.slice(6));
+
+                if (data.error) {
+                  safeError('GLM API error in stream:', data.error);
+                  throw new Error(typeof data.error === 'string' ? data.error : JSON.stringify(data.error));
+                }
+
+                const text = extractDeltaText(data);
+                if (text) {
+                  handleDeltaText(text);
+                }
+              } catch (parseError) {
+                if (isFinal) {
+                  safeWarn(`Failed to parse final GLM chunk`, parseError);
+                } else {
+                  safeWarn(`Failed to parse GLM chunk. Raw line: ${trimmedLine.substring(0, 100)}`, parseError);
+                }
+              }
+            };
 
             while (true) {
               const { done, value } = await reader.read();
@@ -751,105 +856,12 @@ CRITICAL INSTRUCTIONS:
               lineBuffer = lines.pop() || "";
 
               for (const line of lines) {
-                const trimmedLine = line.trim();
-                if (trimmedLine.startsWith('data: ') && trimmedLine !== 'data: [DONE]') {
-                  try {
-                    const data = JSON.parse(trimmedLine.slice(6));
-
-                    if (data.error) {
-                      safeError('GLM API error in stream:', data.error);
-                      throw new Error(typeof data.error === 'string' ? data.error : JSON.stringify(data.error));
-                    }
-
-                    const delta = data.choices?.[0]?.delta;
-
-                    if (delta?.tool_calls && delta.tool_calls.length > 0) {
-                      const toolCall = delta.tool_calls[0];
-
-                      if (toolCall.function?.arguments) {
-                        accumulatedToolArgs += toolCall.function.arguments;
-
-                        if (!firstTokenReceived) {
-                          firstTokenReceived = true;
-                          controller.enqueue(encoder.encode(JSON.stringify({
-                            type: 'status',
-                            message: 'Generating legal analysis...'
-                          }) + '\n'));
-                        }
-
-                        controller.enqueue(encoder.encode(JSON.stringify({
-                          type: 'chunk',
-                          content: toolCall.function.arguments
-                        }) + '\n'));
-
-                        // PROGRESSIVE RENDERING: Try to parse and emit completed sections
-                        try {
-                          const { parsePartialJSON } = await import('../../../lib/streaming-json-parser');
-                          const partialOutput = parsePartialJSON<LegalOutput>(accumulatedToolArgs);
-
-                          if (partialOutput) {
-                            const completedSections = Object.keys(partialOutput).filter(
-                              key => partialOutput[key as keyof LegalOutput] !== undefined
-                            );
-
-                            // Only emit if we have new complete sections
-                            if (completedSections.length > lastEmittedSectionCount) {
-                              controller.enqueue(encoder.encode(JSON.stringify({
-                                type: 'progressive',
-                                sections: completedSections,
-                                partial: partialOutput
-                              }) + '\n'));
-                              lastEmittedSectionCount = completedSections.length;
-                            }
-                          }
-                        } catch (progressiveError) {
-                          // Silent fail - don't interrupt stream for progressive rendering
-                          if (process.env.NODE_ENV === 'development') {
-                            safeWarn('Progressive parse error:', progressiveError);
-                          }
-                        }
-                      }
-                    }
-
-                    const content = delta?.content || "";
-                    if (content && !delta?.tool_calls) {
-                      accumulatedToolArgs += content;
-
-                      if (!firstTokenReceived) {
-                        firstTokenReceived = true;
-                        controller.enqueue(encoder.encode(JSON.stringify({
-                          type: 'status',
-                          message: 'Generating legal analysis...'
-                        }) + '\n'));
-                      }
-
-                      controller.enqueue(encoder.encode(JSON.stringify({
-                        type: 'chunk',
-                        content: content
-                      }) + '\n'));
-                    }
-                  } catch (parseError) {
-                    safeWarn(`Failed to parse GLM chunk. Raw line: ${trimmedLine.substring(0, 100)}`, parseError);
-                  }
-                }
+                handleLine(line, false);
               }
             }
 
             if (lineBuffer.trim()) {
-              const trimmedLine = lineBuffer.trim();
-              if (trimmedLine.startsWith('data: ') && trimmedLine !== 'data: [DONE]') {
-                try {
-                  const data = JSON.parse(trimmedLine.slice(6));
-                  const delta = data.choices?.[0]?.delta;
-                  if (delta?.tool_calls?.[0]?.function?.arguments) {
-                    accumulatedToolArgs += delta.tool_calls[0].function.arguments;
-                  } else if (delta?.content) {
-                    accumulatedToolArgs += delta.content;
-                  }
-                } catch (parseError) {
-                  safeWarn(`Failed to parse final GLM chunk`, parseError);
-                }
-              }
+              handleLine(lineBuffer, true);
             }
 
             if (!accumulatedToolArgs) {
@@ -857,16 +869,17 @@ CRITICAL INSTRUCTIONS:
             }
 
             let parsedOutput: LegalOutput | null = null;
+            // Only complete, schema-valid analyses whose citations all verified are worth caching
+            let cacheable = false;
 
             try {
-              console.log(`[GLM Response] Accumulated arguments length: ${accumulatedToolArgs.length}`);
+              safeDebug(`[GLM Response] Accumulated arguments length: ${accumulatedToolArgs.length}`);
 
               if (!accumulatedToolArgs.trim()) {
                 throw new Error('Empty response from GLM API');
               }
 
               // Parse the accumulated tool arguments as JSON
-              const { parsePartialJSON } = await import('../../../lib/streaming-json-parser');
               parsedOutput = parsePartialJSON<LegalOutput>(accumulatedToolArgs);
 
               if (!parsedOutput) {
@@ -874,6 +887,7 @@ CRITICAL INSTRUCTIONS:
               }
 
               const validation = validateLegalOutputStructure(parsedOutput);
+              cacheable = validation.valid;
 
               if (!validation.valid) {
                 safeError(`Validation failed:`, validation.errors);
@@ -895,35 +909,45 @@ CRITICAL INSTRUCTIONS:
 
               // HARD-GATE CITATION VERIFICATION
               const isStrictMode = CITATION_VERIFICATION.STRICT_MODE || process.env.CITATION_VERIFICATION_STRICT_MODE === 'true';
-              if (parsedOutput.citations && parsedOutput.citations.length > 0) {
+              // Blank citation entries have nothing to verify (and an empty string
+              // can't be redacted); with none left, skip the checker entirely
+              const citationIndexes = (parsedOutput.citations || [])
+                .map((c, index) => (c.text?.trim() ? index : -1))
+                .filter(index => index !== -1);
+              if (parsedOutput.citations && citationIndexes.length > 0) {
                 controller.enqueue(encoder.encode(JSON.stringify({
                   type: 'status',
                   message: 'Performing Hard-Gate Citation Verification...'
                 }) + '\n'));
 
-                const citationTexts = parsedOutput.citations.map(c => c.text);
+                const citations = parsedOutput.citations;
+                const citationTexts = citationIndexes.map(index => citations[index].text);
                 const baseUrl = req.nextUrl.origin;
-                
-                const verificationResults = await verifyCitationsLive(citationTexts, jurisdiction, baseUrl);
+
+                // Loaded on demand: only responses that cite authority need the checker.
+                // Citations the mid-stream check already verified are not looked up again.
+                const { verifyCitationsWithEarlyCheck } = await import('../../../lib/shadow-citation-checker');
+                const verificationResults: LiveCitationVerification[] = await verifyCitationsWithEarlyCheck(
+                  citationTexts,
+                  jurisdiction,
+                  baseUrl,
+                  earlyCitationResults
+                );
                 
                 let redactionCount = 0;
-                verificationResults.forEach((v, index) => {
+                const placeholders = new Map<string, string>();
+                verificationResults.forEach((v, resultIndex) => {
+                  const index = citationIndexes[resultIndex];
                   if (!v.is_verified) {
                     safeWarn(`Citation verification FAILED: ${v.citation}`);
+                    // A failed check may be a transient CourtListener or network
+                    // outage; don't replay it to identical requests for the whole TTL
+                    cacheable = false;
                     
                     if (isStrictMode && parsedOutput) {
                       redactionCount++;
                       const placeholder = `[Citation Removed: Verification Failed - ${v.citation}]`;
-                      
-                      // Redact from strategy
-                      if (parsedOutput.strategy) {
-                        parsedOutput.strategy = parsedOutput.strategy.split(v.citation).join(placeholder);
-                      }
-                      
-                      // Redact from filing template
-                      if (parsedOutput.filing_template) {
-                        parsedOutput.filing_template = parsedOutput.filing_template.split(v.citation).join(placeholder);
-                      }
+                      placeholders.set(v.citation, placeholder);
                       
                       // Mark in citations list
                       if (parsedOutput.citations && parsedOutput.citations[index]) {
@@ -934,6 +958,28 @@ CRITICAL INSTRUCTIONS:
                   }
                 });
 
+                // Redact from strategy and filing template in one pass per field.
+                // Longest citations first so one that contains another wins, and
+                // inserted placeholders are never rescanned.
+                if (placeholders.size > 0) {
+                  const citationPattern = new RegExp(
+                    Array.from(placeholders.keys())
+                      .sort((a, b) => b.length - a.length)
+                      .map(escapeRegExp)
+                      .join('|'),
+                    'g'
+                  );
+                  const redact = (text: string) =>
+                    text.replace(citationPattern, match => placeholders.get(match) ?? match);
+
+                  if (parsedOutput.strategy) {
+                    parsedOutput.strategy = redact(parsedOutput.strategy);
+                  }
+                  if (parsedOutput.filing_template) {
+                    parsedOutput.filing_template = redact(parsedOutput.filing_template);
+                  }
+                }
+
                 if (redactionCount > 0) {
                   safeLog(`Hard-Gate: Redacted ${redactionCount} unverified citations.`);
                   parsedOutput.disclaimer = (parsedOutput.disclaimer || "") + `\n\nWARNING: ${redactionCount} citation(s) were removed because they could not be verified in official legal databases. Manual verification is required.`;
@@ -942,6 +988,7 @@ CRITICAL INSTRUCTIONS:
 
             } catch (parseError) {
               safeError("Failed to parse JSON:", parseError);
+              cacheable = false;
               parsedOutput = {
                 disclaimer: "LEGAL DISCLAIMER: I am an AI helping you represent yourself Pro Se. This is legal information, not legal advice. Always consult with a qualified attorney.",
                 strategy: "Unable to generate analysis. The AI service returned malformed data.",
@@ -954,17 +1001,27 @@ CRITICAL INSTRUCTIONS:
               };
             }
 
-            const sources = parsedOutput.citations?.map((c: { text: string; url?: string }) =>
-              ({ title: c.text, uri: c.url })
-            ) || [];
+            // One source per link (or per title when there is no link)
+            const uniqueSources = new Map<string, { title: string; uri?: string }>();
+            for (const c of parsedOutput.citations || []) {
+              const key = c.url || c.text;
+              if (!uniqueSources.has(key)) {
+                uniqueSources.set(key, { title: c.text, uri: c.url });
+              }
+            }
+            const sources = Array.from(uniqueSources.values());
+
+            const result = {
+              text: JSON.stringify(parsedOutput),
+              sources
+            };
 
             controller.enqueue(encoder.encode(JSON.stringify({
               type: 'complete',
-              result: {
-                text: JSON.stringify(parsedOutput),
-                sources
-              }
+              result
             }) + '\n'));
+
+            await setCachedAnalysis(cacheKey, result, cacheable);
           } catch (e) {
             safeError("AI processing error:", e);
             controller.enqueue(encoder.encode(JSON.stringify({
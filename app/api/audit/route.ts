@@ -75,11 +75,19 @@ export async function POST(req: NextRequest) {
 
     safeLog(`[Audit API] Starting independent audit for ${jurisdiction} (stateId: ${stateId || 'unknown'})`);
 
-    // Load jurisdiction rules for enhanced verification
+    // Load jurisdiction rules (static file or vector fallback) while the
+    // critique loop runs - the "Judge" agent doesn't depend on the rules
     // Pass researchContext as userInput for vector search fallback
-    const rules = await loadJurisdictionRules(jurisdiction, { 
-      userInput: researchContext || analysis.substring(0, 500) 
-    });
+    const [rules, critiqueResult] = await Promise.all([
+      loadJurisdictionRules(jurisdiction, {
+        userInput: researchContext || analysis.substring(0, 500)
+      }),
+      runCritiqueLoop(analysis, {
+        jurisdiction,
+        researchContext: researchContext || '',
+        maxRetries: 1
+      }),
+    ]);
 
     // SHADOW CITATION CHECK: Server-side verification before streaming
     safeLog('[Audit API] Running shadow citation check...');
@@ -93,13 +101,6 @@ export async function POST(req: NextRequest) {
     const citationReport = generateCitationReport(citationCheckResult);
     safeLog(`[Audit API] Citation check: ${citationReport.summary}, status=${citationReport.status}`);
 
-    // Run the critique loop (the "Judge" agent)
-    const critiqueResult = await runCritiqueLoop(analysis, {
-      jurisdiction,
-      researchContext: researchContext || '',
-      maxRetries: 1
-    });
-
     // If critique failed with low confidence, attempt correction
     let correctedOutput: string | undefined;
     if (!critiqueResult.isValid && critiqueResult.overallConfidence < 0.6) {
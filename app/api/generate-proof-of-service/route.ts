@@ -193,19 +193,20 @@ function drawProofOfServiceCaption(doc: PDFDocument, caseInfo: CaseInfo, formTyp
   return yPosition + 30;
 }
 
+const FORM_TITLES: Record<string, string> = {
+  'POS-040': 'PROOF OF SERVICE BY MAIL',
+  'FL-335': 'PROOF OF SERVICE BY MAIL (FAMILY LAW)',
+  'FL-330': 'PROOF OF PERSONAL SERVICE (FAMILY LAW)',
+  'MC-030': 'PROOF OF SERVICE',
+  'AO-006': 'SUMMONS - PROOF OF SERVICE',
+  'GENERIC': 'PROOF OF SERVICE',
+};
+
 /**
  * Get form title based on form type
  */
 function getFormTitle(formType: string): string {
-  const titles: Record<string, string> = {
-    'POS-040': 'PROOF OF SERVICE BY MAIL',
-    'FL-335': 'PROOF OF SERVICE BY MAIL (FAMILY LAW)',
-    'FL-330': 'PROOF OF PERSONAL SERVICE (FAMILY LAW)',
-    'MC-030': 'PROOF OF SERVICE',
-    'AO-006': 'SUMMONS - PROOF OF SERVICE',
-    'GENERIC': 'PROOF OF SERVICE',
-  };
-  return titles[formType] || 'PROOF OF SERVICE';
+  return FORM_TITLES[formType] || 'PROOF OF SERVICE';
 }
 
 /**
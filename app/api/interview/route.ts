@@ -1,5 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { safeLog, safeError } from '../../../lib/pii-redactor';
+import { getMessageContent } from '../../../lib/glm';
+import { API } from '../../../config/constants';
 
 interface InterviewRequest {
   user_input: string;
@@ -36,17 +38,44 @@ GUIDELINES:
 4. Be empathetic but thorough
 5. If the user already provided information, don't ask redundant questions
 
-Return your response as a JSON array of questions with this structure:
-[
-  {
-    "id": "unique_question_id",
-    "question": "Clear, specific question",
-    "category": "facts|procedure|evidence|timeline|parties",
-    "required": true,
-    "hint": "Optional helpful context",
-    "placeholder": "Example answer format"
+Return your response as a JSON object with this structure:
+{
+  "questions": [
+    {
+      "id": "unique_question_id",
+      "question": "Clear, specific question",
+      "category": "facts|procedure|evidence|timeline|parties",
+      "required": true,
+      "hint": "Optional helpful context",
+      "placeholder": "Example answer format"
+    }
+  ]
+}`;
+
+/**
+ * Inputs shorter than this give the model nothing to build targeted questions
+ * from, so the static question set is returned without an API round-trip
+ */
+const MIN_INPUT_LENGTH_FOR_AI = 40;
+
+/**
+ * Inputs with fewer words than this always get follow-up questions
+ */
+const FOLLOW_UP_WORD_THRESHOLD = 50;
+
+/**
+ * Whether `text` splits into fewer than `limit` space-separated words.
+ * Counts separators and stops at the limit instead of allocating the split.
+ */
+function hasFewerWordsThan(text: string, limit: number): boolean {
+  let words = 1;
+  let index = text.indexOf(' ');
+  while (index !== -1) {
+    if (++words >= limit) return false;
+    index = text.indexOf(' ', index + 1);
   }
-]`;
+  return words < limit;
+}
 
 export async function POST(req: NextRequest) {
   try {
@@ -70,6 +99,15 @@ export async function POST(req: NextRequest) {
       });
     }
 
+    if (user_input.trim().length < MIN_INPUT_LENGTH_FOR_AI && Object.keys(existing_answers).length === 0) {
+      safeLog('Input too short for targeted questions - using static question generation');
+      return NextResponse.json({
+        questions: generateStaticQuestions(user_input, jurisdiction),
+        follow_up_needed: true,
+        confidence_score: 50,
+      });
+    }
+
     // Build context from existing answers
     const existingContext = Object.entries(existing_answers)
       .map(([key, value]) => `- ${key}: ${value}`)
@@ -92,11 +130,13 @@ Generate clarifying questions. Focus on gaps in the information provided. If the
         'Authorization': `Bearer ${apiKey}`,
       },
       body: JSON.stringify({
-        model: 'glm-4.7-flash',
+        model: API.GLM_FAST_MODEL,
         messages: [
           { role: 'system', content: SYSTEM_PROMPT },
           { role: 'user', content: prompt },
         ],
+        // Request structured JSON output
+        response_format: { type: 'json_object' },
         temperature: 0.3,
         max_tokens: 1000,
       }),
@@ -107,17 +147,17 @@ Generate clarifying questions. Focus on gaps in the information provided. If the
     }
 
     const data = await response.json();
-    const content = data.choices?.[0]?.message?.content || '[]';
-
-    // Extract JSON from response
-    const jsonMatch = content.match(/\[[\s\S]*\]/);
-    const jsonString = jsonMatch ? jsonMatch[0] : '[]';
+    const content = getMessageContent(data) || '{}';
 
     let questions: InterviewQuestion[];
     try {
-      questions = JSON.parse(jsonString);
-    } catch {
-      // Fallback to static questions
+      const parsed: { questions?: unknown } = JSON.parse(content);
+      questions = Array.isArray(parsed.questions)
+        ? parsed.questions
+        : generateStaticQuestions(user_input, jurisdiction);
+    } catch (parseError) {
+      // Truncated output can still fail to parse; fall back to static questions
+      safeError('Failed to parse interview questions JSON:', parseError);
       questions = generateStaticQuestions(user_input, jurisdiction);
     }
 
@@ -134,7 +174,7 @@ Generate clarifying questions. Focus on gaps in the information provided. If the
       }));
 
     // Determine if follow-up is needed based on input complexity
-    const followUpNeeded = user_input.split(' ').length < 50 || validatedQuestions.length > 0;
+    const followUpNeeded = hasFewerWordsThan(user_input, FOLLOW_UP_WORD_THRESHOLD) || validatedQuestions.length > 0;
     const confidenceScore = validatedQuestions.length > 0 ? 70 : 40;
 
     safeLog(`Generated ${validatedQuestions.length} interview questions`);
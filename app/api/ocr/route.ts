@@ -4,6 +4,7 @@ import { validateOCRResult } from '../../../lib/schemas/legal-output';
 import { calculateLegalDeadline, Jurisdiction } from '../../../src/utils/legal-calendar';
 import crypto from 'crypto';
 import { redis, KEY_PREFIX } from '../../../lib/redis';
+import { getMessageContent } from '../../../lib/glm';
 
 interface StandardErrorResponse {
   type: string;
@@ -142,7 +143,7 @@ If any field cannot be found, omit it or use an empty array. Return ONLY valid J
     }
 
     const data = await response.json();
-    const rawContent = data.choices?.[0]?.message?.content;
+    const rawContent = getMessageContent(data);
 
     if (!rawContent) {
       safeError('GLM OCR returned empty content');
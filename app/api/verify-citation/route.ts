@@ -1,9 +1,13 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { safeLog, safeError, safeWarn } from '../../../lib/pii-redactor';
 import { CITATION_VERIFICATION, API } from '../../../config/constants';
+import { getMessageContent } from '../../../lib/glm';
+import { getCitationCacheKey, getCachedCitationLookup, setCachedCitationLookup } from '../../../lib/citation-lookup-cache';
+import { mapWithConcurrency } from '../../../lib/concurrency';
 
 interface VerifyCitationRequest {
-  citation: string;
+  citation?: string;
+  citations?: string[]; // Batch form; response is { results: [...] } in input order
   jurisdiction: string;
   subject_matter?: string;
   strict_mode?: boolean; // If true, never fall back to AI verification
@@ -24,6 +28,10 @@ interface VerifyCitationResponse {
 
 const COURT_LISTENER_API = API.COURT_LISTENER_BASE;
 
+// Statute-shaped citations (section symbol, U.S.C., "Stat."/"Code") usually
+// need both statute lookups once case law misses, so those start together
+const STATUTE_SHAPE_PATTERN = /§|U\.?S\.?C\.?|\bStat\.|\bCode\b/i;
+
 /**
  * Search CourtListener API for case citations
  * Uses the Free Law Project's RECAP database
@@ -127,18 +135,18 @@ async function searchFederalStatute(citation: string): Promise<{ found: boolean;
   }
 }
 
+// Map common jurisdiction names to state codes
+const STATE_CODES: Record<string, string> = {
+  'california': 'CA', 'new york': 'NY', 'texas': 'TX', 'florida': 'FL',
+  'illinois': 'IL', 'pennsylvania': 'PA', 'ohio': 'OH', 'georgia': 'GA'
+};
+
 /**
  * Search for state statutes via CourtListener
  */
 async function searchStateStatute(citation: string, jurisdiction: string): Promise<{ found: boolean; data?: Record<string, unknown> }> {
   try {
-    // Map common jurisdiction names to state codes
-    const stateCodeMap: Record<string, string> = {
-      'california': 'CA', 'new york': 'NY', 'texas': 'TX', 'florida': 'FL',
-      'illinois': 'IL', 'pennsylvania': 'PA', 'ohio': 'OH', 'georgia': 'GA'
-    };
-
-    const stateCode = stateCodeMap[jurisdiction.toLowerCase()] || jurisdiction.substring(0, 2).toUpperCase();
+    const stateCode = STATE_CODES[jurisdiction.toLowerCase()] || jurisdiction.substring(0, 2).toUpperCase();
 
     // Search for state statute citations
     const searchUrl = `${COURT_LISTENER_API}/search/?q=${encodeURIComponent(`${citation} ${stateCode}`)}&type=o`;
@@ -175,13 +183,20 @@ async function searchStateStatute(citation: string, jurisdiction: string): Promi
 /**
  * Fallback to GLM-based verification when CourtListener fails
  * WARNING: This is AI-based verification only - not database lookup
+ *
+ * Every citation goes into one prompt and one response, so a batch with
+ * several database misses costs a single GLM round-trip. Results are
+ * returned in input order.
  */
-async function verifyWithGLM(citation: string, jurisdiction: string, subject_matter: string, apiKey: string): Promise<VerifyCitationResponse> {
-  const prompt = `You are a legal citation verification expert. Your task is to verify if the following legal citation is:
+async function verifyWithGLM(citations: string[], jurisdiction: string, subject_matter: string, apiKey: string): Promise<VerifyCitationResponse[]> {
+  const citationList = citations.map((citation, index) => `${index + 1}. "${citation}"`).join('\n');
+
+  const prompt = `You are a legal citation verification expert. Your task is to verify if each of the following legal citations is:
 1. VALID: Actually exists as a real law, regulation, or case
 2. RELEVANT: Pertains to the jurisdiction and subject matter specified
 
-Citation to verify: "${citation}"
+Citations to verify:
+${citationList}
 Jurisdiction: ${jurisdiction}
 Subject Matter: ${subject_matter || 'General legal matters'}
 
@@ -192,13 +207,17 @@ Base your assessment on:
 - Known patterns for this jurisdiction's citation format
 - Consistency with legal citation conventions (Bluebook/California Style Manual)
 
-Return a JSON object with:
+Return a JSON object with a "results" array holding one entry per citation, in the order listed above:
 {
-  "is_verified": false,
-  "is_relevant": boolean - true if the citation appears relevant to the jurisdiction/subject
-  "verification_source": "AI Analysis (GLM) - NOT DATABASE VERIFIED",
-  "status_message": "AI format analysis only - citation NOT verified in legal database",
-  "details": string - explain format analysis and emphasize this is NOT database verification
+  "results": [
+    {
+      "is_verified": false,
+      "is_relevant": boolean - true if the citation appears relevant to the jurisdiction/subject
+      "verification_source": "AI Analysis (GLM) - NOT DATABASE VERIFIED",
+      "status_message": "AI format analysis only - citation NOT verified in legal database",
+      "details": string - briefly explain format analysis and emphasize this is NOT database verification
+    }
+  ]
 }
 
 IMPORTANT: Set is_verified to FALSE. You cannot verify citations without database access.
@@ -206,6 +225,17 @@ Only comment on format validity and relevance. Always note this is AI-based, not
 
   const systemPrompt = `You are a legal citation verification expert. You must respond with ONLY a valid JSON object. Do not include markdown formatting. ALWAYS set is_verified to false - you cannot verify citations without database access.`;
 
+  const errorResponse = (details: string): VerifyCitationResponse => ({
+    is_verified: false,
+    is_relevant: false,
+    verification_source: 'Error',
+    status_message: 'AI verification unavailable',
+    details,
+    unverified_reason: 'DATABASE_UNAVAILABLE',
+    confidence_score: 40,  // Same score as any AI format analysis result
+    confidence_level: 'LOW',
+  });
+
   try {
     const response = await fetch(API.GLM_BASE_URL + '/chat/completions', {
       method: 'POST',
@@ -214,13 +244,15 @@ Only comment on format validity and relevance. Always note this is AI-based, not
         'Authorization': `Bearer ${apiKey}`
       },
       body: JSON.stringify({
-        model: API.GLM_MODEL,
+        model: API.GLM_FAST_MODEL,
         messages: [
           { role: "system", content: systemPrompt },
           { role: "user", content: prompt }
         ],
+        // Request structured JSON output
+        response_format: { type: "json_object" },
         temperature: API.GLM_TEMPERATURE,
-        max_tokens: API.GLM_MAX_TOKENS
+        max_tokens: Math.max(API.GLM_MAX_TOKENS, citations.length * CITATION_VERIFICATION.AI_ANALYSIS_TOKENS_PER_CITATION)
       })
     });
 
@@ -229,31 +261,242 @@ Only comment on format validity and relevance. Always note this is AI-based, not
     }
 
     const data = await response.json();
-    const responseText = data.choices?.[0]?.message?.content || '{}';
+    const responseText = getMessageContent(data) || '{}';
 
-    const jsonMatch = responseText.match(/\{[\s\S]*\}/);
-    const jsonString = jsonMatch ? jsonMatch[0] : responseText;
+    const parsed: { results?: unknown } = JSON.parse(responseText);
+    const results = Array.isArray(parsed.results) ? parsed.results : [];
 
-    const result = JSON.parse(jsonString);
-    
-    // Force is_verified to false - AI cannot verify citations
-    result.is_verified = false;
-    result.unverified_reason = 'AI_DISABLED';
-    result.confidence_score = 40;  // AI format analysis only
-    result.confidence_level = 'LOW';
+    return citations.map((_, index): VerifyCitationResponse => {
+      const result = results[index];
+      if (!result || typeof result !== 'object') {
+        return errorResponse('AI analysis returned no result for this citation');
+      }
 
-    return result;
+      // Force is_verified to false - AI cannot verify citations
+      return {
+        ...(result as VerifyCitationResponse),
+        is_verified: false,
+        unverified_reason: 'AI_DISABLED',
+        confidence_score: 40,  // AI format check only - significant hallucination risk
+        confidence_level: 'LOW',
+      };
+    });
   } catch (error) {
     safeError('GLM verification error:', error);
+    return citations.map(() => errorResponse(error instanceof Error ? error.message : 'Unknown error'));
+  }
+}
+
+/**
+ * Look a citation up in the legal databases, reusing earlier hits for the
+ * same citation and jurisdiction. Returns null when no database has it.
+ */
+async function lookupCitation(
+  citation: string,
+  jurisdiction: string
+): Promise<VerifyCitationResponse | null> {
+  const cacheKey = getCitationCacheKey(citation, jurisdiction);
+  const cached = await getCachedCitationLookup<VerifyCitationResponse>(cacheKey);
+  if (cached) {
+    safeLog(`Citation verified from lookup cache: ${citation}`);
+    return cached;
+  }
+
+  const result = await searchCitationDatabases(citation, jurisdiction);
+  if (result) {
+    await setCachedCitationLookup(cacheKey, result);
+  }
+  return result;
+}
+
+/**
+ * Search the legal databases: CourtListener case law, then federal and
+ * state statutes. Returns null when no database has the citation.
+ */
+async function searchCitationDatabases(
+  citation: string,
+  jurisdiction: string
+): Promise<VerifyCitationResponse | null> {
+  // STEP 1: Try CourtListener for case law
+  const caseLawResult = await searchCourtListener(citation);
+
+  if (caseLawResult.found && caseLawResult.data) {
+    safeLog(`Citation verified via CourtListener: ${citation}`);
+
+    const response: VerifyCitationResponse = {
+      is_verified: true,
+      is_relevant: true,
+      verification_source: 'CourtListener (Free Law Project)',
+      status_message: 'Citation found in legal database',
+      details: `Case: ${caseLawResult.data.caseName || 'Unknown'} | Court: ${caseLawResult.data.court || 'Unknown'}`,
+      courtlistener_data: caseLawResult.data,
+      confidence_score: 100,  // Database-verified = 100% confidence
+      confidence_level: 'HIGH',
+      deep_link: caseLawResult.data.url || undefined,
+    };
+
+    return response;
+  }
+
+  // Only after a case-law miss: for statute-shaped citations run the federal
+  // and state lookups together, keeping the same precedence when picking a result
+  const statuteLookups = STATUTE_SHAPE_PATTERN.test(citation)
+    ? [searchFederalStatute(citation), searchStateStatute(citation, jurisdiction)] as const
+    : null;
+
+  // STEP 2: Try federal statute search
+  const federalStatuteResult = await (statuteLookups?.[0] ?? searchFederalStatute(citation));
+
+  if (federalStatuteResult.found && federalStatuteResult.data) {
+    safeLog(`Federal statute verified via CourtListener: ${citation}`);
+
+    const response: VerifyCitationResponse = {
+      is_verified: true,
+      is_relevant: true,
+      verification_source: 'CourtListener (Free Law Project)',
+      status_message: 'Federal statute found with citing cases',
+      details: `${federalStatuteResult.data.casesCiting} cases cite this statute`,
+      courtlistener_data: federalStatuteResult.data,
+      confidence_score: 95,  // Statute with citing cases = very high confidence
+      confidence_level: 'HIGH',
+      deep_link: (federalStatuteResult.data as { searchUrl?: string }).searchUrl || undefined,
+    };
+
+    return response;
+  }
+
+  // STEP 3: Try state statute search
+  const stateStatuteResult = await (statuteLookups?.[1] ?? searchStateStatute(citation, jurisdiction));
+
+  if (stateStatuteResult.found && stateStatuteResult.data) {
+    safeLog(`State statute verified via CourtListener: ${citation}`);
+
+    const response: VerifyCitationResponse = {
+      is_verified: true,
+      is_relevant: true,
+      verification_source: 'CourtListener (Free Law Project)',
+      status_message: 'State statute found with citing cases',
+      details: `${stateStatuteResult.data.casesCiting} cases cite this statute`,
+      courtlistener_data: stateStatuteResult.data,
+      confidence_score: 90,  // State statute = high confidence but less than federal
+      confidence_level: 'HIGH',
+      deep_link: (stateStatuteResult.data as { searchUrl?: string }).searchUrl || undefined,
+    };
+
+    return response;
+  }
+
+  // STEP 4: CourtListener found nothing
+  safeWarn(`CourtListener could not verify: ${citation}`);
+  return null;
+}
+
+/**
+ * Result for a citation no database found, when AI format analysis isn't
+ * allowed (strict mode) or isn't available (no API key)
+ */
+function notFoundResponse(citation: string, isStrictMode: boolean): VerifyCitationResponse {
+  // STRICT MODE: Never fall back to AI verification
+  if (isStrictMode) {
+    safeLog(`Strict mode enabled - returning UNVERIFIED for: ${citation}`);
+
     return {
       is_verified: false,
       is_relevant: false,
-      verification_source: 'Error',
-      status_message: 'AI verification unavailable',
-      details: error instanceof Error ? error.message : 'Unknown error',
-      unverified_reason: 'DATABASE_UNAVAILABLE',
+      verification_source: 'CourtListener (Not Found)',
+      status_message: 'UNVERIFIED - Database Unavailable',
+      details: 'This citation was not found in the CourtListener legal database. In Strict Mode, AI-based verification is disabled to prevent hallucination. Manual verification through official sources is required.',
+      unverified_reason: 'STRICT_MODE',
+      confidence_score: 0,
+      confidence_level: 'UNVERIFIED',
     };
   }
+
+  // No API key - return unverified with CourtListener result
+  return {
+    is_verified: false,
+    is_relevant: false,
+    verification_source: 'CourtListener (Not Found)',
+    status_message: 'Citation not found in legal database',
+    details: 'This citation was not found in the CourtListener database. It may be invalid, obscure, or require manual verification through official sources.',
+    unverified_reason: 'NOT_FOUND',
+    confidence_score: 10,  // Very low - not in database
+    confidence_level: 'LOW',
+  };
+}
+
+/**
+ * Run the verification chain for each citation: CourtListener case law, then
+ * federal and state statutes, then (standard mode only) AI format analysis.
+ * Database lookups run through a small concurrent pool; one failing lookup
+ * doesn't fail the batch. Citations no database found share a single AI
+ * format analysis call. Single-citation requests use this path too.
+ */
+async function verifyCitationBatch(
+  citations: string[],
+  jurisdiction: string,
+  subject_matter: string | undefined,
+  isStrictMode: boolean
+): Promise<Array<VerifyCitationResponse & { citation: string }>> {
+  const apiKey = process.env.GLM_API_KEY;
+  const needsAIAnalysis: number[] = [];
+
+  const results = await mapWithConcurrency(
+    citations,
+    CITATION_VERIFICATION.MAX_CONCURRENT_LOOKUPS,
+    async (citation, index): Promise<VerifyCitationResponse & { citation: string }> => {
+      if (!citation.trim()) {
+        return {
+          citation,
+          is_verified: false,
+          is_relevant: false,
+          verification_source: 'None',
+          status_message: 'UNVERIFIED - Empty citation',
+          unverified_reason: 'NOT_FOUND',
+          confidence_score: 0,
+          confidence_level: 'UNVERIFIED',
+        };
+      }
+      try {
+        safeLog(`Verifying citation: ${citation} for ${jurisdiction} (strict_mode: ${isStrictMode})`);
+        const databaseResult = await lookupCitation(citation, jurisdiction);
+        if (databaseResult) {
+          return { citation, ...databaseResult };
+        }
+        if (isStrictMode || !apiKey) {
+          return { citation, ...notFoundResponse(citation, isStrictMode) };
+        }
+        // Placeholder until the shared AI format analysis below fills it in
+        needsAIAnalysis.push(index);
+        return { citation, ...notFoundResponse(citation, false) };
+      } catch (error) {
+        safeError(`Error verifying citation ${citation}:`, error);
+        return {
+          citation,
+          is_verified: false,
+          is_relevant: false,
+          verification_source: 'Error',
+          status_message: 'UNVERIFIED - Verification Service Unavailable',
+          details: error instanceof Error ? error.message : 'Unknown error occurred',
+          unverified_reason: 'DATABASE_UNAVAILABLE',
+          confidence_score: 0,
+          confidence_level: 'UNVERIFIED',
+        };
+      }
+    }
+  );
+
+  if (needsAIAnalysis.length > 0 && apiKey) {
+    // STANDARD MODE: one AI format analysis (NOT verification) for every miss
+    const missed = needsAIAnalysis.map(index => citations[index]);
+    safeWarn(`Using AI format analysis (NOT verification) for ${missed.length} citation(s)`);
+    const glmResults = await verifyWithGLM(missed, jurisdiction, subject_matter || '', apiKey);
+    needsAIAnalysis.forEach((index, i) => {
+      results[index] = { citation: citations[index], ...glmResults[i] };
+    });
+  }
+
+  return results;
 }
 
 /**
@@ -266,13 +509,13 @@ Only comment on format validity and relevance. Always note this is AI-based, not
 export async function POST(req: NextRequest) {
   try {
     const body = await req.json() as VerifyCitationRequest;
-    const { citation, jurisdiction, subject_matter, strict_mode } = body;
+    const { citation, citations, jurisdiction, subject_matter, strict_mode } = body;
 
-    if (!citation || !jurisdiction) {
+    if ((!citation && !Array.isArray(citations)) || !jurisdiction) {
       return NextResponse.json(
         {
           error: 'Missing required fields',
-          detail: 'citation and jurisdiction are required',
+          detail: 'citation (or citations) and jurisdiction are required',
         },
         { status: 400 }
       );
@@ -281,123 +524,29 @@ export async function POST(req: NextRequest) {
     // Determine if strict mode is enabled (explicit or via env var)
     const isStrictMode = strict_mode || CITATION_VERIFICATION.STRICT_MODE || process.env.CITATION_VERIFICATION_STRICT_MODE === 'true';
 
-    safeLog(`Verifying citation: ${citation} for ${jurisdiction} (strict_mode: ${isStrictMode})`);
-
-    // STEP 1: Try CourtListener for case law
-    const caseLawResult = await searchCourtListener(citation);
-
-    if (caseLawResult.found && caseLawResult.data) {
-      safeLog(`Citation verified via CourtListener: ${citation}`);
-
-      const response: VerifyCitationResponse = {
-        is_verified: true,
-        is_relevant: true,
-        verification_source: 'CourtListener (Free Law Project)',
-        status_message: 'Citation found in legal database',
-        details: `Case: ${caseLawResult.data.caseName || 'Unknown'} | Court: ${caseLawResult.data.court || 'Unknown'}`,
-        courtlistener_data: caseLawResult.data,
-        confidence_score: 100,  // Database-verified = 100% confidence
-        confidence_level: 'HIGH',
-        deep_link: caseLawResult.data.url || undefined,
-      };
-
-      return NextResponse.json(response);
-    }
-
-    // STEP 2: Try federal statute search
-    const federalStatuteResult = await searchFederalStatute(citation);
-
-    if (federalStatuteResult.found && federalStatuteResult.data) {
-      safeLog(`Federal statute verified via CourtListener: ${citation}`);
-
-      const response: VerifyCitationResponse = {
-        is_verified: true,
-        is_relevant: true,
-        verification_source: 'CourtListener (Free Law Project)',
-        status_message: 'Federal statute found with citing cases',
-        details: `${federalStatuteResult.data.casesCiting} cases cite this statute`,
-        courtlistener_data: federalStatuteResult.data,
-        confidence_score: 95,  // Statute with citing cases = very high confidence
-        confidence_level: 'HIGH',
-        deep_link: (federalStatuteResult.data as { searchUrl?: string }).searchUrl || undefined,
-      };
-
-      return NextResponse.json(response);
-    }
-
-    // STEP 3: Try state statute search
-    const stateStatuteResult = await searchStateStatute(citation, jurisdiction);
-
-    if (stateStatuteResult.found && stateStatuteResult.data) {
-      safeLog(`State statute verified via CourtListener: ${citation}`);
-
-      const response: VerifyCitationResponse = {
-        is_verified: true,
-        is_relevant: true,
-        verification_source: 'CourtListener (Free Law Project)',
-        status_message: 'State statute found with citing cases',
-        details: `${stateStatuteResult.data.casesCiting} cases cite this statute`,
-        courtlistener_data: stateStatuteResult.data,
-        confidence_score: 90,  // State statute = high confidence but less than federal
-        confidence_level: 'HIGH',
-        deep_link: (stateStatuteResult.data as { searchUrl?: string }).searchUrl || undefined,
-      };
-
-      return NextResponse.json(response);
-    }
-
-    // STEP 4: CourtListener found nothing
-    safeWarn(`CourtListener could not verify: ${citation}`);
-
-    // STRICT MODE: Never fall back to AI verification
-    if (isStrictMode) {
-      safeLog(`Strict mode enabled - returning UNVERIFIED for: ${citation}`);
-
-      const response: VerifyCitationResponse = {
-        is_verified: false,
-        is_relevant: false,
-        verification_source: 'CourtListener (Not Found)',
-        status_message: 'UNVERIFIED - Database Unavailable',
-        details: 'This citation was not found in the CourtListener legal database. In Strict Mode, AI-based verification is disabled to prevent hallucination. Manual verification through official sources is required.',
-        unverified_reason: 'STRICT_MODE',
-        confidence_score: 0,
-        confidence_level: 'UNVERIFIED',
-      };
-
-      return NextResponse.json(response);
-    }
-
-    // STANDARD MODE: Offer AI format analysis only (NOT verification)
-    const apiKey = process.env.GLM_API_KEY;
-
-    if (!apiKey) {
-      // No API key - return unverified with CourtListener result
-      const response: VerifyCitationResponse = {
-        is_verified: false,
-        is_relevant: false,
-        verification_source: 'CourtListener (Not Found)',
-        status_message: 'Citation not found in legal database',
-        details: 'This citation was not found in the CourtListener database. It may be invalid, obscure, or require manual verification through official sources.',
-        unverified_reason: 'NOT_FOUND',
-        confidence_score: 10,  // Very low - not in database
-        confidence_level: 'LOW',
-      };
+    // Batch form: one request verifies every citation of a hard-gate pass
+    if (Array.isArray(citations)) {
+      if (citations.length > CITATION_VERIFICATION.MAX_BATCH_SIZE) {
+        return NextResponse.json(
+          {
+            error: 'Batch too large',
+            detail: `At most ${CITATION_VERIFICATION.MAX_BATCH_SIZE} citations can be verified per request`,
+          },
+          { status: 400 }
+        );
+      }
 
-      return NextResponse.json(response);
+      // Results stay aligned with the request, so malformed entries are kept
+      // (and reported unverified) rather than dropped
+      const batch = citations.map(c => (typeof c === 'string' ? c : ''));
+      const results = await verifyCitationBatch(batch, jurisdiction, subject_matter, isStrictMode);
+      return NextResponse.json({ results });
     }
 
-    // Use GLM for format analysis only (NOT verification)
-    safeWarn(`Using AI format analysis (NOT verification) for: ${citation}`);
-
-    const glmResult = await verifyWithGLM(citation, jurisdiction, subject_matter || '', apiKey);
-
-    // Add confidence score to GLM result (AI format analysis = low confidence)
-    return NextResponse.json({
-      ...glmResult,
-      confidence_score: 40,  // AI format check only - significant hallucination risk
-      confidence_level: 'LOW',
-    });
-
+    // Single form: the same chain as a one-citation batch, so the two can't drift apart
+    const single = typeof citation === 'string' ? citation : '';
+    const [result] = await verifyCitationBatch([single], jurisdiction, subject_matter, isStrictMode);
+    return NextResponse.json(result);
   } catch (error) {
     safeError('Error verifying citation:', error);
 
@@ -12,13 +12,6 @@ import { Copy, Download, FileText, FileDown, Printer } from 'lucide-react';
 import { toast } from 'sonner';
 import ReactMarkdown from 'react-markdown';
 import remarkGfm from 'remark-gfm';
-import { clsx, type ClassValue } from 'clsx';
-import { twMerge } from 'tailwind-merge';
-
-// eslint-disable-next-line @typescript-eslint/no-unused-vars
-function cn(...inputs: ClassValue[]) {
-  return twMerge(clsx(inputs));
-}
 
 interface DocumentPreviewProps {
   filingsText: string;
@@ -13,6 +13,7 @@ import { safeError, safeWarn } from '../lib/pii-redactor';
 import { processImageForOCR } from '../src/utils/image-processor';
 import { parsePartialJSON } from '../lib/streaming-json-parser';
 import { createStateVersion } from '../types/state';
+import { JSON_STREAM } from '../config/constants';
 
 function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs));
@@ -386,16 +387,19 @@ export default function LegalInterface() {
         const decoder = new TextDecoder();
         let finalResult: LegalResult | null = null;
         let accumulatedContent = '';
+        let lastPreviewParseLength = 0;
+        // Network chunks don't align with NDJSON lines; hold the trailing partial line
+        let lineBuffer = '';
 
         try {
           while (true) {
             const { done, value } = await reader.read();
-            if (done) break;
-
-            const chunk = decoder.decode(value, { stream: true });
-            const lines = chunk.split('\n').filter(line => line.trim());
+            const chunk = done ? decoder.decode() : decoder.decode(value, { stream: true });
+            const lines = (lineBuffer + chunk).split('\n');
+            lineBuffer = done ? '' : lines.pop() ?? '';
 
             for (const line of lines) {
+              if (!line.trim()) continue;
               try {
                 const message = JSON.parse(line);
                 if (message.type === 'status') {
@@ -403,7 +407,14 @@ export default function LegalInterface() {
                 } else if (message.type === 'chunk') {
                   // Accumulate content for partial JSON parsing
                   accumulatedContent += message.content || '';
-                  
+
+                  // Re-parsing the whole buffer per token is quadratic; refresh
+                  // the preview once per CHUNK_SIZE characters instead
+                  if (accumulatedContent.length - lastPreviewParseLength < JSON_STREAM.CHUNK_SIZE) {
+                    continue;
+                  }
+                  lastPreviewParseLength = accumulatedContent.length;
+
                   // Try to parse partial JSON to show streaming updates
                   const partialData = parsePartialJSON<{ strategy?: string; roadmap?: string; adversarial_strategy?: string }>(accumulatedContent);
                   if (partialData) {
@@ -422,6 +433,8 @@ export default function LegalInterface() {
                 safeWarn('Failed to parse stream chunk:', parseError);
               }
             }
+
+            if (done) break;
           }
 
           if (finalResult) {
@@ -612,6 +625,12 @@ export default function LegalInterface() {
           await new Promise(resolve => setTimeout(resolve, 3000));
           retries++;
           continue;
+        } else if (checkpointData.status === 'failed') {
+          // The server deletes failed checkpoints, so polling again can only 404
+          safeWarn('Checkpoint reported failed analysis:', checkpointData.error);
+          setError('Analysis failed on the server and could not be resumed. Please try again.');
+          setLoading(false);
+          return;
         } else {
           throw new Error('Unexpected checkpoint status');
         }
@@ -3,7 +3,7 @@
 import { Copy, Download, FileText, Gavel, Link as LinkIcon, FileDown, CheckCircle, AlertTriangle, RotateCcw, AlertCircle, Info } from 'lucide-react';
 import { clsx, type ClassValue } from 'clsx';
 import { twMerge } from 'tailwind-merge';
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useMemo } from 'react';
 import { toast } from 'sonner';
 import ReactMarkdown from 'react-markdown';
 import remarkGfm from 'remark-gfm';
@@ -287,11 +287,14 @@ export default function ResultDisplay({ result, activeTab, setActiveTab, jurisdi
   }}>({});
   const [isPlainEnglish, setIsPlainEnglish] = useState(false);
 
+  // Structure checks only depend on the response text; don't rescan it on every render
+  const structureValidation = useMemo(() => validateLegalStructure(result?.text ?? ''), [result?.text]);
+
   // Quality Audit: Log low-quality responses to localStorage for monitoring
   useEffect(() => {
     if (result && result.text) {
       try {
-        const validation = validateLegalStructure(result.text);
+        const validation = structureValidation;
         if (!validation.isValid) {
           // Save failed attempt to a "Quality Log" in localStorage
           const log = JSON.parse(localStorage.getItem('lawsage_quality_audit') || '[]');
@@ -309,7 +312,7 @@ export default function ResultDisplay({ result, activeTab, setActiveTab, jurisdi
         // Ignore parsing errors for audit logging
       }
     }
-  }, [result, jurisdiction]);
+  }, [result, jurisdiction, structureValidation]);
 
   // Derive completed steps from the case ledger for persistence
   const isStepCompleted = (stepNumber: number, title: string) => {
@@ -1986,7 +1989,7 @@ export default function ResultDisplay({ result, activeTab, setActiveTab, jurisdi
           {/* Render validation results */}
           <div className="grid grid-cols-2 md:grid-cols-3 lg:grid-cols-6 gap-2 text-xs">
             {(() => {
-              const validationResults = validateLegalStructure(result.text);
+              const validationResults = structureValidation;
 
               return (
                 <>
@@ -16,6 +16,10 @@ export const RATE_LIMIT = {
 export const API = {
   GLM_BASE_URL: 'https://api.z.ai/api/paas/v4',
   GLM_MODEL: 'glm-4.7-flash',
+  // Short structured calls (interview questions, search queries, citation checks)
+  // don't need the synthesis model; set GLM_FAST_MODEL to route them to a
+  // lighter, cheaper model. Defaults to GLM_MODEL.
+  GLM_FAST_MODEL: process.env.GLM_FAST_MODEL || 'glm-4.7-flash',
   GLM_TEMPERATURE: 0.1,
   GLM_MAX_TOKENS: 2048,
   COURT_LISTENER_BASE: 'https://www.courtlistener.com/api/rest/v4',
@@ -60,11 +64,26 @@ export const CITATION_VERIFICATION = {
   STRICT_MODE: true, // If true, never fall back to AI verification (HARD-GATE)
   TIMEOUT_MS: 10000, // 10 second timeout for CourtListener
   MAX_RETRIES: 2,
+  MAX_CONCURRENT_LOOKUPS: 4, // Parallel hard-gate lookups (kept low for CourtListener rate limits)
+  MAX_BATCH_SIZE: 25, // Citations accepted per batch verify-citation request
+  AI_ANALYSIS_TOKENS_PER_CITATION: 256, // Output budget per citation in a batched AI format analysis
   // In strict mode, if CourtListener fails, return SERVICE UNAVAILABLE
   // rather than letting AI "grade its own homework"
   HARD_FAIL_ON_DATABASE_ERROR: true,
 } as const;
 
+// Analysis Response Cache Configuration
+export const RESPONSE_CACHE = {
+  TTL_SECONDS: 24 * 60 * 60, // Cached analyses expire after 24 hours
+  MAX_MEMORY_ENTRIES: 100, // Bound for the in-memory fallback when Redis is unavailable
+} as const;
+
+// Citation Lookup Cache Configuration
+export const CITATION_CACHE = {
+  TTL_SECONDS: 7 * 24 * 60 * 60, // Database hits are stable; re-check weekly
+  MAX_MEMORY_ENTRIES: 500, // Bound for the in-memory fallback when Redis is unavailable
+} as const;
+
 // JSON Streaming Configuration
 export const JSON_STREAM = {
   CHUNK_SIZE: 1024,
@@ -97,6 +116,11 @@ export const CSP = {
 export const LEGAL_DATA = {
   RULES_DIR: '/rules',
   LEGAL_LOOKUP_FILE: '/data/legal_lookup.json',
+  VECTOR_SEARCH_TIMEOUT_MS: 4000, // Analyze falls back to static grounding past this
+  VECTOR_SEARCH_CACHE_TTL_MS: 10 * 60 * 1000, // Repeat queries (retries, audits) reuse results
+  VECTOR_SEARCH_CACHE_MAX_ENTRIES: 200,
+  VECTOR_UPSERT_BATCH_SIZE: 100, // Rules embedded per Upstash upsert request when seeding
+  VECTOR_UPSERT_CONCURRENCY: 4, // Upsert requests in flight at once when seeding
   STATE_CODE_ALIASES: {
     // Map common names to ISO-3166-2 codes
     'california': 'CA',
@@ -128,6 +152,8 @@ export const FUNCTION_TIMEOUTS = {
 export const LIMITS = {
   PROMPT_MAX_CHARS: 1500,
   OCR_MAX_CHARS: 5000,
+  PROMPT_DOCUMENTS_MAX_CHARS: 16000, // Total case-folder text embedded in the analysis prompt
+  PROMPT_RESEARCH_MAX_CHARS: 12000, // Research context (vector or static lookup) embedded in the analysis prompt
   CASE_LEDGER_MAX_ENTRIES: 100,
   CHAT_HISTORY_MAX_MESSAGES: 50,
 } as const;
@@ -16,8 +16,9 @@
  * ```
  */
 
-import { Redis } from '@upstash/redis';
-import { safeLog, safeError, safeWarn } from './pii-redactor';
+import type { Redis } from '@upstash/redis';
+import { getRedisClient as getSharedRedisClient } from './redis';
+import { safeLog, safeDebug, safeError, safeWarn } from './pii-redactor';
 
 // Checkpoint data structure
 export interface AnalysisCheckpointData {
@@ -42,21 +43,16 @@ export interface AnalysisCheckpointData {
 const CHECKPOINT_TTL = 24 * 60 * 60;
 
 /**
- * Get Redis client (lazy initialization)
+ * Get the shared Redis client (lazy singleton from ./redis)
  */
 function getRedisClient(): Redis | null {
-  const upstashUrl = process.env.UPSTASH_REDIS_REST_URL;
-  const upstashToken = process.env.UPSTASH_REDIS_REST_TOKEN;
+  const client = getSharedRedisClient();
 
-  if (!upstashUrl || !upstashToken) {
-    safeLog('[Checkpoint] Redis not configured - checkpoints disabled');
-    return null;
+  if (!client) {
+    safeDebug('[Checkpoint] Redis not configured - checkpoints disabled');
   }
 
-  return new Redis({
-    url: upstashUrl,
-    token: upstashToken,
-  });
+  return client;
 }
 
 /**
@@ -104,7 +100,7 @@ export async function saveCheckpoint(
     // Save with TTL
     await redis.set(key, checkpoint, { ex: CHECKPOINT_TTL });
 
-    safeLog(`[Checkpoint] Saved checkpoint for session ${sessionId} at step ${checkpoint.step} (status: ${checkpoint.status})`);
+    safeDebug(`[Checkpoint] Saved checkpoint for session ${sessionId} at step ${checkpoint.step} (status: ${checkpoint.status})`);
     return true;
   } catch (error) {
     safeError('[Checkpoint] Failed to save:', error);
@@ -15,8 +15,7 @@
  * - New York Law Report Style Manual (for New York state courts)
  */
 
-// eslint-disable-next-line @typescript-eslint/no-unused-vars
-import { safeLog, safeWarn } from './pii-redactor';
+import { safeWarn } from './pii-redactor';
 
 /**
  * Citation style enumeration
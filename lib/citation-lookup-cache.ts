@@ -0,0 +1,43 @@
+/**
+ * Citation Lookup Cache
+ *
+ * Stores database-verified citation lookups (CourtListener case law and
+ * statutes) keyed by jurisdiction and normalized citation text, so a
+ * citation that recurs across analyses skips the CourtListener round-trips.
+ * Only hits are cached: a miss may be a transient API failure.
+ *
+ * Uses the shared Upstash Redis client when configured, otherwise a bounded
+ * in-memory map (per serverless instance).
+ */
+
+import { KEY_PREFIX } from './redis';
+import { createTtlCache } from './ttl-cache';
+import { CITATION_CACHE } from '../config/constants';
+
+const citationCache = createTtlCache<unknown>({
+  name: 'Citation Cache',
+  ttlSeconds: CITATION_CACHE.TTL_SECONDS,
+  maxMemoryEntries: CITATION_CACHE.MAX_MEMORY_ENTRIES,
+});
+
+/**
+ * Build the cache key for a citation lookup
+ */
+export function getCitationCacheKey(citation: string, jurisdiction: string): string {
+  const normalizedCitation = citation.trim().replace(/\s+/g, ' ').toLowerCase();
+  return `${KEY_PREFIX}citation:${jurisdiction.trim().toLowerCase()}:${normalizedCitation}`;
+}
+
+/**
+ * Look up a cached citation result. Returns null on miss or cache failure.
+ */
+export async function getCachedCitationLookup<T>(key: string): Promise<T | null> {
+  return (await citationCache.get(key)) as T | null;
+}
+
+/**
+ * Store a verified citation result. Failures are logged and otherwise ignored.
+ */
+export async function setCachedCitationLookup<T>(key: string, value: T): Promise<void> {
+  return citationCache.set(key, value);
+}
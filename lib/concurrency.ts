@@ -0,0 +1,31 @@
+/**
+ * Concurrency Helpers
+ *
+ * Bounded parallelism for fan-out work against rate-limited services
+ * (CourtListener lookups, Upstash Vector upserts).
+ */
+
+/**
+ * Map items through an async function with at most `limit` calls in flight.
+ * Results keep the input order. A rejection rejects the whole map, so callers
+ * that must not fail should catch inside `fn`.
+ */
+export async function mapWithConcurrency<T, R>(
+  items: readonly T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+  const results: R[] = new Array(items.length);
+
+  let next = 0;
+  const worker = async () => {
+    while (next < items.length) {
+      const index = next++;
+      results[index] = await fn(items[index], index);
+    }
+  };
+
+  const poolSize = Math.min(Math.max(1, limit), items.length);
+  await Promise.all(Array.from({ length: poolSize }, worker));
+  return results;
+}
@@ -7,7 +7,7 @@
  * This addresses the critical risk of LLM hallucination in legal procedures.
  */
 
-import { safeLog, safeError } from './pii-redactor';
+import { safeLog, safeDebug, safeError } from './pii-redactor';
 
 interface CritiqueConfig {
   jurisdiction: string;
@@ -41,31 +41,95 @@ interface CritiqueResult {
   correctedOutput?: string;
 }
 
+// Statute and case citation patterns, compiled once at module load
+const STATUTE_PATTERNS = [
+  // Federal: 12 U.S.C. § 345, 15 U.S.C. § 1234
+  /(\d+\s+[A-Z]\.[A-Z]\.[A-Z]\.?\s+§?\s*\d+(?:\.\d+)?[a-z]?)/gi,
+  // California: Cal. Civ. Code § 1708, CCP § 412.20
+  /((?:Cal\.?\s+)?(?:Civ\.?\s+)?(?:Code|Penal|Civil|Probate|Family|Evidence|Corp)\s+§?\s*\d+(?:\.\d+)?[a-z]?)/gi,
+  // CCP standalone
+  /(CCP\s+§?\s*\d+(?:\.\d+)?[a-z]?)/gi,
+  // State statutes: Wis. Stat. § 823.01, N.Y. Civ. Prac. L. & R. § 3211
+  /(([A-Z][a-z]+\.?\s+(?:Stat\.?|Code|Crim\.?\s+Proc\.?|Civ\.?\s+Prac\.?))\s+§?\s*\d+(?:\.\d+)?[a-z]?)/gi,
+  // Court rules: Fed. R. Civ. P. 12(b)(6), FRCP 12, Cal. Rules of Court, rule 3.1324
+  /((?:Fed\.?\s+R\.?\s+(?:Civ\.?\s+)?P\.?|FRCP|CRCP|TRCP|FLRCP)\s*(?:rule\.?)?\s*\d+(?:\.\d+)?(?:\([a-z0-9]+\))?)/gi,
+  // Rules of Court
+  /((?:Cal\.?\s+Rules\s+of\s+Court|Local\s+Rule)\s+(?:rule\.?\s*)?\d+(?:\.\d+)?[a-z]?)/gi,
+  // Case Law (e.g., 410 U.S. 113, Roe v. Wade)
+  /(\d+\s+[A-Z]\.?\s+[A-Z]\.?\d?d?\s+\d+)/gi,
+  /([A-Z][a-z]+\s+v\.\s+[A-Z][a-z]+)/g,
+];
+
+// HEURISTIC: Check for obvious fake/placeholder statute numbers used in tests or hallucinations
+const FAKE_STATUTE_PATTERNS = [
+  /§\s*999999/i,
+  /(?:Rule|FRCP|CCP|Stat)\s*999/i,
+  /fake/i,
+  /fabricated/i,
+  /\[INSERT/i
+];
+
+// Known jurisdiction-specific statute patterns
+const JURISDICTION_STATUTE_PATTERNS: Record<string, RegExp[]> = {
+  'California': [
+    /Cal\.?\s+(?:Civ\.?\s+)?Code\s+§\s*\d+/i,
+    /CCP\s+§\s*\d+/i,
+    /Cal\.?\s+Rules\s+of\s+Court/i,
+  ],
+  'Federal': [
+    /Fed\.?\s+R\.?\s+(?:Civ\.?\s+)?P\.?\s+\d+/i,
+    /\d+\s+U\.?S\.?C\.?\s+§?\s*\d+/i,
+  ],
+  'Wisconsin': [
+    /Wis\.?\s+Stat\.?\s+§\s*\d+(?:\.\d+)?/i,
+    /Wis\.?\s+Admin\.?\s+Code/i,
+  ],
+  'New York': [
+    /N\.?Y\.?\s+(?:Civ\.?\s+)?Prac\.?\s+L\.?\s+&?\s*R\.?/i,
+    /N\.?Y\.?\s+(?:City\s+)?Court\s+Rules/i,
+  ],
+  'Texas': [
+    /Tex\.?\s+(?:Civ\.?\s+)?Prac\.?\s+&?\s*Rem\.?\s+Code/i,
+    /Tex\.?\s+Rules\s+of\s+Civ\.?\s+Proc\.?/i,
+  ],
+  'Florida': [
+    /Fla\.?\s+Stat\.?\s+§\s*\d+/i,
+    /Fla\.?\s+Rules\s+of\s+Civ\.?\s+Proc\.?/i,
+  ],
+};
+
+// Procedural keywords that should match context
+const PROCEDURAL_KEYWORDS = [
+  'file', 'motion', 'complaint', 'answer', 'serve', 'discovery',
+  'hearing', 'trial', 'judgment', 'appeal', 'dismiss'
+];
+
+// Jurisdiction-specific terminology (lowercase, matched against lowercased text)
+const JURISDICTION_TERMS: Record<string, string[]> = {
+  'California': ['demurrer', 'ex parte', 'ccp', 'superior court'],
+  'New York': ['motion to dismiss', 'cplr', 'supreme court'],
+  'Texas': ['pleading', 'trcp', 'district court'],
+  'Florida': ['motion', 'florida rules', 'circuit court'],
+  'Wisconsin': ['motion', 'wis. stat.', 'circuit court'],
+};
+
+// Placeholder text that must not survive into a final analysis
+const PLACEHOLDER_PATTERNS = [
+  /step\s+pending/i,
+  /to\s+be\s+determined/i,
+  /citation\s+unavailable/i,
+  /details\s+to\s+be\s+confirmed/i,
+  /placeholder/i,
+  /analysis\s+pending/i,
+];
+
 /**
  * Extract all statute citations from the legal output
  */
 function extractStatutes(content: string): string[] {
-  const statutePatterns = [
-    // Federal: 12 U.S.C. § 345, 15 U.S.C. § 1234
-    /(\d+\s+[A-Z]\.[A-Z]\.[A-Z]\.?\s+§?\s*\d+(?:\.\d+)?[a-z]?)/gi,
-    // California: Cal. Civ. Code § 1708, CCP § 412.20
-    /((?:Cal\.?\s+)?(?:Civ\.?\s+)?(?:Code|Penal|Civil|Probate|Family|Evidence|Corp)\s+§?\s*\d+(?:\.\d+)?[a-z]?)/gi,
-    // CCP standalone
-    /(CCP\s+§?\s*\d+(?:\.\d+)?[a-z]?)/gi,
-    // State statutes: Wis. Stat. § 823.01, N.Y. Civ. Prac. L. & R. § 3211
-    /(([A-Z][a-z]+\.?\s+(?:Stat\.?|Code|Crim\.?\s+Proc\.?|Civ\.?\s+Prac\.?))\s+§?\s*\d+(?:\.\d+)?[a-z]?)/gi,
-    // Court rules: Fed. R. Civ. P. 12(b)(6), FRCP 12, Cal. Rules of Court, rule 3.1324
-    /((?:Fed\.?\s+R\.?\s+(?:Civ\.?\s+)?P\.?|FRCP|CRCP|TRCP|FLRCP)\s*(?:rule\.?)?\s*\d+(?:\.\d+)?(?:\([a-z0-9]+\))?)/gi,
-    // Rules of Court
-    /((?:Cal\.?\s+Rules\s+of\s+Court|Local\s+Rule)\s+(?:rule\.?\s*)?\d+(?:\.\d+)?[a-z]?)/gi,
-    // Case Law (e.g., 410 U.S. 113, Roe v. Wade)
-    /(\d+\s+[A-Z]\.?\s+[A-Z]\.?\d?d?\s+\d+)/gi,
-    /([A-Z][a-z]+\s+v\.\s+[A-Z][a-z]+)/g,
-  ];
-
   const statutes = new Set<string>();
 
-  for (const pattern of statutePatterns) {
+  for (const pattern of STATUTE_PATTERNS) {
     const matches = content.match(pattern) || [];
     for (const match of matches) {
       statutes.add(match.trim());
@@ -76,26 +140,17 @@ function extractStatutes(content: string): string[] {
 }
 
 /**
- * Verify statute against research context
+ * Verify statute against research context (already lowercased by the caller)
  */
 function verifyStatuteAgainstContext(
   statute: string,
-  researchContext: string,
+  contextLower: string,
   jurisdiction: string
 ): StatuteVerification {
   const statuteLower = statute.toLowerCase();
-  const contextLower = researchContext.toLowerCase();
 
   // HEURISTIC: Check for obvious fake/placeholder statute numbers used in tests or hallucinations
-  const fakePatterns = [
-    /§\s*999999/i,
-    /(?:Rule|FRCP|CCP|Stat)\s*999/i,
-    /fake/i,
-    /fabricated/i,
-    /\[INSERT/i
-  ];
-  
-  if (fakePatterns.some(pattern => pattern.test(statute))) {
+  if (FAKE_STATUTE_PATTERNS.some(pattern => pattern.test(statute))) {
     return {
       statute,
       isVerified: false,
@@ -113,7 +168,7 @@ function verifyStatuteAgainstContext(
   if (statuteNumberMatch) {
     const statuteNumber = statuteNumberMatch[1];
     const similarPattern = new RegExp(`§\\s*${statuteNumber.replace(/\./g, '\\.')}`, 'i');
-    if (similarPattern.test(researchContext)) {
+    if (similarPattern.test(contextLower)) {
       return {
         statute,
         isVerified: true,
@@ -123,35 +178,7 @@ function verifyStatuteAgainstContext(
   }
 
   // If not in context, check against known jurisdiction-specific patterns
-  const jurisdictionPatterns: Record<string, RegExp[]> = {
-    'California': [
-      /Cal\.?\s+(?:Civ\.?\s+)?Code\s+§\s*\d+/i,
-      /CCP\s+§\s*\d+/i,
-      /Cal\.?\s+Rules\s+of\s+Court/i,
-    ],
-    'Federal': [
-      /Fed\.?\s+R\.?\s+(?:Civ\.?\s+)?P\.?\s+\d+/i,
-      /\d+\s+U\.?S\.?C\.?\s+§?\s*\d+/i,
-    ],
-    'Wisconsin': [
-      /Wis\.?\s+Stat\.?\s+§\s*\d+(?:\.\d+)?/i,
-      /Wis\.?\s+Admin\.?\s+Code/i,
-    ],
-    'New York': [
-      /N\.?Y\.?\s+(?:Civ\.?\s+)?Prac\.?\s+L\.?\s+&?\s*R\.?/i,
-      /N\.?Y\.?\s+(?:City\s+)?Court\s+Rules/i,
-    ],
-    'Texas': [
-      /Tex\.?\s+(?:Civ\.?\s+)?Prac\.?\s+&?\s*Rem\.?\s+Code/i,
-      /Tex\.?\s+Rules\s+of\s+Civ\.?\s+Proc\.?/i,
-    ],
-    'Florida': [
-      /Fla\.?\s+Stat\.?\s+§\s*\d+/i,
-      /Fla\.?\s+Rules\s+of\s+Civ\.?\s+Proc\.?/i,
-    ],
-  };
-
-  const jurisdictionPattern = jurisdictionPatterns[jurisdiction] || [];
+  const jurisdictionPattern = JURISDICTION_STATUTE_PATTERNS[jurisdiction] || [];
   let matchesJurisdiction = false;
 
   for (const pattern of jurisdictionPattern) {
@@ -180,43 +207,26 @@ function verifyStatuteAgainstContext(
 }
 
 /**
- * Verify roadmap steps against research context
+ * Verify roadmap steps against research context.
+ * The context-side checks are the same for every step, so the caller passes
+ * the procedural keywords found in the context and whether it uses any
+ * jurisdiction terminology.
  */
 function verifyRoadmapStep(
   step: { step: number; title: string; description: string },
-  researchContext: string,
+  contextKeywords: string[],
+  contextHasJurisdictionTerms: boolean,
   jurisdiction: string
 ): RoadmapVerification {
   const stepText = `${step.title} ${step.description}`.toLowerCase();
-  const contextLower = researchContext.toLowerCase();
 
   // Check for procedural keywords that should match context
-  const proceduralKeywords = [
-    'file', 'motion', 'complaint', 'answer', 'serve', 'discovery',
-    'hearing', 'trial', 'judgment', 'appeal', 'dismiss'
-  ];
-
-  let hasContextSupport = false;
-  for (const keyword of proceduralKeywords) {
-    if (stepText.includes(keyword) && contextLower.includes(keyword)) {
-      hasContextSupport = true;
-      break;
-    }
-  }
+  const hasContextSupport = contextKeywords.some(keyword => stepText.includes(keyword));
 
   // Check for jurisdiction-specific terminology
-  const jurisdictionTerms: Record<string, string[]> = {
-    'California': ['demurrer', 'ex parte', 'CCP', 'superior court'],
-    'New York': ['motion to dismiss', 'CPLR', 'supreme court'],
-    'Texas': ['pleading', 'TRCP', 'district court'],
-    'Florida': ['motion', 'Florida Rules', 'circuit court'],
-    'Wisconsin': ['motion', 'Wis. Stat.', 'circuit court'],
-  };
-
-  const terms = jurisdictionTerms[jurisdiction] || [];
-  const hasJurisdictionTerminology = terms.some(term => 
-    stepText.includes(term.toLowerCase()) || contextLower.includes(term.toLowerCase())
-  );
+  const terms = JURISDICTION_TERMS[jurisdiction] || [];
+  const hasJurisdictionTerminology = contextHasJurisdictionTerms ||
+    terms.some(term => stepText.includes(term));
 
   if (!hasContextSupport && !hasJurisdictionTerminology) {
     return {
@@ -246,15 +256,18 @@ export async function runCritiqueLoop(
 ): Promise<CritiqueResult> {
   const { jurisdiction, researchContext } = config;
 
-  safeLog(`[Critique Agent] Starting audit for ${jurisdiction} output`);
+  safeDebug(`[Critique Agent] Starting audit for ${jurisdiction} output`);
 
   try {
+    // Scan the research context once rather than per statute and per step
+    const contextLower = researchContext.toLowerCase();
+
     // Step 1: Extract and verify statutes
     const statutes = extractStatutes(architectOutput);
-    safeLog(`[Critique Agent] Found ${statutes.length} statutes to verify`);
+    safeDebug(`[Critique Agent] Found ${statutes.length} statutes to verify`);
 
     const statuteVerifications: StatuteVerification[] = statutes.map(statute =>
-      verifyStatuteAgainstContext(statute, researchContext, jurisdiction)
+      verifyStatuteAgainstContext(statute, contextLower, jurisdiction)
     );
 
     // Step 2: Parse and verify roadmap
@@ -264,8 +277,12 @@ export async function runCritiqueLoop(
       const roadmap = parsedOutput.roadmap || parsedOutput.procedural_roadmap || [];
 
       if (Array.isArray(roadmap)) {
+        const contextKeywords = PROCEDURAL_KEYWORDS.filter(keyword => contextLower.includes(keyword));
+        const contextHasJurisdictionTerms = (JURISDICTION_TERMS[jurisdiction] || []).some(term =>
+          contextLower.includes(term)
+        );
         roadmapVerifications = roadmap.map((step: { step: number; title: string; description: string }) =>
-          verifyRoadmapStep(step, researchContext, jurisdiction)
+          verifyRoadmapStep(step, contextKeywords, contextHasJurisdictionTerms, jurisdiction)
         );
       }
     } catch (parseError) {
@@ -273,16 +290,7 @@ export async function runCritiqueLoop(
     }
 
     // Step 3: Check for placeholders
-    const placeholderPatterns = [
-      /step\s+pending/i,
-      /to\s+be\s+determined/i,
-      /citation\s+unavailable/i,
-      /details\s+to\s+be\s+confirmed/i,
-      /placeholder/i,
-      /analysis\s+pending/i,
-    ];
-
-    const hasPlaceholders = placeholderPatterns.some(pattern =>
+    const hasPlaceholders = PLACEHOLDER_PATTERNS.some(pattern =>
       pattern.test(architectOutput)
     );
 
@@ -220,13 +220,7 @@ export class EvidenceVault {
    * Add evidence to the vault
    */
   async addEvidence(evidence: Omit<EvidenceItem, 'id' | 'createdAt' | 'updatedAt' | 'encryptionVersion'>): Promise<EvidenceItem> {
-    const newItem: EvidenceItem = {
-      ...evidence,
-      id: crypto.randomUUID(),
-      createdAt: Date.now(),
-      updatedAt: Date.now(),
-      encryptionVersion: this.version,
-    };
+    const newItem = this.buildEvidenceItem(evidence, Date.now());
 
     this.evidence.push(newItem);
     this.lastUpdated = Date.now();
@@ -238,6 +232,22 @@ export class EvidenceVault {
     return newItem;
   }
 
+  /**
+   * Give new evidence a fresh id, timestamps and this vault's encryption version
+   */
+  private buildEvidenceItem(
+    evidence: Omit<EvidenceItem, 'id' | 'createdAt' | 'updatedAt' | 'encryptionVersion'>,
+    now: number
+  ): EvidenceItem {
+    return {
+      ...evidence,
+      id: crypto.randomUUID(),
+      createdAt: now,
+      updatedAt: now,
+      encryptionVersion: this.version,
+    };
+  }
+
   /**
    * Update an existing evidence item
    */
@@ -301,7 +311,8 @@ export class EvidenceVault {
    * Export evidence for sharing (encrypted with recipient's key)
    */
   async exportEvidence(evidenceIds: string[], recipientPassword: string): Promise<Blob> {
-    const itemsToExport = this.evidence.filter(e => evidenceIds.includes(e.id));
+    const exportIds = new Set(evidenceIds);
+    const itemsToExport = this.evidence.filter(e => exportIds.has(e.id));
 
     if (itemsToExport.length === 0) {
       throw new Error('No evidence items found for export');
@@ -335,15 +346,22 @@ export class EvidenceVault {
       ? await EvidenceVault.open(targetCaseId, password)
       : await EvidenceVault.create();
 
-    // Add imported evidence
+    // Add imported evidence, then encrypt and persist the vault once
+    // rather than once per item
+    const now = Date.now();
     for (const item of decrypted.evidence) {
-      await vault.addEvidence({
+      vault.evidence.push(vault.buildEvidenceItem({
         name: `${item.name} (imported)`,
         type: item.type,
         ocrText: item.ocrText,
         metadata: item.metadata,
-      });
+      }, now));
     }
+    vault.lastUpdated = now;
+
+    safeLog(`[EvidenceVault] Imported ${decrypted.evidence.length} evidence items`);
+
+    await vault.save();
 
     return vault;
   }
@@ -0,0 +1,21 @@
+/**
+ * GLM Chat Completion Helpers
+ *
+ * Shared reading of non-streaming GLM chat completion responses, so every
+ * caller handles a missing choice or message the same way.
+ */
+
+export interface GLMChatCompletion {
+  choices?: Array<{
+    message?: {
+      content?: string | null;
+    };
+  }>;
+}
+
+/**
+ * Text content of the first choice, or undefined when the response has none
+ */
+export function getMessageContent(data: GLMChatCompletion): string | undefined {
+  return data.choices?.[0]?.message?.content ?? undefined;
+}
@@ -16,6 +16,7 @@ import { processImageForOCR } from '../../src/utils/image-processor';
 import { parsePartialJSON } from '../../lib/streaming-json-parser';
 import { createStateVersion, type StateVersion } from '../../types/state';
 import { generateClientFingerprint } from '../utils';
+import { JSON_STREAM } from '../../config/constants';
 
 /**
  * Result types
@@ -147,21 +148,29 @@ export function useLegalAnalysis() {
     const decoder = new TextDecoder();
     let finalResult: LegalResult | null = null;
     let accumulatedContent = '';
+    let lastPreviewParseLength = 0;
+    // Network chunks don't align with NDJSON lines; hold the trailing partial line
+    let lineBuffer = '';
 
     while (true) {
       const { done, value } = await reader.read();
-      if (done) break;
-
-      const chunk = decoder.decode(value, { stream: true });
-      const lines = chunk.split('\n').filter(line => line.trim());
+      const chunk = done ? decoder.decode() : decoder.decode(value, { stream: true });
+      const lines = (lineBuffer + chunk).split('\n');
+      lineBuffer = done ? '' : lines.pop() ?? '';
 
       for (const line of lines) {
+        if (!line.trim()) continue;
         try {
           const message = JSON.parse(line);
           if (message.type === 'status') {
             setStreamingStatus(message.message);
           } else if (message.type === 'chunk') {
             accumulatedContent += message.content || '';
+            // Refresh the preview once per CHUNK_SIZE characters, not per token
+            if (accumulatedContent.length - lastPreviewParseLength < JSON_STREAM.CHUNK_SIZE) {
+              continue;
+            }
+            lastPreviewParseLength = accumulatedContent.length;
             const partialData = parsePartialJSON<{ strategy?: string; roadmap?: string }>(accumulatedContent);
             if (partialData) {
               setStreamingPreview({
@@ -179,6 +188,8 @@ export function useLegalAnalysis() {
           console.warn('Failed to parse stream chunk:', parseError);
         }
       }
+
+      if (done) break;
     }
 
     if (!finalResult) {
@@ -229,6 +240,10 @@ export function useLegalAnalysis() {
           await new Promise(resolve => setTimeout(resolve, 3000));
           retries++;
           continue;
+        } else if (checkpointData.status === 'failed') {
+          // The server deletes failed checkpoints, so polling again can only 404
+          setError('Analysis failed on the server and could not be resumed. Please try again.');
+          return null;
         }
 
         throw new Error('Unexpected checkpoint status');
@@ -101,121 +101,124 @@ export function usePlainEnglish(): UsePlainEnglishReturn {
   };
 }
 
+const LEGAL_TERMS: Record<string, string> = {
+  'plaintiff': 'the person suing',
+  'defendant': 'the person being sued',
+  'hereby': 'by this document',
+  'thereof': 'of that thing',
+  'whereas': 'because',
+  'pursuant to': 'following',
+  'notwithstanding': 'despite',
+  'herein': 'in this document',
+  'therein': 'in that document',
+  'aforementioned': 'mentioned before',
+  'shall': 'must',
+  'may': 'might',
+  'should': 'ought to',
+  'in the event that': 'if',
+  'prior to': 'before',
+  'subsequent to': 'after',
+  'commence': 'start',
+  'terminate': 'end',
+  'reside': 'live',
+  'dwelling': 'home',
+  'assert': 'claim',
+  'commenced': 'started',
+  'in lieu of': 'instead of',
+  'with respect to': 'about',
+  'in regard to': 'about',
+  'as to': 'about',
+  'jurisdiction': 'court authority',
+  'statute': 'law',
+  'citation': 'legal reference',
+  'motion': 'formal request',
+  'complaint': 'legal claim',
+  'answer': 'response to claims',
+  'discovery': 'information exchange',
+  'deposition': 'sworn statement',
+  'subpoena': 'court order to appear',
+  'remedy': 'legal solution',
+  'damages': 'money compensation',
+  'injunction': 'court order to stop',
+  'affidavit': 'written sworn statement',
+  'testimony': 'spoken evidence',
+  'verdict': 'court decision',
+  'judgment': 'final court decision',
+  'appeal': 'request for review',
+  'pro se': 'representing yourself',
+  'litigant': 'person in a lawsuit',
+  'proceeding': 'court case',
+  'tribunal': 'court',
+  'counsel': 'lawyer',
+  'attorney': 'lawyer',
+  'counsel for': 'lawyer for',
+  'hereunto': 'to this document',
+  'wit': 'know',
+  'thenceforth': 'from then on',
+  'forthwith': 'immediately',
+  'hereafter': 'after this time',
+  'thereafter': 'after that time',
+  'heretofore': 'before now',
+  'thereunto': 'to that',
+  'ipse dixit': 'unproven claim',
+  'prima facie': 'at first glance',
+  'res judicata': 'already decided',
+  'collateral estoppel': 'already settled',
+  'stare decisis': 'follow previous rulings',
+  'habeas corpus': 'produce the person',
+  'certiorari': 'review request',
+  'mandamus': 'court order',
+  'quo warranto': 'authority challenge',
+};
+
+const REDUNDANT_PHRASES: Record<string, string> = {
+  'at this point in time': 'now',
+  'for the purpose of': 'to',
+  'in order to': 'to',
+  'due to the fact that': 'because',
+  'for the reason that': 'because',
+  'in the matter of': 'regarding',
+  'under the circumstances': 'since',
+  'as a matter of law': 'legally',
+  'it is hereby ordered that': 'the court orders',
+  'hereby orders': 'orders',
+  'notwithstanding the foregoing': 'despite this',
+  'in addition to the above': 'also',
+};
+
+/**
+ * Build one case-insensitive alternation over the given phrases, longest
+ * first so "counsel for" wins over "counsel" at the same position
+ */
+function buildPhrasePattern(phrases: string[], wordBoundaries: boolean): RegExp {
+  const alternation = [...phrases]
+    .sort((a, b) => b.length - a.length)
+    .map(phrase => phrase.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'))
+    .join('|');
+  return new RegExp(wordBoundaries ? `\\b(?:${alternation})\\b` : alternation, 'gi');
+}
+
+const LEGAL_TERM_PATTERN = buildPhrasePattern(Object.keys(LEGAL_TERMS), true);
+const REDUNDANT_PHRASE_PATTERN = buildPhrasePattern(Object.keys(REDUNDANT_PHRASES), false);
+
 /**
  * Simple client-side translation for common legal terms
  * This is a fallback when the API is not available
  */
 async function simpleClientSideTranslation(content: string): Promise<string> {
-  const legalTerms: Record<string, string> = {
-    'plaintiff': 'the person suing',
-    'defendant': 'the person being sued',
-    'hereby': 'by this document',
-    'thereof': 'of that thing',
-    'whereas': 'because',
-    'pursuant to': 'following',
-    'notwithstanding': 'despite',
-    'herein': 'in this document',
-    'therein': 'in that document',
-    'aforementioned': 'mentioned before',
-    'shall': 'must',
-    'may': 'might',
-    'should': 'ought to',
-    'in the event that': 'if',
-    'prior to': 'before',
-    'subsequent to': 'after',
-    'commence': 'start',
-    'terminate': 'end',
-    'reside': 'live',
-    'dwelling': 'home',
-    'assert': 'claim',
-    'commenced': 'started',
-    'in lieu of': 'instead of',
-    'with respect to': 'about',
-    'in regard to': 'about',
-    'as to': 'about',
-    'jurisdiction': 'court authority',
-    'statute': 'law',
-    'citation': 'legal reference',
-    'motion': 'formal request',
-    'complaint': 'legal claim',
-    'answer': 'response to claims',
-    'discovery': 'information exchange',
-    'deposition': 'sworn statement',
-    'subpoena': 'court order to appear',
-    'remedy': 'legal solution',
-    'damages': 'money compensation',
-    'injunction': 'court order to stop',
-    'affidavit': 'written sworn statement',
-    'testimony': 'spoken evidence',
-    'verdict': 'court decision',
-    'judgment': 'final court decision',
-    'appeal': 'request for review',
-    'pro se': 'representing yourself',
-    'litigant': 'person in a lawsuit',
-    'proceeding': 'court case',
-    'tribunal': 'court',
-    'counsel': 'lawyer',
-    'attorney': 'lawyer',
-    'counsel for': 'lawyer for',
-    'hereunto': 'to this document',
-    'wit': 'know',
-    'thenceforth': 'from then on',
-    'forthwith': 'immediately',
-    'hereafter': 'after this time',
-    'thereafter': 'after that time',
-    'heretofore': 'before now',
-    'thereunto': 'to that',
-    'ipse dixit': 'unproven claim',
-    'prima facie': 'at first glance',
-    'res judicata': 'already decided',
-    'collateral estoppel': 'already settled',
-    'stare decisis': 'follow previous rulings',
-    'habeas corpus': 'produce the person',
-    'certiorari': 'review request',
-    'mandamus': 'court order',
-    'quo warranto': 'authority challenge',
-  };
-
-  let translated = content;
-
-  // Replace legal terms with plain English
-  for (const [legal, plain] of Object.entries(legalTerms)) {
-    const regex = new RegExp(`\\b${legal}\\b`, 'gi');
-    translated = translated.replace(regex, plain);
-  }
+  // Replace legal terms with plain English in a single pass
+  const translated = content.replace(LEGAL_TERM_PATTERN, match => LEGAL_TERMS[match.toLowerCase()] ?? match);
 
   // Simplify complex sentence structures
-  translated = simplifySentences(translated);
-
-  return translated;
+  return simplifySentences(translated);
 }
 
 /**
  * Simplify complex legal sentences
  */
 function simplifySentences(text: string): string {
-  let simplified = text;
-
   // Remove redundant phrases
-  const redundantPhrases = [
-    { from: 'at this point in time', to: 'now' },
-    { from: 'for the purpose of', to: 'to' },
-    { from: 'in order to', to: 'to' },
-    { from: 'due to the fact that', to: 'because' },
-    { from: 'for the reason that', to: 'because' },
-    { from: 'in the matter of', to: 'regarding' },
-    { from: 'under the circumstances', to: 'since' },
-    { from: 'as a matter of law', to: 'legally' },
-    { from: 'it is hereby ordered that', to: 'the court orders' },
-    { from: 'hereby orders', to: 'orders' },
-    { from: 'notwithstanding the foregoing', to: 'despite this' },
-    { from: 'in addition to the above', to: 'also' },
-  ];
-
-  for (const { from, to } of redundantPhrases) {
-    const regex = new RegExp(from, 'gi');
-    simplified = simplified.replace(regex, to);
-  }
+  const simplified = text.replace(REDUNDANT_PHRASE_PATTERN, match => REDUNDANT_PHRASES[match.toLowerCase()] ?? match);
 
   // Break up very long sentences (simple heuristic: sentences over 50 words)
   const sentences = simplified.split(/([.!?]+)/);
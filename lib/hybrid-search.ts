@@ -11,8 +11,7 @@
  * This approach ensures both precise legal citations AND semantic understanding.
  */
 
-// eslint-disable-next-line @typescript-eslint/no-unused-vars
-import { getVectorClient, searchLegalRules, type VectorSearchResult, type LegalRuleVector } from './vector';
+import { searchLegalRules, type VectorSearchResult, type LegalRuleVector } from './vector';
 
 /**
  * BM25 Search Implementation
@@ -32,12 +31,12 @@ export class BM25Search {
    * Add documents to the BM25 index
    */
   addDocument(id: string, text: string, metadata: LegalRuleVector): void {
-    const docLength = this.tokenize(text).length;
+    const tokens = this.tokenize(text);
+    const docLength = tokens.length;
     this.docLengths.set(id, docLength);
     this.avgDocLength = (this.avgDocLength * this.nDocuments + docLength) / (this.nDocuments + 1);
     this.nDocuments++;
 
-    const tokens = this.tokenize(text);
     const tf = new Map<string, number>();
 
     for (const token of tokens) {
@@ -73,13 +72,12 @@ export class BM25Search {
   }
 
   /**
-   * Calculate BM25 score for a query against a document
+   * Calculate BM25 score for a tokenized query against a document
    */
-  private scoreDocument(query: string, docId: string): number {
+  private scoreDocument(queryTokens: string[], docId: string): number {
     const doc = this.documents.get(docId);
     if (!doc) return 0;
 
-    const queryTokens = this.tokenize(query);
     const docLength = this.docLengths.get(docId) || 0;
     let score = 0;
 
@@ -103,8 +101,21 @@ export class BM25Search {
   search(query: string, topK: number = 10): Array<{ id: string; score: number; metadata: LegalRuleVector }> {
     const results: Array<{ id: string; score: number; metadata: LegalRuleVector }> = [];
 
-    for (const [id, doc] of this.documents) {
-      const score = this.scoreDocument(query, id);
+    // Only documents containing a query term can score above zero, so walk the
+    // term postings instead of scoring every indexed document
+    const queryTokens = this.tokenize(query);
+    const candidateIds = new Set<string>();
+    for (const term of queryTokens) {
+      const postings = this.termFrequencies.get(term);
+      if (postings) {
+        for (const id of postings.keys()) candidateIds.add(id);
+      }
+    }
+
+    for (const id of candidateIds) {
+      const doc = this.documents.get(id);
+      if (!doc) continue;
+      const score = this.scoreDocument(queryTokens, id);
       if (score > 0) {
         results.push({ id, score, metadata: doc.metadata });
       }
@@ -226,24 +237,19 @@ export class HybridSearchEngine {
     const maxVectorScore = Math.max(...vectorResults.map(r => r.score), 1);
     const maxBm25Score = Math.max(...bm25Results.map(r => r.score), 1);
 
-    // Create score maps for quick lookup
-    // eslint-disable-next-line @typescript-eslint/no-unused-vars
-    const vectorScoreMap = new Map<string, number>(vectorResults.map(r => [r.id.toString(), r.score / maxVectorScore]));
-    // eslint-disable-next-line @typescript-eslint/no-unused-vars
-    const bm25ScoreMap = new Map<string, number>(bm25Results.map(r => [r.id, r.score / maxBm25Score]));
+    // Index both result lists by id once instead of scanning them per id
+    const vectorById = new Map(vectorResults.map(r => [r.id.toString(), r]));
+    const bm25ById = new Map(bm25Results.map(r => [r.id, r]));
 
     // Get unique document IDs from both searches
-    const allIds = new Set([
-      ...vectorResults.map(r => r.id.toString()),
-      ...bm25Results.map(r => r.id)
-    ]);
+    const allIds = new Set([...vectorById.keys(), ...bm25ById.keys()]);
 
     // Combine scores using weighted average
     let combinedResults: HybridSearchResult[] = [];
 
     for (const id of allIds) {
-      const vectorResult = vectorResults.find(r => r.id.toString() === id);
-      const bm25Result = bm25Results.find(r => r.id === id);
+      const vectorResult = vectorById.get(id);
+      const bm25Result = bm25ById.get(id);
 
       const vectorScore = vectorResult ? vectorResult.score / maxVectorScore : 0;
       const bm25Score = bm25Result ? bm25Result.score / maxBm25Score : 0;
@@ -14,6 +14,8 @@
  */
 
 import { safeLog, safeError, safeWarn } from './pii-redactor';
+import { getMessageContent } from './glm';
+import { API } from '../config/constants';
 
 const GLM_API_URL = "https://api.z.ai/api/paas/v4/chat/completions";
 
@@ -58,14 +60,16 @@ Each query should be designed to find:
 2. County-level Local Rules of Court and specific procedural requirements for this jurisdiction. PRIORITIZE THE "MONDAY MORNING RULE": find procedural technicalities (filing deadlines, ex parte notice times, mandatory forms) that could cause a case to be dismissed.
 3. Case law or legal precedents related to this matter
 
-Return ONLY a JSON array in this exact format:
-[
-  {
-    "query": "specific search query text",
-    "purpose": "what this query is trying to find",
-    "jurisdiction": "applicable jurisdiction if relevant"
-  }
-]
+Return ONLY a JSON object in this exact format:
+{
+  "queries": [
+    {
+      "query": "specific search query text",
+      "purpose": "what this query is trying to find",
+      "jurisdiction": "applicable jurisdiction if relevant"
+    }
+  ]
+}
 `;
 
     const systemPrompt = 'You are a legal research specialist. Return ONLY valid JSON, no markdown or additional text.';
@@ -77,13 +81,14 @@ Return ONLY a JSON array in this exact format:
         'Authorization': `Bearer ${apiKey}`
       },
       body: JSON.stringify({
-        model: "glm-4.7-flash",
+        model: API.GLM_FAST_MODEL,
         messages: [
           { role: "system", content: systemPrompt },
           { role: "user", content: prompt }
         ],
         temperature: 0.1,
-        max_tokens: 1024
+        max_tokens: 1024,
+        response_format: { type: 'json_object' }
       })
     });
 
@@ -92,13 +97,12 @@ Return ONLY a JSON array in this exact format:
     }
 
     const data = await response.json();
-    const responseText = data.choices?.[0]?.message?.content || '[]';
-    
-    // Try to extract JSON from response
-    const jsonMatch = responseText.match(/\[[\s\S]*\]/);
-    const jsonString = jsonMatch ? jsonMatch[0] : '[]';
-    
-    const queries: SearchQuery[] = JSON.parse(jsonString);
+    const parsed: { queries?: SearchQuery[] } = JSON.parse(getMessageContent(data) || '{}');
+    if (!Array.isArray(parsed.queries) || parsed.queries.length === 0) {
+      throw new Error('GLM response did not contain search queries');
+    }
+
+    const queries = parsed.queries;
     safeLog(`Generated ${queries.length} search queries for legal research`);
 
     return queries.slice(0, 3); // Ensure max 3 queries
@@ -179,9 +183,8 @@ export async function executeSearchWithGrounding(
   queries: SearchQuery[],
   apiKey: string
 ): Promise<SearchSnippet[]> {
-  const allSnippets: SearchSnippet[] = [];
-
-  for (const searchQuery of queries) {
+  // Queries are independent; issue them concurrently and keep the input order
+  const allSnippets = await Promise.all(queries.map(async (searchQuery): Promise<SearchSnippet> => {
     try {
       const prompt = `Provide a concise summary of relevant legal information about: ${searchQuery.query}
 
@@ -201,7 +204,7 @@ Keep your response under 200 words.`;
           'Authorization': `Bearer ${apiKey}`
         },
         body: JSON.stringify({
-          model: "glm-4.7-flash",
+          model: API.GLM_MODEL,
           messages: [
             { role: "system", content: systemPrompt },
             { role: "user", content: prompt }
@@ -216,25 +219,25 @@ Keep your response under 200 words.`;
       }
 
       const data = await response.json();
-      const responseText = data.choices?.[0]?.message?.content || 'No information available';
+      const responseText = getMessageContent(data) || 'No information available';
 
-      allSnippets.push({
+      return {
         query: searchQuery.query,
         title: 'Legal Research Summary',
         snippet: responseText.substring(0, 500),
         source: 'GLM Analysis',
-      });
+      };
     } catch (error) {
       safeError(`Search failed for query "${searchQuery.query}":`, error);
       // Add a placeholder snippet
-      allSnippets.push({
+      return {
         query: searchQuery.query,
         title: 'Search Unavailable',
         snippet: `Could not retrieve search results for: ${searchQuery.query}`,
         source: 'Error',
-      });
+      };
     }
-  }
+  }));
 
   safeLog(`Retrieved ${allSnippets.length} search snippets`);
   return allSnippets;
@@ -248,18 +251,16 @@ export function formatSearchContext(snippets: SearchSnippet[]): string {
     return 'No external search context available.';
   }
 
-  let context = 'LEGAL RESEARCH CONTEXT (from AI analysis):\n\n';
-
-  snippets.forEach((snippet, index) => {
-    context += `[Source ${index + 1}]: ${snippet.title}\n`;
-    context += `Query: ${snippet.query}\n`;
-    context += `Analysis: ${snippet.snippet}\n\n`;
-  });
-
-  context += '---\nINSTRUCTIONS: Use ONLY the above Context Data to support your legal analysis. ';
-  context += 'Note: This is AI-generated legal information, not verified legal advice.\n\n';
+  const sources = snippets.map((snippet, index) =>
+    `[Source ${index + 1}]: ${snippet.title}\n` +
+    `Query: ${snippet.query}\n` +
+    `Analysis: ${snippet.snippet}\n\n`
+  );
 
-  return context;
+  return 'LEGAL RESEARCH CONTEXT (from AI analysis):\n\n' +
+    sources.join('') +
+    '---\nINSTRUCTIONS: Use ONLY the above Context Data to support your legal analysis. ' +
+    'Note: This is AI-generated legal information, not verified legal advice.\n\n';
 }
 
 /**
@@ -105,11 +105,30 @@ export class OfflineEvidenceVault {
 
   /**
    * Add evidence to the vault
+   * The insert and the case metadata update share one transaction, so they
+   * commit together instead of as separate IndexedDB writes.
    */
   async addEvidence(item: Omit<EvidenceItem, 'id' | 'createdAt' | 'updatedAt'>): Promise<number> {
     const db = getDatabase();
-    const now = Date.now();
+    // Encrypt before opening the transaction; awaiting WebCrypto inside it would let it auto-commit
+    const prepared = await this.prepareEvidence(item, Date.now());
 
+    let id = 0;
+    await db.transaction('rw', [db.evidence, db.cases], async () => {
+      id = await db.evidence.add(prepared);
+      await this.updateCaseMetadata();
+    });
+
+    return id;
+  }
+
+  /**
+   * Stamp an item for this case and encrypt its OCR text
+   */
+  private async prepareEvidence(
+    item: Omit<EvidenceItem, 'id' | 'createdAt' | 'updatedAt'>,
+    now: number
+  ): Promise<EvidenceItem> {
     const evidenceItem: EvidenceItem = {
       ...item,
       caseId: this.caseId,
@@ -127,12 +146,7 @@ export class OfflineEvidenceVault {
       evidenceItem.ocrText = JSON.stringify(encrypted);
     }
 
-    const id = await db.evidence.add(evidenceItem);
-
-    // Update case metadata
-    await this.updateCaseMetadata();
-
-    return id;
+    return evidenceItem;
   }
 
   /**
@@ -40,6 +40,28 @@ export const NON_NAME_PHRASES = [
 export const STREET_SUFFIXES = 
   'Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Court|Ct|Way|Place|Pl|Circle|Cir|Parkway|Pkwy';
 
+// Address patterns are built from STREET_SUFFIXES, so compile them once here
+// rather than on every redaction (every safeLog call redacts its arguments).
+// Only used with String.match/replace, which reset lastIndex, so the global
+// flag is safe on shared instances.
+const ADDRESS_PATTERN = new RegExp(
+  `\\b\\d+\\s+[A-Za-z]+\\s+(?:${STREET_SUFFIXES})\\b`,
+  'gi'
+);
+
+const CONTEXTUAL_ADDRESS_PATTERNS = [
+  new RegExp(
+    `\\b(?:property|apartment|unit|house|residence|home)\\s+(?:at|located at|is)\\s+\\d+\\s+[A-Za-z]+(?:\\s+(?:${STREET_SUFFIXES}))?\\b`,
+    'gi'
+  ),
+  new RegExp(
+    `\\b(?:live|lives|lived|reside|resides)\\s+(?:at|in)\\s+\\d+\\s+[A-Za-z]+(?:\\s+(?:${STREET_SUFFIXES}))?\\b`,
+    'gi'
+  ),
+];
+
+const ADDRESS_NUMBER_PATTERN = new RegExp(`\\d+\\s+[A-Za-z]+(?:\\s+[A-Za-z]+)?(?:\\s+(?:${STREET_SUFFIXES}))?`, 'i');
+
 /**
  * Pass 1: Fast regex-based PII redaction
  * Handles structured PII: emails, phones, SSN, addresses, case numbers
@@ -112,13 +134,9 @@ export function redactPIIRegex(text: string): { redacted: string; redactedFields
   }
 
   // Street addresses (comprehensive pattern)
-  const addressPattern = new RegExp(
-    `\\b\\d+\\s+[A-Za-z]+\\s+(?:${STREET_SUFFIXES})\\b`,
-    'gi'
-  );
-  if (redacted.match(addressPattern)) {
+  if (redacted.match(ADDRESS_PATTERN)) {
     redactedFields.push('address');
-    redacted = redacted.replace(addressPattern, '[ADDRESS_REDACTED]');
+    redacted = redacted.replace(ADDRESS_PATTERN, '[ADDRESS_REDACTED]');
     count++;
   }
 
@@ -236,24 +254,13 @@ export function redactContextualEntities(text: string): { redacted: string; reda
 
   // Contextual address references (e.g., "the property at 123 Main", "located at 456 Oak")
   // Note: Pass 1 may have already caught some of these, so we look for remaining patterns
-  const contextualAddressPatterns = [
-    new RegExp(
-      `\\b(?:property|apartment|unit|house|residence|home)\\s+(?:at|located at|is)\\s+\\d+\\s+[A-Za-z]+(?:\\s+(?:${STREET_SUFFIXES}))?\\b`,
-      'gi'
-    ),
-    new RegExp(
-      `\\b(?:live|lives|lived|reside|resides)\\s+(?:at|in)\\s+\\d+\\s+[A-Za-z]+(?:\\s+(?:${STREET_SUFFIXES}))?\\b`,
-      'gi'
-    ),
-  ];
-
-  for (const pattern of contextualAddressPatterns) {
+  for (const pattern of CONTEXTUAL_ADDRESS_PATTERNS) {
     const matches = redacted.match(pattern);
     if (matches && matches.length > 0) {
       redactedFields.push('contextual_address');
       for (const match of matches) {
         // Redact the entire phrase including the address number
-        const addressNumMatch = match.match(new RegExp(`\\d+\\s+[A-Za-z]+(?:\\s+[A-Za-z]+)?(?:\\s+(?:${STREET_SUFFIXES}))?`, 'i'));
+        const addressNumMatch = match.match(ADDRESS_NUMBER_PATTERN);
         if (addressNumMatch) {
           redacted = redacted.replace(addressNumMatch[0], '[ADDRESS_REDACTED]');
           count++;
@@ -56,6 +56,18 @@ export function safeLog(message: string, ...data: unknown[]): void {
   console.log(`${logPrefix}${redacted.redacted}`, ...redactedData);
 }
 
+/**
+ * Debug logging for hot paths (per-request/per-chunk chatter)
+ * No-op unless LOG_LEVEL=debug, so the PII redaction pass is skipped entirely
+ */
+export function safeDebug(message: string, ...data: unknown[]): void {
+  if (process.env.LOG_LEVEL !== 'debug') {
+    return;
+  }
+
+  safeLog(message, ...data);
+}
+
 /**
  * Safe error logging that redacts PII
  */
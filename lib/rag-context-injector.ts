@@ -61,6 +61,23 @@ export interface Deadline {
   statuteReference?: string;
 }
 
+// Map jurisdiction names to file codes
+const JURISDICTION_FILE_CODES: Record<string, string> = {
+  'california': 'CA', 'ca': 'CA',
+  'new york': 'NY', 'ny': 'NY',
+  'texas': 'TX', 'tx': 'TX',
+  'florida': 'FL', 'fl': 'FL',
+  'illinois': 'IL', 'il': 'IL',
+  'pennsylvania': 'PA', 'pa': 'PA',
+  'ohio': 'OH',
+  'georgia': 'GA',
+  'wisconsin': 'WI', 'wi': 'WI',
+};
+
+// Static rules files by state code; they only change on deploy, so each one
+// is fetched and parsed at most once per instance
+const staticRulesCache = new Map<string, Promise<JurisdictionRules | null>>();
+
 /**
  * Load jurisdiction-specific rules from filesystem
  * Falls back to vector search if static files aren't available
@@ -75,31 +92,12 @@ export async function loadJurisdictionRules(
   const { userInput, category } = options || {};
   
   try {
-    // Map jurisdiction names to file codes
-    const jurisdictionMap: Record<string, string> = {
-      'california': 'CA', 'ca': 'CA',
-      'new york': 'NY', 'ny': 'NY',
-      'texas': 'TX', 'tx': 'TX',
-      'florida': 'FL', 'fl': 'FL',
-      'illinois': 'IL', 'il': 'IL',
-      'pennsylvania': 'PA', 'pa': 'PA',
-      'ohio': 'OH',
-      'georgia': 'GA',
-      'wisconsin': 'WI', 'wi': 'WI',
-    };
-
-    const stateCode = jurisdictionMap[jurisdiction.toLowerCase()] || jurisdiction.substring(0, 2).toUpperCase();
-    
-    // Try to load from public/data/jurisdictions/
-    const rulesPath = `/data/jurisdictions/${stateCode}.json`;
+    const stateCode = JURISDICTION_FILE_CODES[jurisdiction.toLowerCase()] || jurisdiction.substring(0, 2).toUpperCase();
     
     safeLog(`[RAG Injector] Loading jurisdiction rules for ${jurisdiction} (${stateCode})`);
 
-    // In browser/edge runtime, fetch from public directory
-    const response = await fetch(rulesPath);
-    
-    if (response.ok) {
-      const rules: JurisdictionRules = await response.json();
+    const rules = await loadStaticJurisdictionRules(stateCode);
+    if (rules) {
       safeLog(`[RAG Injector] Loaded ${rules.rules?.length || 0} rules for ${stateCode}`);
       return rules;
     }
@@ -137,6 +135,34 @@ export async function loadJurisdictionRules(
   }
 }
 
+/**
+ * Fetch a state's static rules file, memoized by state code.
+ * Misses and failures are not cached so they are retried on the next request.
+ */
+async function loadStaticJurisdictionRules(stateCode: string): Promise<JurisdictionRules | null> {
+  const cached = staticRulesCache.get(stateCode);
+  if (cached) {
+    return cached;
+  }
+
+  // In browser/edge runtime, fetch from public/data/jurisdictions/
+  const pending = fetch(`/data/jurisdictions/${stateCode}.json`).then(response =>
+    response.ok ? response.json() as Promise<JurisdictionRules> : null
+  );
+  staticRulesCache.set(stateCode, pending);
+
+  try {
+    const rules = await pending;
+    if (!rules) {
+      staticRulesCache.delete(stateCode);
+    }
+    return rules;
+  } catch (error) {
+    staticRulesCache.delete(stateCode);
+    throw error;
+  }
+}
+
 /**
  * Perform vector similarity search as RAG fallback
  */
@@ -364,26 +390,27 @@ export function buildEnhancedSystemPrompt(
   return parts.join('\n');
 }
 
+// Practice areas and the keywords that signal them
+const CASE_CATEGORIES: Record<string, string[]> = {
+  'Housing': ['eviction', 'landlord', 'tenant', 'lease', 'rent', 'deposit', 'housing', 'rental', 'foreclosure'],
+  'Family': ['custody', 'divorce', 'support', 'visitation', 'child', 'spouse', 'marriage', 'family'],
+  'Employment': ['employment', 'worker', 'wage', 'discrimination', 'harassment', 'termination', 'layoff'],
+  'Personal Injury': ['injury', 'accident', 'negligence', 'liability', 'slip', 'fall', 'car accident'],
+  'Criminal': ['criminal', 'arrest', 'charge', 'defense', 'misdemeanor', 'felony', 'court appointed'],
+  'Bankruptcy': ['bankruptcy', 'debt', 'creditor', 'loan', 'foreclosure', 'chapter 7', 'chapter 13'],
+  'Immigration': ['immigration', 'visa', 'deportation', 'citizenship', 'green card', 'asylum'],
+  'Consumer': ['consumer', 'fraud', 'scam', 'warranty', 'product', 'credit report', 'debt collection'],
+  'Civil Rights': ['civil rights', 'discrimination', 'harassment', 'ada', 'disability', 'voting'],
+  'Estate': ['will', 'trust', 'probate', 'estate', 'inheritance', 'beneficiary'],
+  'Business': ['contract', 'business', 'partnership', 'corporation', 'llc', 'commercial'],
+};
+
 /**
  * Get category from user input (for RAG metadata filtering)
  * 
  * Maps keywords to legal practice areas for better RAG filtering
  */
 export function detectCaseCategory(userInput: string): string {
-  const CASE_CATEGORIES: Record<string, string[]> = {
-    'Housing': ['eviction', 'landlord', 'tenant', 'lease', 'rent', 'deposit', 'housing', 'rental', 'foreclosure'],
-    'Family': ['custody', 'divorce', 'support', 'visitation', 'child', 'spouse', 'marriage', 'family'],
-    'Employment': ['employment', 'worker', 'wage', 'discrimination', 'harassment', 'termination', 'layoff'],
-    'Personal Injury': ['injury', 'accident', 'negligence', 'liability', 'slip', 'fall', 'car accident'],
-    'Criminal': ['criminal', 'arrest', 'charge', 'defense', 'misdemeanor', 'felony', 'court appointed'],
-    'Bankruptcy': ['bankruptcy', 'debt', 'creditor', 'loan', 'foreclosure', 'chapter 7', 'chapter 13'],
-    'Immigration': ['immigration', 'visa', 'deportation', 'citizenship', 'green card', 'asylum'],
-    'Consumer': ['consumer', 'fraud', 'scam', 'warranty', 'product', 'credit report', 'debt collection'],
-    'Civil Rights': ['civil rights', 'discrimination', 'harassment', 'ada', 'disability', 'voting'],
-    'Estate': ['will', 'trust', 'probate', 'estate', 'inheritance', 'beneficiary'],
-    'Business': ['contract', 'business', 'partnership', 'corporation', 'llc', 'commercial'],
-  };
-
   const inputLower = userInput.toLowerCase();
   let bestMatch: { category: string; score: number } | null = null;
 
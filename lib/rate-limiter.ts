@@ -4,7 +4,7 @@
  */
 
 import { headers } from 'next/headers';
-import { safeLog, safeWarn } from './pii-redactor';
+import { safeLog, safeDebug, safeWarn } from './pii-redactor';
 import { RATE_LIMIT_CONFIG, simpleHash } from './rate-limiter-client';
 
 export { RATE_LIMIT_CONFIG };
@@ -112,7 +112,7 @@ export async function checkRateLimit(): Promise<{ allowed: boolean; remaining: n
       await redis.zadd(key, { score: now, member: `${now}-${Math.random()}` });
       await redis.expire(key, Math.ceil(RATE_LIMIT_CONFIG.windowMs / 1000) + 60);
 
-      safeLog(`Rate limit check passed for client: ${clientId.substring(0, 8)}... (${remaining} remaining)`);
+      safeDebug(`Rate limit check passed for client: ${clientId.substring(0, 8)}... (${remaining} remaining)`);
       return { allowed: true, remaining: remaining - 1, resetAt };
     } else {
       cleanupMemoryStore();
@@ -138,7 +138,7 @@ export async function checkRateLimit(): Promise<{ allowed: boolean; remaining: n
         expiresAt: now + RATE_LIMIT_CONFIG.windowMs + 60000,
       });
 
-      safeLog(`Rate limit check passed for client: ${clientId.substring(0, 8)}... (${remaining} remaining, memory store)`);
+      safeDebug(`Rate limit check passed for client: ${clientId.substring(0, 8)}... (${remaining} remaining, memory store)`);
       return { allowed: true, remaining: remaining - 1, resetAt };
     }
   } catch (error) {
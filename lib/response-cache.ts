@@ -0,0 +1,70 @@
+/**
+ * Analysis Response Cache
+ *
+ * Stores completed analyze results keyed by a SHA-256 hash of the normalized
+ * request (user input, jurisdiction, documents). An identical request skips
+ * research and the GLM call entirely.
+ *
+ * Uses the shared Upstash Redis client when configured, otherwise a bounded
+ * in-memory map (per serverless instance).
+ */
+
+import { KEY_PREFIX } from './redis';
+import { createTtlCache } from './ttl-cache';
+import { RESPONSE_CACHE } from '../config/constants';
+
+export interface CachedAnalysis {
+  text: string;
+  sources: Array<{ title: string; uri?: string }>;
+}
+
+const analysisCache = createTtlCache<CachedAnalysis>({
+  name: 'Response Cache',
+  ttlSeconds: RESPONSE_CACHE.TTL_SECONDS,
+  maxMemoryEntries: RESPONSE_CACHE.MAX_MEMORY_ENTRIES,
+});
+
+function normalize(text: string): string {
+  return text.trim().replace(/\s+/g, ' ').toLowerCase();
+}
+
+/**
+ * Build the cache key for an analysis request
+ */
+export async function getAnalysisCacheKey(
+  userInput: string,
+  jurisdiction: string,
+  documents: string[] = []
+): Promise<string> {
+  const payload = JSON.stringify([normalize(userInput), normalize(jurisdiction), documents.map(normalize)]);
+  const hashBuffer = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(payload));
+  const hash = Array.from(new Uint8Array(hashBuffer)).map(b => b.toString(16).padStart(2, '0')).join('');
+  return `${KEY_PREFIX}analysis:${hash}`;
+}
+
+/**
+ * Look up a cached analysis. Returns null on miss or cache failure.
+ */
+export async function getCachedAnalysis(key: string): Promise<CachedAnalysis | null> {
+  return analysisCache.get(key);
+}
+
+/**
+ * Store a completed analysis. Only complete, schema-valid analyses with every
+ * citation verified are stored, so a repaired fallback or a citation redacted
+ * during a transient verification outage isn't replayed for the whole TTL.
+ * Failures are logged and otherwise ignored.
+ * @returns Whether the analysis was handed to the cache
+ */
+export async function setCachedAnalysis(key: string, value: CachedAnalysis, isCacheable: boolean): Promise<boolean> {
+  if (!isCacheable) return false;
+  await analysisCache.set(key, value);
+  return true;
+}
+
+/**
+ * NDJSON body replaying a cached analysis as the stream's final `complete` event
+ */
+export function formatCachedAnalysisReplay(cached: CachedAnalysis): string {
+  return JSON.stringify({ type: 'complete', result: cached }) + '\n';
+}
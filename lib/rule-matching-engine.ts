@@ -14,8 +14,7 @@
  * - Sticky header display data for deadline countdown
  */
 
-// eslint-disable-next-line @typescript-eslint/no-unused-vars
-import { safeLog, safeWarn } from './pii-redactor';
+import { safeLog } from './pii-redactor';
 import { calculateLegalDeadline, isCourtDay, Jurisdiction } from '../src/utils/legal-calendar';
 
 /**
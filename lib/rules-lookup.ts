@@ -211,37 +211,28 @@ export function calculateDeadline(startDate: Date, days: number, jurisdiction: J
  * Get all available state codes
  */
 export async function getAvailableStates(): Promise<Array<{ code: string; name: string }>> {
-  const states: Array<{ code: string; name: string }> = [];
-  
-  // Load federal rules first
-  try {
-    const federalResponse = await fetch(`${LEGAL_DATA.RULES_DIR}/federal.json`);
-    if (federalResponse.ok) {
-      states.push({ code: 'US', name: 'Federal' });
-    }
-  } catch {
-    // Ignore
-  }
-  
-  // Check each state code
-  for (const [, code] of Object.entries(LEGAL_DATA.STATE_CODE_ALIASES)) {
-    // Avoid duplicates
-    if (!states.find(s => s.code === code)) {
-      try {
-        const response = await fetch(`${LEGAL_DATA.RULES_DIR}/${code.toLowerCase()}.json`);
-        if (response.ok) {
-          const rules = await response.json() as StateRules;
-          states.push({
-            code,
-            name: rules.jurisdiction || code,
-          });
-        }
-      } catch {
-        // Skip states that don't have rules files
-      }
+  // Load federal rules alongside every state file; each is a separate request
+  const federalLookup = fetch(`${LEGAL_DATA.RULES_DIR}/federal.json`)
+    .then(response => (response.ok ? { code: 'US', name: 'Federal' } : null))
+    .catch(() => null);
+
+  // Check each state code once; several aliases map to the same code
+  const stateCodes = new Set<string>(Object.values(LEGAL_DATA.STATE_CODE_ALIASES));
+  const stateLookups = Array.from(stateCodes, async code => {
+    try {
+      const response = await fetch(`${LEGAL_DATA.RULES_DIR}/${code.toLowerCase()}.json`);
+      if (!response.ok) return null;
+      const rules = await response.json() as StateRules;
+      return { code, name: rules.jurisdiction || code };
+    } catch {
+      // Skip states that don't have rules files
+      return null;
     }
-  }
-  
+  });
+
+  const states = (await Promise.all([federalLookup, ...stateLookups]))
+    .filter((state): state is { code: string; name: string } => state !== null);
+
   return states.sort((a, b) => a.name.localeCompare(b.name));
 }
 
@@ -1,4 +1,6 @@
 import { safeError, safeWarn } from './pii-redactor';
+import { getMessageContent } from './glm';
+import { API } from '../config/constants';
 
 const GLM_API_URL = "https://api.z.ai/api/paas/v4/chat/completions";
 
@@ -21,7 +23,7 @@ export async function generateSearchQueries(
     Generate exactly 3 targeted search queries to research this legal matter thoroughly.
     Focus on local rules, statutory precedents, and procedural requirements.
 
-    Respond with ONLY a JSON array of 3 search queries, nothing else.
+    Respond with ONLY a JSON object of the form {"queries": ["...", "...", "..."]}, nothing else.
   `;
 
   const systemPrompt = `You are a legal research specialist. Given a user's legal situation and jurisdiction,
@@ -31,7 +33,7 @@ export async function generateSearchQueries(
   2. Statutory precedents relevant to the legal issue
   3. Case law or procedural requirements for the specific type of case
 
-  Return ONLY an array of 3 search queries as a JSON array, nothing else.`;
+  Return ONLY a JSON object with a "queries" array of 3 search queries, nothing else.`;
 
   try {
     const response = await fetch(GLM_API_URL, {
@@ -41,13 +43,14 @@ export async function generateSearchQueries(
         'Authorization': `Bearer ${glmApiKey}`
       },
       body: JSON.stringify({
-        model: "glm-4.7-flash",
+        model: API.GLM_FAST_MODEL,
         messages: [
           { role: "system", content: systemPrompt },
           { role: "user", content: prompt }
         ],
         temperature: 0.1,
-        max_tokens: 512
+        max_tokens: 512,
+        response_format: { type: 'json_object' }
       })
     });
 
@@ -56,31 +59,18 @@ export async function generateSearchQueries(
     }
 
     const data = await response.json();
-    const responseText = data.choices?.[0]?.message?.content || '[]';
+    const responseText = getMessageContent(data) || '{}';
 
-    // Try to extract JSON from response
-    const jsonMatch = responseText.match(/\[[\s\S]*\]/);
-    const jsonString = jsonMatch ? jsonMatch[0] : '[]';
-    
     try {
-      return JSON.parse(jsonString);
-    } catch {
-      // If JSON parsing fails, try to extract an array-like structure
-      const matches = responseText.match(/\[(.*?)\]/);
-      if (matches) {
-        const arrayContent = matches[1];
-        // Split by commas and clean up quotes
-        const queries = arrayContent
-          .split(',')
-          .map((query: string) => query.trim().replace(/^["']|["']$/g, ''))
-          .filter((query: string) => query.length > 0);
-
-        if (queries.length >= 3) {
+      const parsed: { queries?: unknown } = JSON.parse(responseText);
+      if (Array.isArray(parsed.queries)) {
+        const queries = parsed.queries.filter((query): query is string => typeof query === 'string' && query.trim().length > 0);
+        if (queries.length > 0) {
           return queries.slice(0, 3);
         }
       }
-
-      // If all parsing fails, return default queries
+      safeWarn('GLM response did not contain search queries:', responseText);
+    } catch {
       safeWarn('Failed to parse search queries from GLM response:', responseText);
     }
   } catch (error) {
@@ -105,9 +95,9 @@ export async function executeSearchQueries(
   queries: string[],
   glmApiKey: string
 ): Promise<unknown[]> {
-  const results: unknown[] = [];
-
-  for (const query of queries) {
+  // Queries are independent; run them concurrently so the step takes as long
+  // as the slowest query rather than their sum. Results keep query order.
+  return Promise.all(queries.map(async (query) => {
     try {
       const prompt = `Provide relevant legal information about: ${query}`;
       
@@ -118,7 +108,7 @@ export async function executeSearchQueries(
           'Authorization': `Bearer ${glmApiKey}`
         },
         body: JSON.stringify({
-          model: "glm-4.7-flash",
+          model: API.GLM_MODEL,
           messages: [
             { role: "system", content: 'You are a legal research assistant.' },
             { role: "user", content: prompt }
@@ -133,24 +123,22 @@ export async function executeSearchQueries(
       }
 
       const data = await response.json();
-      const responseText = data.choices?.[0]?.message?.content || 'No information available';
+      const responseText = getMessageContent(data) || 'No information available';
 
-      results.push({
+      return {
         query,
         search_results: responseText,
         timestamp: new Date().toISOString()
-      });
+      };
     } catch (error) {
       safeError(`Error executing search query "${query}":`, error);
-      results.push({
+      return {
         query,
         search_results: `Error executing search: ${(error as Error).message}`,
         timestamp: new Date().toISOString()
-      });
+      };
     }
-  }
-
-  return results;
+  }));
 }
 
 /**
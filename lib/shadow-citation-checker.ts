@@ -9,9 +9,9 @@
  * This provides a "hard-gate" that can block downloads if citations are unverified.
  */
 
-// eslint-disable-next-line @typescript-eslint/no-unused-vars
-import { safeLog, safeWarn, safeError } from './pii-redactor';
+import { safeLog, safeDebug, safeError } from './pii-redactor';
 import type { JurisdictionRules } from './rag-context-injector';
+import { CITATION_VERIFICATION } from '../config/constants';
 
 /**
  * Citation verification result
@@ -30,29 +30,43 @@ export interface CitationVerification {
   };
 }
 
+/**
+ * Citation patterns, compiled once at module load
+ */
+const CITATION_PATTERNS = [
+  // Federal statutes: 12 U.S.C. § 345, 15 U.S.C. § 1234
+  /\d+\s+[A-Z]\.[A-Z]\.[A-Z]\.?\s+§?\s*\d+[a-z]?/gi,
+  // California statutes: Cal. Civ. Code § 1708, CCP § 412.20
+  /Cal\.?\s+(?:Civ\.?\s+)?(?:Code|Penal|Civil|Probate|Family|Evidence|Corp)\s+§?\s*\d+[a-z]?/gi,
+  /CCP\s+§?\s*\d+[a-z]?/gi,
+  // State statutes: Wis. Stat. § 823.01, N.Y. Civ. Prac. L. & R. § 3211
+  /[A-Z][a-z]+\.?\s+(?:Stat\.?|Code|Crim\.?\s+Proc\.?)\s+§?\s*\d+(?:\.\d+)?[a-z]?/gi,
+  // Court rules: Fed. R. Civ. P. 12(b)(6), Cal. Rules of Court, rule 3.1324
+  /Fed\.?\s+R\.?\s+(?:Civ\.?\s+)?P\.?\s+\d+(?:[a-z]|\(\d+\))?/gi,
+  /Cal\.?\s+Rules\s+of\s+Court,?\s+rule\s+\d+(?:\.\d+)?/gi,
+  /Local\s+Rule\s+\d+(?:\.\d+)?[a-z]?/gi,
+  // Case citations: 123 F.3d 456, 123 Cal.App.5th 789
+  /\d+\s+(?:F\.?\d+d?|F\.?\s+Supp\.?\s*\d*d?|Cal\.?\s+(?:App\.?\s*)?\d*|S\.?\s+Ct\.?|L\.?\s+Ed\.?\s*\d*)\s+\d+/gi,
+];
+
+/**
+ * Cheap probe for text that could match any CITATION_PATTERNS entry: every
+ * pattern needs either a number followed by a reporter/code letter or one of
+ * these words. Citation-free text fails it and skips the full pattern scan.
+ */
+const CITATION_HINT = /\d\s+[a-z]|cal|ccp|stat|code|crim|fed|local/i;
+
 /**
  * Extract all legal citations from text
  */
 export function extractCitations(content: string): string[] {
-  const citationPatterns = [
-    // Federal statutes: 12 U.S.C. § 345, 15 U.S.C. § 1234
-    /\d+\s+[A-Z]\.[A-Z]\.[A-Z]\.?\s+§?\s*\d+[a-z]?/gi,
-    // California statutes: Cal. Civ. Code § 1708, CCP § 412.20
-    /Cal\.?\s+(?:Civ\.?\s+)?(?:Code|Penal|Civil|Probate|Family|Evidence|Corp)\s+§?\s*\d+[a-z]?/gi,
-    /CCP\s+§?\s*\d+[a-z]?/gi,
-    // State statutes: Wis. Stat. § 823.01, N.Y. Civ. Prac. L. & R. § 3211
-    /[A-Z][a-z]+\.?\s+(?:Stat\.?|Code|Crim\.?\s+Proc\.?)\s+§?\s*\d+(?:\.\d+)?[a-z]?/gi,
-    // Court rules: Fed. R. Civ. P. 12(b)(6), Cal. Rules of Court, rule 3.1324
-    /Fed\.?\s+R\.?\s+(?:Civ\.?\s+)?P\.?\s+\d+(?:[a-z]|\(\d+\))?/gi,
-    /Cal\.?\s+Rules\s+of\s+Court,?\s+rule\s+\d+(?:\.\d+)?/gi,
-    /Local\s+Rule\s+\d+(?:\.\d+)?[a-z]?/gi,
-    // Case citations: 123 F.3d 456, 123 Cal.App.5th 789
-    /\d+\s+(?:F\.?\d+d?|F\.?\s+Supp\.?\s*\d*d?|Cal\.?\s+(?:App\.?\s*)?\d*|S\.?\s+Ct\.?|L\.?\s+Ed\.?\s*\d*)\s+\d+/gi,
-  ];
+  if (!CITATION_HINT.test(content)) {
+    return [];
+  }
 
   const citations = new Set<string>();
 
-  for (const pattern of citationPatterns) {
+  for (const pattern of CITATION_PATTERNS) {
     const matches = content.match(pattern) || [];
     for (const match of matches) {
       const normalized = match.trim().replace(/\s+/g, ' ');
@@ -173,38 +187,41 @@ function verifyCitationAgainstRules(
   };
 }
 
+/**
+ * Citation formats recognized per jurisdiction (pattern fallback)
+ */
+const JURISDICTION_CITATION_PATTERNS: Record<string, RegExp[]> = {
+  'California': [
+    /Cal\.?\s+(?:Civ\.?\s+)?Code\s+§\s*\d+/i,
+    /CCP\s+§\s*\d+/i,
+    /Cal\.?\s+Rules\s+of\s+Court/i,
+  ],
+  'Federal': [
+    /\d+\s+U\.?S\.?C\.?\s+§\s*\d+/i,
+    /Fed\.?\s+R\.?\s+Civ\.?\s+P\.?\s+\d+/i,
+  ],
+  'New York': [
+    /N\.?Y\.?\s+(?:Civ\.?\s+)?Prac\.?\s+L\.?\s+&?\s*R\.?/i,
+    /N\.?Y\.?\s+C\.?P\.?L\.?R\.?\s+§?\s*\d+/i,
+  ],
+  'Texas': [
+    /Tex\.?\s+(?:Civ\.?\s+)?Prac\.?\s+&?\s*Rem\.?\s+Code/i,
+    /Tex\.?\s+Rules\s+of\s+Civ\.?\s+Proc\.?/i,
+  ],
+  'Florida': [
+    /Fla\.?\s+Stat\.?\s+§\s*\d+/i,
+    /Fla\.?\s+Rules\s+of\s+Civ\.?\s+Proc\.?/i,
+  ],
+  'Wisconsin': [
+    /Wis\.?\s+Stat\.?\s+§\s*\d+(?:\.\d+)?/i,
+  ],
+};
+
 /**
  * Pattern-based citation validation (fallback)
  */
 function validateCitationPattern(citation: string, jurisdiction: string): CitationVerification {
-  const jurisdictionPatterns: Record<string, RegExp[]> = {
-    'California': [
-      /Cal\.?\s+(?:Civ\.?\s+)?Code\s+§\s*\d+/i,
-      /CCP\s+§\s*\d+/i,
-      /Cal\.?\s+Rules\s+of\s+Court/i,
-    ],
-    'Federal': [
-      /\d+\s+U\.?S\.?C\.?\s+§\s*\d+/i,
-      /Fed\.?\s+R\.?\s+Civ\.?\s+P\.?\s+\d+/i,
-    ],
-    'New York': [
-      /N\.?Y\.?\s+(?:Civ\.?\s+)?Prac\.?\s+L\.?\s+&?\s*R\.?/i,
-      /N\.?Y\.?\s+C\.?P\.?L\.?R\.?\s+§?\s*\d+/i,
-    ],
-    'Texas': [
-      /Tex\.?\s+(?:Civ\.?\s+)?Prac\.?\s+&?\s*Rem\.?\s+Code/i,
-      /Tex\.?\s+Rules\s+of\s+Civ\.?\s+Proc\.?/i,
-    ],
-    'Florida': [
-      /Fla\.?\s+Stat\.?\s+§\s*\d+/i,
-      /Fla\.?\s+Rules\s+of\s+Civ\.?\s+Proc\.?/i,
-    ],
-    'Wisconsin': [
-      /Wis\.?\s+Stat\.?\s+§\s*\d+(?:\.\d+)?/i,
-    ],
-  };
-
-  const patterns = jurisdictionPatterns[jurisdiction] || [];
+  const patterns = JURISDICTION_CITATION_PATTERNS[jurisdiction] || [];
   
   for (const pattern of patterns) {
     if (pattern.test(citation)) {
@@ -250,11 +267,11 @@ export function runShadowCitationCheck(
   canProceed: boolean;
   hardGateBlocked: boolean;
 } {
-  safeLog(`[Shadow Citation Check] Starting verification for ${jurisdiction}`);
+  safeDebug(`[Shadow Citation Check] Starting verification for ${jurisdiction}`);
 
   // Extract all citations
   const allCitations = extractCitations(content);
-  safeLog(`[Shadow Citation Check] Found ${allCitations.length} citations to verify`);
+  safeDebug(`[Shadow Citation Check] Found ${allCitations.length} citations to verify`);
 
   if (allCitations.length === 0) {
     return {
@@ -360,6 +377,12 @@ export function generateCitationReport(
   };
 }
 
+export interface LiveCitationVerification {
+  citation: string;
+  is_verified: boolean;
+  details?: string;
+}
+
 /**
  * Perform live verification of citations using the verify-citation API
  * 
@@ -369,32 +392,110 @@ export async function verifyCitationsLive(
   citations: string[],
   jurisdiction: string,
   baseUrl: string
-): Promise<Array<{ citation: string; is_verified: boolean; details?: string }>> {
-  const results = [];
-  
-  for (const citation of citations) {
+): Promise<LiveCitationVerification[]> {
+  if (citations.length === 0) return [];
+
+  // Spacing variants of the same citation ("42 U.S.C. §1983" and
+  // "42 U.S.C. § 1983") are looked up once and the result shared
+  const uniqueCitations: string[] = [];
+  const uniqueIndexByKey = new Map<string, number>();
+  const uniqueIndexes = citations.map(citation => {
+    const key = normalizeCitationKey(citation);
+    let uniqueIndex = uniqueIndexByKey.get(key);
+    if (uniqueIndex === undefined) {
+      uniqueIndex = uniqueCitations.push(citation) - 1;
+      uniqueIndexByKey.set(key, uniqueIndex);
+    }
+    return uniqueIndex;
+  });
+
+  // One batch request per MAX_BATCH_SIZE citations instead of one request
+  // per citation. The endpoint already runs MAX_CONCURRENT_LOOKUPS lookups
+  // at once, so batches go one after another to keep CourtListener load at
+  // that limit
+  const batches: string[][] = [];
+  for (let i = 0; i < uniqueCitations.length; i += CITATION_VERIFICATION.MAX_BATCH_SIZE) {
+    batches.push(uniqueCitations.slice(i, i + CITATION_VERIFICATION.MAX_BATCH_SIZE));
+  }
+
+  const verifyBatch = async (batch: string[]): Promise<LiveCitationVerification[]> => {
     try {
       const response = await fetch(`${baseUrl}/api/verify-citation`, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ citation, jurisdiction, strict_mode: true }),
+        body: JSON.stringify({ citations: batch, jurisdiction, strict_mode: true }),
       });
       
       if (response.ok) {
-        const data = await response.json();
-        results.push({
+        const data = await response.json() as { results?: Array<{ is_verified?: boolean; details?: string }> };
+        return batch.map((citation, index) => ({
           citation,
-          is_verified: data.is_verified,
-          details: data.details,
-        });
-      } else {
-        results.push({ citation, is_verified: false, details: 'Verification service error' });
+          is_verified: data.results?.[index]?.is_verified === true,
+          details: data.results?.[index]?.details,
+        }));
       }
+      return batch.map(citation => ({ citation, is_verified: false, details: 'Verification service error' }));
     } catch (error) {
-      safeError(`Live verification failed for ${citation}:`, error);
-      results.push({ citation, is_verified: false, details: 'Network error during verification' });
+      safeError(`Live verification failed for ${batch.length} citation(s):`, error);
+      return batch.map(citation => ({ citation, is_verified: false, details: 'Network error during verification' }));
     }
+  };
+
+  const uniqueResults: LiveCitationVerification[] = [];
+  for (const batch of batches) {
+    uniqueResults.push(...await verifyBatch(batch));
   }
-  
-  return results;
+
+  // Report against each caller's original text, which is what gets redacted
+  return citations.map((citation, index) => ({
+    ...uniqueResults[uniqueIndexes[index]],
+    citation,
+  }));
+}
+
+/**
+ * Live-verify citations, reusing the results of a check started before the
+ * final list was known (e.g. while the analysis was still streaming) for
+ * every citation it already covered. Only citations the early check didn't see are looked
+ * up, so a final list that differs from the early one (reordered, extended or
+ * trimmed) costs no repeated CourtListener calls.
+ */
+export async function verifyCitationsWithEarlyCheck(
+  citations: string[],
+  jurisdiction: string,
+  baseUrl: string,
+  earlyResults: Promise<LiveCitationVerification[]> | null
+): Promise<LiveCitationVerification[]> {
+  if (!earlyResults) {
+    return verifyCitationsLive(citations, jurisdiction, baseUrl);
+  }
+
+  const known = new Map<string, LiveCitationVerification>();
+  try {
+    for (const result of await earlyResults) {
+      known.set(normalizeCitationKey(result.citation), result);
+    }
+  } catch (error) {
+    safeError('Early citation check failed, verifying every citation:', error);
+  }
+
+  const missing = citations.filter(citation => !known.has(normalizeCitationKey(citation)));
+  if (missing.length > 0) {
+    for (const result of await verifyCitationsLive(missing, jurisdiction, baseUrl)) {
+      known.set(normalizeCitationKey(result.citation), result);
+    }
+  }
+
+  // Report against each caller's original text, which is what gets redacted
+  return citations.map(citation => ({
+    ...known.get(normalizeCitationKey(citation))!,
+    citation,
+  }));
+}
+
+/**
+ * Dedupe key for a citation: trimmed, single-spaced, one space after §
+ */
+function normalizeCitationKey(citation: string): string {
+  return citation.trim().replace(/\s+/g, ' ').replace(/§ ?/g, '§ ');
 }
@@ -74,6 +74,22 @@ export interface LegalArgument {
   counterMeasure?: string;  // Expected opposition response
 }
 
+// Map motion types to template files
+const MOTION_TEMPLATE_FILES: Record<string, string> = {
+  'motion_to_dismiss': 'motion_to_dismiss',
+  'motion_for_discovery': 'motion_for_discovery',
+  'motion_for_summary_judgment': 'motion_for_summary_judgment',
+  'motion_to_quash': 'motion_to_quash',
+  'motion_for_continuance': 'motion_for_continuance',
+  'ex_parte_application': 'ex_parte_application',
+  'complaint': 'complaint',
+  'answer': 'answer',
+};
+
+// Parsed templates by jurisdiction and motion type; templates are static
+// assets, so each one is fetched and parsed at most once
+const motionTemplateCache = new Map<string, Promise<MotionTemplate | null>>();
+
 /**
  * Load verified motion template from filesystem
  */
@@ -81,20 +97,29 @@ export async function loadMotionTemplate(
   jurisdiction: string,
   motionType: string
 ): Promise<MotionTemplate | null> {
-  try {
-    // Map motion types to template files
-    const templateMap: Record<string, string> = {
-      'motion_to_dismiss': 'motion_to_dismiss',
-      'motion_for_discovery': 'motion_for_discovery',
-      'motion_for_summary_judgment': 'motion_for_summary_judgment',
-      'motion_to_quash': 'motion_to_quash',
-      'motion_for_continuance': 'motion_for_continuance',
-      'ex_parte_application': 'ex_parte_application',
-      'complaint': 'complaint',
-      'answer': 'answer',
-    };
+  const cacheKey = `${jurisdiction.toUpperCase()}/${motionType}`;
+  const cached = motionTemplateCache.get(cacheKey);
+  if (cached) {
+    return cached;
+  }
 
-    const templateName = templateMap[motionType];
+  const pending = fetchMotionTemplate(jurisdiction, motionType);
+  motionTemplateCache.set(cacheKey, pending);
+
+  const template = await pending;
+  if (!template) {
+    // Don't pin misses or transient failures
+    motionTemplateCache.delete(cacheKey);
+  }
+  return template;
+}
+
+async function fetchMotionTemplate(
+  jurisdiction: string,
+  motionType: string
+): Promise<MotionTemplate | null> {
+  try {
+    const templateName = MOTION_TEMPLATE_FILES[motionType];
     if (!templateName) {
       console.warn(`No template found for motion type: ${motionType}`);
       return null;
@@ -0,0 +1,167 @@
+/**
+ * Template Matcher
+ *
+ * Picks the best filing template from the manifest for a user's description.
+ * Template text never changes at runtime, so every template's term vectors are
+ * built and L2-normalized once when the matcher is created. Scoring a request
+ * then only normalizes the user's input and takes sparse dot products.
+ */
+
+import { safeLog } from './pii-redactor';
+
+export interface MatchableTemplate {
+  title: string;
+  description: string;
+  templatePath: string;
+  keywords: string[];
+}
+
+export interface TemplateMatch<T extends MatchableTemplate> {
+  template: T | null;
+  isEmergency: boolean;
+}
+
+/**
+ * Minimum combined score for a template to be used at all
+ */
+const MIN_TEMPLATE_SCORE = 0.1;
+
+const EMERGENCY_KEYWORDS = [
+  "eviction", "lockout", "changed locks", "locked out",
+  "emergency", "immediate", "urgent", "right now", "today",
+  "shut off", "utilities", "no water", "no electricity",
+  "domestic violence", "restraining order", "protective order"
+];
+
+const LEGAL_BOOST_KEYWORDS = [
+  'motion', 'complaint', 'answer', 'discovery', 'subpoena',
+  'eviction', 'unlawful detainer', 'foreclosure', 'bankruptcy',
+  'custody', 'divorce', 'restraining order', 'guardianship',
+  'contract', 'breach', 'damages', 'injunction'
+];
+
+/**
+ * Template with its static features precomputed
+ */
+interface PreparedTemplate<T extends MatchableTemplate> {
+  template: T;
+  titleLower: string;
+  keywordsLower: string[];
+  titleVector: Map<string, number>;
+  descVector: Map<string, number>;
+}
+
+function tokenize(text: string): string[] {
+  return text.toLowerCase().split(/\W+/).filter(Boolean);
+}
+
+/**
+ * Build a unit-length term-frequency vector for the given tokens
+ */
+export function normalizedTermVector(tokens: string[]): Map<string, number> {
+  const vector = new Map<string, number>();
+  for (const token of tokens) {
+    vector.set(token, (vector.get(token) || 0) + 1);
+  }
+
+  let sumSquares = 0;
+  for (const count of vector.values()) sumSquares += count * count;
+  if (sumSquares === 0) return vector;
+
+  const norm = Math.sqrt(sumSquares);
+  for (const [term, count] of vector) {
+    vector.set(term, count / norm);
+  }
+  return vector;
+}
+
+/**
+ * Dot product of two sparse vectors; for unit vectors this is cosine similarity
+ */
+function dotProduct(a: Map<string, number>, b: Map<string, number>): number {
+  const [smaller, larger] = a.size <= b.size ? [a, b] : [b, a];
+  let product = 0;
+  for (const [term, weight] of smaller) {
+    const other = larger.get(term);
+    if (other !== undefined) product += weight * other;
+  }
+  return product;
+}
+
+export function hasEmergencyKeywords(userInput: string): boolean {
+  const userInputLower = userInput.toLowerCase();
+  return EMERGENCY_KEYWORDS.some(keyword => userInputLower.includes(keyword));
+}
+
+export class TemplateMatcher<T extends MatchableTemplate> {
+  private readonly prepared: PreparedTemplate<T>[];
+  private readonly emergencyTemplate: T | null;
+
+  constructor(templates: T[]) {
+    this.prepared = templates.map(template => ({
+      template,
+      titleLower: template.title?.toLowerCase() || '',
+      keywordsLower: (template.keywords || []).map(keyword => keyword.toLowerCase()),
+      titleVector: normalizedTermVector(tokenize(template.title || '')),
+      descVector: normalizedTermVector(tokenize(template.description || '')),
+    }));
+
+    this.emergencyTemplate = this.prepared.find(({ template, titleLower }) =>
+      titleLower.includes('lockout') ||
+      (template.templatePath?.toLowerCase() || '').includes('lockout') ||
+      titleLower.includes('emergency')
+    )?.template ?? null;
+  }
+
+  findBestTemplate(userInput: string): TemplateMatch<T> {
+    if (this.emergencyTemplate && hasEmergencyKeywords(userInput)) {
+      safeLog(`Emergency keywords detected, forcing template: ${this.emergencyTemplate.title}`);
+      return { template: this.emergencyTemplate, isEmergency: true };
+    }
+
+    const inputLower = userInput.toLowerCase();
+    const inputTokens = tokenize(inputLower);
+    const inputTokenSet = new Set(inputTokens);
+    const inputVector = normalizedTermVector(inputTokens);
+    const inputBoostKeywords = LEGAL_BOOST_KEYWORDS.filter(keyword => inputLower.includes(keyword));
+
+    let bestMatch: T | null = null;
+    let highestSimilarity = 0;
+
+    for (const entry of this.prepared) {
+      let keywordScore = 0;
+      if (entry.keywordsLower.length > 0) {
+        let matchedKeywords = 0;
+        for (const keyword of entry.keywordsLower) {
+          if (inputTokenSet.has(keyword) || inputLower.includes(keyword)) {
+            matchedKeywords++;
+          }
+        }
+        keywordScore = matchedKeywords / entry.keywordsLower.length;
+      }
+
+      const titleSimilarity = dotProduct(inputVector, entry.titleVector);
+      const descSimilarity = dotProduct(inputVector, entry.descVector);
+
+      let titleBoost = 0;
+      for (const legalKeyword of inputBoostKeywords) {
+        if (entry.titleLower.includes(legalKeyword)) {
+          titleBoost = 0.2;
+          break;
+        }
+      }
+
+      const combinedSimilarity = (keywordScore * 0.5) + (titleSimilarity * 0.3) + (descSimilarity * 0.2) + titleBoost;
+
+      if (combinedSimilarity > highestSimilarity) {
+        highestSimilarity = combinedSimilarity;
+        bestMatch = entry.template;
+      }
+    }
+
+    return {
+      template: (bestMatch && highestSimilarity > MIN_TEMPLATE_SCORE) ? bestMatch : null,
+      isEmergency: false
+    };
+  }
+}
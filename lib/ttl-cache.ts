@@ -0,0 +1,113 @@
+/**
+ * TTL Caches
+ *
+ * Shared building blocks for the app's caches:
+ * - createMemoryCache: a bounded, insertion-ordered map (oldest evicted first)
+ *   with optional expiry, for per-instance caches
+ * - createTtlCache: the shared Upstash Redis client when configured, otherwise
+ *   a bounded in-memory map (per serverless instance)
+ */
+
+import { getRedisClient } from './redis';
+import { safeDebug, safeWarn } from './pii-redactor';
+
+export interface MemoryCache<T> {
+  get(key: string): T | undefined;
+  set(key: string, value: T): void;
+  clear(): void;
+}
+
+export interface TtlCache<T> {
+  /** Returns null on miss or cache failure */
+  get(key: string): Promise<T | null>;
+  /** Failures are logged and otherwise ignored */
+  set(key: string, value: T): Promise<void>;
+}
+
+/**
+ * Create a bounded in-memory cache
+ * @param options.maxEntries - Entries kept before the oldest is evicted
+ * @param options.ttlMs - Entry lifetime; entries never expire when omitted
+ */
+export function createMemoryCache<T>(options: { maxEntries: number; ttlMs?: number }): MemoryCache<T> {
+  const entries = new Map<string, { value: T; expiresAt: number }>();
+
+  return {
+    get(key) {
+      const entry = entries.get(key);
+      if (!entry) return undefined;
+      if (entry.expiresAt <= Date.now()) {
+        entries.delete(key);
+        return undefined;
+      }
+      return entry.value;
+    },
+
+    set(key, value) {
+      // Re-inserting moves the key to the newest position
+      entries.delete(key);
+      if (entries.size >= options.maxEntries) {
+        const oldestKey = entries.keys().next().value;
+        if (oldestKey !== undefined) entries.delete(oldestKey);
+      }
+      const expiresAt = options.ttlMs === undefined ? Infinity : Date.now() + options.ttlMs;
+      entries.set(key, { value, expiresAt });
+    },
+
+    clear() {
+      entries.clear();
+    },
+  };
+}
+
+/**
+ * Create a Redis-backed cache with an in-memory fallback
+ * @param options.name - Label used in log messages, e.g. "Response Cache"
+ * @param options.ttlSeconds - Entry lifetime in both Redis and memory
+ * @param options.maxMemoryEntries - Bound for the in-memory fallback
+ */
+export function createTtlCache<T>(options: {
+  name: string;
+  ttlSeconds: number;
+  maxMemoryEntries: number;
+}): TtlCache<T> {
+  const { name, ttlSeconds, maxMemoryEntries } = options;
+  const memoryCache = createMemoryCache<T>({ maxEntries: maxMemoryEntries, ttlMs: ttlSeconds * 1000 });
+
+  return {
+    async get(key) {
+      const redis = getRedisClient();
+
+      if (redis) {
+        try {
+          const cached = await redis.get<T>(key);
+          if (cached) safeDebug(`[${name}] Redis hit`);
+          return cached ?? null;
+        } catch (error) {
+          safeWarn(`[${name}] Redis lookup failed:`, error);
+          return null;
+        }
+      }
+
+      const value = memoryCache.get(key);
+      if (value === undefined) return null;
+      safeDebug(`[${name}] Memory hit`);
+      return value;
+    },
+
+    async set(key, value) {
+      const redis = getRedisClient();
+
+      if (redis) {
+        try {
+          await redis.set(key, value, { ex: ttlSeconds });
+        } catch (error) {
+          safeWarn(`[${name}] Redis store failed:`, error);
+        }
+        return;
+      }
+
+      memoryCache.set(key, value);
+    },
+  };
+}
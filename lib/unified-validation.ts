@@ -24,7 +24,7 @@
  */
 
 import { z } from 'zod';
-import { safeLog, safeWarn } from './pii-redactor';
+import { safeLog, safeDebug, safeWarn } from './pii-redactor';
 
 // ============================================================================
 // ZOD SCHEMAS - Single Source of Truth
@@ -194,38 +194,44 @@ export function findPlaceholders(content: string): string[] {
 // CITATION VALIDATION
 // ============================================================================
 
+/**
+ * Recognized citation formats, compiled once at module load
+ */
+const CITATION_FORMAT_PATTERNS = [
+  // Federal statutes
+  /\d+\s+U\.?S\.?C\.?\s+§?\s*\d+/i,
+  // State statutes
+  /[A-Z][a-z]+\.?\s+(?:Stat\.?|Code|Civ\.?\s+Proc\.?)\s+§?\s*\d+/i,
+  // Court rules
+  /(?:Fed\.?\s+R\.?\s+(?:Civ\.?\s+)?P\.?|Cal\.?\s+Rules\s+of\s+Court|Local\s+Rule)\s+\d+/i,
+  // Case citations
+  /\d+\s+(?:F\.?\d+d?|F\.?\s+Supp\.?\s*\d*d?|Cal\.?\s+(?:App\.?\s*)?\d*|S\.?\s+Ct\.?|L\.?\s+Ed\.?\s*\d*)\s+\d+/i,
+];
+
+/**
+ * Citation extraction patterns (global), compiled once at module load
+ */
+const CITATION_EXTRACTION_PATTERNS = [
+  /\d+\s+[A-Z]\.[A-Z]\.[A-Z]\.?\s+§?\s*\d+[a-z]?/gi,
+  /[A-Z][a-z]+\.?\s+(?:Stat\.?|Code|Crim\.?\s+Proc\.?)\s+§?\s*\d+(?:\.\d+)?[a-z]?/gi,
+  /(?:Fed\.?\s+R\.?\s+(?:Civ\.?\s+)?P\.?)\s+\d+(?:[a-z]|\(\d+\))?/gi,
+  /\d+\s+(?:F\.?\d+d?|F\.?\s+Supp\.?\s*\d*d?|S\.?\s+Ct\.?|L\.?\s+Ed\.?\s*\d*)\s+\d+/gi,
+];
+
 /**
  * Check if a citation follows proper legal format
  */
 export function isValidCitationFormat(citation: string): boolean {
-  const citationPatterns = [
-    // Federal statutes
-    /\d+\s+U\.?S\.?C\.?\s+§?\s*\d+/i,
-    // State statutes
-    /[A-Z][a-z]+\.?\s+(?:Stat\.?|Code|Civ\.?\s+Proc\.?)\s+§?\s*\d+/i,
-    // Court rules
-    /(?:Fed\.?\s+R\.?\s+(?:Civ\.?\s+)?P\.?|Cal\.?\s+Rules\s+of\s+Court|Local\s+Rule)\s+\d+/i,
-    // Case citations
-    /\d+\s+(?:F\.?\d+d?|F\.?\s+Supp\.?\s*\d*d?|Cal\.?\s+(?:App\.?\s*)?\d*|S\.?\s+Ct\.?|L\.?\s+Ed\.?\s*\d*)\s+\d+/i,
-  ];
-  
-  return citationPatterns.some(pattern => pattern.test(citation));
+  return CITATION_FORMAT_PATTERNS.some(pattern => pattern.test(citation));
 }
 
 /**
  * Extract all citations from content
  */
 export function extractCitations(content: string): string[] {
-  const citationPatterns = [
-    /\d+\s+[A-Z]\.[A-Z]\.[A-Z]\.?\s+§?\s*\d+[a-z]?/gi,
-    /[A-Z][a-z]+\.?\s+(?:Stat\.?|Code|Crim\.?\s+Proc\.?)\s+§?\s*\d+(?:\.\d+)?[a-z]?/gi,
-    /(?:Fed\.?\s+R\.?\s+(?:Civ\.?\s+)?P\.?)\s+\d+(?:[a-z]|\(\d+\))?/gi,
-    /\d+\s+(?:F\.?\d+d?|F\.?\s+Supp\.?\s*\d*d?|S\.?\s+Ct\.?|L\.?\s+Ed\.?\s*\d*)\s+\d+/gi,
-  ];
-  
   const citations = new Set<string>();
   
-  for (const pattern of citationPatterns) {
+  for (const pattern of CITATION_EXTRACTION_PATTERNS) {
     const matches = content.match(pattern) || [];
     for (const match of matches) {
       citations.add(match.trim());
@@ -253,7 +259,7 @@ export type ValidationResult<T> =
  * All validation flows through this function.
  */
 export function validateLegalOutput(data: unknown): ValidationResult<z.infer<typeof StructuredLegalOutputSchema>> {
-  safeLog('[Validation] Starting Zod-based validation...');
+  safeDebug('[Validation] Starting Zod-based validation...');
   
   const result = StructuredLegalOutputSchema.safeParse(data);
   
@@ -276,7 +282,7 @@ export function validateLegalOutput(data: unknown): ValidationResult<z.infer<typ
     };
   }
   
-  safeLog('[Validation] Passed successfully');
+  safeDebug('[Validation] Passed successfully');
   
   return {
     valid: true,
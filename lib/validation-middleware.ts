@@ -14,7 +14,8 @@
  */
 
 import { z } from 'zod';
-import { safeLog, safeWarn } from './pii-redactor';
+import { safeLog, safeDebug, safeWarn } from './pii-redactor';
+import { JSON_STREAM } from '../config/constants';
 /* eslint-disable @typescript-eslint/no-unused-vars -- Re-exported below */
 import {
   validateLegalOutput as zodValidateLegalOutput,
@@ -162,13 +163,13 @@ export async function validateWithMiddleware(
 ): Promise<UnifiedValidationResult> {
   const { enableSelfCorrection = true, correctionFunction, maxCorrectionAttempts = 1 } = options || {};
   
-  safeLog('[Validation Middleware] Starting validation...');
+  safeDebug('[Validation Middleware] Starting validation...');
   
   // First, try Zod schema validation
   const result = StructuredLegalOutputSchema.safeParse(output);
   
   if (result.success) {
-    safeLog('[Validation Middleware] Passed Zod validation');
+    safeDebug('[Validation Middleware] Passed Zod validation');
     return {
       valid: true,
       errors: [],
@@ -196,7 +197,8 @@ export async function validateWithMiddleware(
       output,
       errors,
       correctionFunction,
-      maxCorrectionAttempts
+      // Each attempt is a full LLM round trip; never exceed the global cap
+      Math.min(maxCorrectionAttempts, JSON_STREAM.MAX_REPAIR_ATTEMPTS)
     );
     
     return correctedResult;
@@ -212,6 +214,15 @@ export async function validateWithMiddleware(
   };
 }
 
+/**
+ * True when two error lists contain the same messages, ignoring order
+ */
+function sameErrors(a: string[], b: string[]): boolean {
+  if (a.length !== b.length) return false;
+  const remaining = new Set(b);
+  return a.every(error => remaining.has(error));
+}
+
 /**
  * Attempt self-correction loop
  * "Repair-or-Retry" logic - tries to fix the output automatically
@@ -225,7 +236,8 @@ async function attemptSelfCorrection(
   safeLog('[Validation Middleware] Starting self-correction loop...');
   
   let currentOutput = originalOutput;
-  let currentErrors = initialErrors;
+  // Own copy so errors can be appended in place without touching the caller's array
+  let currentErrors = [...initialErrors];
   
   for (let attempt = 1; attempt <= maxAttempts; attempt++) {
     safeLog(`[Validation Middleware] Correction attempt ${attempt}/${maxAttempts}`);
@@ -262,13 +274,20 @@ async function attemptSelfCorrection(
       }
       
       // Correction didn't pass validation - update errors and retry
+      const madeProgress = !sameErrors(validationResult.errors, currentErrors);
       currentOutput = correctedOutput;
-      currentErrors = validationResult.errors;
+      currentErrors = [...validationResult.errors];
       safeWarn(`[Validation Middleware] Correction attempt ${attempt} failed:`, currentErrors);
+
+      // Another round with identical errors would just repeat this LLM call
+      if (!madeProgress) {
+        safeWarn('[Validation Middleware] Correction made no progress, stopping early');
+        break;
+      }
       
     } catch (error) {
       safeWarn(`[Validation Middleware] Correction attempt ${attempt} error:`, error);
-      currentErrors = [...currentErrors, `Correction error: ${error instanceof Error ? error.message : 'Unknown error'}`];
+      currentErrors.push(`Correction error: ${error instanceof Error ? error.message : 'Unknown error'}`);
     }
   }
   
@@ -443,6 +462,16 @@ export interface LegacyValidationResult {
   }>;
 }
 
+/**
+ * Patterns counted by SafetyValidator's citation check, compiled once
+ */
+const CITATION_COUNT_PATTERNS = [
+  /\b\d{1,2}:\d{2}-cv-\d{5,7}\b/gi,
+  /\b\d{3}[- ]\d{3}[- ]\d{3}\b/g,
+  /§\s*\d+/gi,
+  /\b[A-Z][a-z]+\s+v\.\s+[A-Z][a-z]+\b/g,
+];
+
 /**
  * Safety Validator - Security gate for legal analysis
  *
@@ -482,14 +511,8 @@ export class SafetyValidator {
 
   private checkCitationCount(analysisText: string): boolean {
     let citationCount = 0;
-    const citationPatterns = [
-      /\b\d{1,2}:\d{2}-cv-\d{5,7}\b/gi,
-      /\b\d{3}[- ]\d{3}[- ]\d{3}\b/g,
-      /§\s*\d+/gi,
-      /\b[A-Z][a-z]+\s+v\.\s+[A-Z][a-z]+\b/g,
-    ];
 
-    for (const pattern of citationPatterns) {
+    for (const pattern of CITATION_COUNT_PATTERNS) {
       const matches = analysisText.match(pattern);
       if (matches) {
         citationCount += matches.length;
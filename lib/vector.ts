@@ -11,9 +11,20 @@
  */
 
 import { Index } from '@upstash/vector';
+import { LEGAL_DATA } from '../config/constants';
+import { createMemoryCache } from './ttl-cache';
+import { mapWithConcurrency } from './concurrency';
 
 let vectorInstance: Index | null = null;
 
+// Recent search results by query and filters. Each query is embedded
+// server-side, so retries and audits of the same text would otherwise pay
+// for the embedding and search again.
+const searchCache = createMemoryCache<VectorSearchResult[]>({
+  maxEntries: LEGAL_DATA.VECTOR_SEARCH_CACHE_MAX_ENTRIES,
+  ttlMs: LEGAL_DATA.VECTOR_SEARCH_CACHE_TTL_MS,
+});
+
 /**
  * Get the Vector index instance.
  * Returns null if environment variables are not configured.
@@ -111,6 +122,12 @@ export async function searchLegalRules(
     threshold = 30,
   } = options || {};
 
+  const cacheKey = JSON.stringify([query, jurisdiction ?? '', category ?? '', topK, threshold]);
+  const cached = searchCache.get(cacheKey);
+  if (cached) {
+    return cached;
+  }
+
   try {
     // Build filter string for Upstash Vector
     // Format: "field='value'" or combine multiple with AND/OR
@@ -141,13 +158,17 @@ export async function searchLegalRules(
     });
 
     // Filter by threshold and map results
-    return results
+    const matches = results
       .filter((r) => (r.score || 0) >= threshold)
       .map((r) => ({
         id: r.id,
         score: r.score || 0,
         metadata: r.metadata as unknown as LegalRuleVector,
       }));
+
+    searchCache.set(cacheKey, matches);
+
+    return matches;
   } catch (error) {
     console.error('Vector search error:', error);
     return [];
@@ -174,14 +195,29 @@ export async function indexLegalRule(rule: LegalRuleVector): Promise<number | st
     data: textToEmbed,
     metadata: rule,
   });
+  searchCache.clear();
 
   return result as number | string;
 }
 
+/**
+ * SHA-256 of a rule's contents, stored in its metadata so reseeding can tell
+ * which rules changed
+ */
+async function hashRuleContent(rule: LegalRuleVector): Promise<string> {
+  const hashBuffer = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(JSON.stringify(rule)));
+  return Array.from(new Uint8Array(hashBuffer)).map(b => b.toString(16).padStart(2, '0')).join('');
+}
+
 /**
  * Batch index multiple legal rules
+ * Rules are upserted VECTOR_UPSERT_BATCH_SIZE at a time so each request embeds
+ * a whole batch, with up to VECTOR_UPSERT_CONCURRENCY batches in flight; a
+ * failed batch is retried rule by rule so one bad record doesn't drop its
+ * neighbours. Rules whose stored content hash matches are
+ * skipped, so reseeding only re-embeds what changed.
  * @param rules - Array of legal rules to index
- * @returns Number of successfully indexed rules
+ * @returns Number of rules now indexed (including unchanged ones)
  */
 export async function batchIndexLegalRules(rules: LegalRuleVector[]): Promise<number> {
   const client = getVectorClient();
@@ -190,24 +226,69 @@ export async function batchIndexLegalRules(rules: LegalRuleVector[]): Promise<nu
     throw new Error('Upstash Vector not configured');
   }
 
+  const toUpsert = (rule: LegalRuleVector, contentHash: string) => ({
+    id: rule.id,
+    data: `${rule.rule_number} ${rule.title} ${rule.description} ${rule.full_text}`.trim(),
+    metadata: { ...rule, content_hash: contentHash },
+  });
+
   let successCount = 0;
+  let unchangedCount = 0;
+
+  const indexBatch = async (start: number) => {
+    const batch = rules.slice(start, start + LEGAL_DATA.VECTOR_UPSERT_BATCH_SIZE);
+    const hashes = await Promise.all(batch.map(hashRuleContent));
+
+    // Fetching metadata is far cheaper than re-embedding; on failure, upsert everything
+    let storedHashes: unknown[] = [];
+    try {
+      const existing = await client.fetch(batch.map(rule => rule.id), { includeMetadata: true });
+      storedHashes = existing.map(vector => vector?.metadata?.content_hash);
+    } catch (error) {
+      console.warn('Could not fetch existing rules, re-indexing the whole batch:', error);
+    }
+
+    const changed: Array<ReturnType<typeof toUpsert>> = [];
+    batch.forEach((rule, index) => {
+      if (storedHashes[index] === hashes[index]) {
+        unchangedCount++;
+      } else {
+        changed.push(toUpsert(rule, hashes[index]));
+      }
+    });
+    successCount += batch.length - changed.length;
+    if (changed.length === 0) return;
 
-  for (const rule of rules) {
     try {
-      const textToEmbed = `${rule.rule_number} ${rule.title} ${rule.description} ${rule.full_text}`.trim();
-      
-      await client.upsert({
-        id: rule.id,
-        data: textToEmbed,
-        metadata: rule,
-      });
-      
-      successCount++;
+      await client.upsert(changed);
+      successCount += changed.length;
+      return;
     } catch (error) {
-      console.error(`Failed to index rule ${rule.id}:`, error);
+      console.error(`Failed to index batch of ${changed.length} rules, retrying individually:`, error);
+    }
+
+    for (const vector of changed) {
+      try {
+        await client.upsert(vector);
+        successCount++;
+      } catch (error) {
+        console.error(`Failed to index rule ${vector.id}:`, error);
+      }
     }
+  };
+
+  // A few batches in flight at once; each is a separate embedding request
+  const batchStarts = Array.from(
+    { length: Math.ceil(rules.length / LEGAL_DATA.VECTOR_UPSERT_BATCH_SIZE) },
+    (_, batchIndex) => batchIndex * LEGAL_DATA.VECTOR_UPSERT_BATCH_SIZE
+  );
+  await mapWithConcurrency(batchStarts, LEGAL_DATA.VECTOR_UPSERT_CONCURRENCY, indexBatch);
+
+  if (unchangedCount > 0) {
+    console.log(`Skipped ${unchangedCount} unchanged rules`);
   }
 
+  searchCache.clear();
   return successCount;
 }
 
@@ -223,6 +304,7 @@ export async function deleteLegalRule(id: number): Promise<void> {
   }
 
   await client.delete([id]);
+  searchCache.clear();
 }
 
 /**
@@ -84,10 +84,13 @@ async function seedVector() {
     const files = await readdir(rulesDir);
     const jsonFiles = files.filter(f => f.endsWith('.json'));
 
-    for (const file of jsonFiles) {
-      const filePath = path.join(rulesDir, file);
-      const content = await readFile(filePath, 'utf8');
-      const data = JSON.parse(content);
+    // Read every rules file at once; they are processed in directory order below
+    const contents = await Promise.all(
+      jsonFiles.map(file => readFile(path.join(rulesDir, file), 'utf8'))
+    );
+
+    for (const [index, file] of jsonFiles.entries()) {
+      const data = JSON.parse(contents[index]);
       const jur = data.jurisdiction;
 
       console.log(`  - Processing ${jur} (${file})`);
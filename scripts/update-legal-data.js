@@ -463,22 +463,36 @@ async function checkForUpdates() {
     federalRules: 'Federal'
   };
 
+  // Fetch every source in one concurrent batch (the slow, network-bound part),
+  // then process results in source order so logs and review flags stay stable
+  const sourceEntries = Object.entries(CONFIG.sources);
+  console.log(`Fetching ${sourceEntries.length} sources...`);
+  const fetchResults = await Promise.allSettled(sourceEntries.map(([, url]) =>
+    url.includes('courtlistener.com/api')
+      ? fetchUrl(`${url}/search/?q=*&order_by=-date_created&limit=1`)
+      : fetchWithBrowserless(url)
+  ));
+
   // Check each source
-  for (const [name, url] of Object.entries(CONFIG.sources)) {
+  for (const [index, [name, url]] of sourceEntries.entries()) {
     try {
       console.log(`Checking ${name}...`);
 
+      const fetchResult = fetchResults[index];
+      if (fetchResult.status === 'rejected') {
+        throw fetchResult.reason;
+      }
+
       // For API sources, we can check actual data
       if (url.includes('courtlistener.com/api')) {
-        await fetchUrl(`${url}/search/?q=*&order_by=-date_created&limit=1`);
         updates.sources[name] = {
           status: 'ok',
           lastCheck: new Date().toISOString(),
           available: true
         };
       } else {
-        // For web pages, fetch and analyze content
-        const content = await fetchWithBrowserless(url);
+        // For web pages, analyze the fetched content
+        const content = fetchResult.value;
         
         // Check for content changes
         const changeDetection = detectContentChanges(content, name, existingHashes);
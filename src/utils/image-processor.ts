@@ -27,6 +27,9 @@ export async function resizeAndCompressImage(
       return;
     }
 
+    // Decode straight from the file's blob URL rather than first reading the
+    // whole file into a base64 data URL (a second, 33% larger copy in memory)
+    const objectUrl = URL.createObjectURL(file);
     const img = new Image();
     img.onload = () => {
       try {
@@ -80,22 +83,17 @@ export async function resizeAndCompressImage(
       } finally {
         // Clean up
         img.src = '';
+        URL.revokeObjectURL(objectUrl);
       }
     };
 
     img.onerror = (error) => {
+      URL.revokeObjectURL(objectUrl);
       reject(error);
     };
 
     // Load the image
-    const reader = new FileReader();
-    reader.onload = (e) => {
-      img.src = e.target?.result as string;
-    };
-    reader.onerror = (error) => {
-      reject(error);
-    };
-    reader.readAsDataURL(file);
+    img.src = objectUrl;
   });
 }
 
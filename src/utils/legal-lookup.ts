@@ -1,4 +1,5 @@
 import legalLookupData from '../../public/data/legal_lookup.json';
+import { createMemoryCache } from '../../lib/ttl-cache';
 
 export interface Source {
   title: string | null;
@@ -34,13 +35,33 @@ export interface LegalLookupDatabase {
 
 const legalLookupDb: LegalLookupDatabase = legalLookupData as LegalLookupDatabase;
 
+// Separates fields in the search index so a query can't match across two fields
+const FIELD_SEPARATOR = '\u0000';
+
 /**
- * Loads the legal lookup database from the public data folder
- * @returns Promise resolving to the legal lookup database
+ * Lowercased searchable text for each rule, built once at module load
+ * instead of lowercasing every field on every query
  */
-async function loadLegalLookupDb(): Promise<LegalLookupDatabase> {
-  return legalLookupDb;
-}
+const procedureRuleIndex = (legalLookupDb.pro_se_procedural_rules || []).map(rule => ({
+  rule,
+  text: [rule.rule_number, rule.title, rule.description, rule.category, rule.jurisdiction]
+    .join(FIELD_SEPARATOR)
+    .toLowerCase(),
+}));
+
+const exParteRuleIndex = (legalLookupDb.ex_parte_notice_rules || []).map(rule => ({
+  rule,
+  jurisdiction: rule.jurisdiction.toLowerCase(),
+}));
+
+const MAX_FORMATTED_MATCHES = 10;
+
+// Ex parte rule matches by search term; the database is read-only at runtime
+// and jurisdictions repeat across requests, so entries never expire
+const MAX_CACHED_JURISDICTIONS = 64;
+const exParteRulesByJurisdiction = createMemoryCache<ExParteNoticeRule[]>({
+  maxEntries: MAX_CACHED_JURISDICTIONS,
+});
 
 /**
  * Searches the legal lookup database for rules matching a query
@@ -48,24 +69,16 @@ async function loadLegalLookupDb(): Promise<LegalLookupDatabase> {
  * @returns Array of matching legal rules
  */
 export async function searchLegalLookup(query: string): Promise<LegalRule[]> {
-  const db = await loadLegalLookupDb();
-  
-  if (!query || !db?.pro_se_procedural_rules) {
+  if (!query) {
     return [];
   }
 
   const searchTerm = query.toLowerCase().trim();
-  
-  // Search across multiple fields: rule_number, title, description, category
-  return db.pro_se_procedural_rules.filter(rule => {
-    return (
-      rule.rule_number.toLowerCase().includes(searchTerm) ||
-      rule.title.toLowerCase().includes(searchTerm) ||
-      rule.description.toLowerCase().includes(searchTerm) ||
-      rule.category.toLowerCase().includes(searchTerm) ||
-      rule.jurisdiction.toLowerCase().includes(searchTerm)
-    );
-  });
+
+  // Search across multiple fields: rule_number, title, description, category, jurisdiction
+  return procedureRuleIndex
+    .filter(entry => entry.text.includes(searchTerm))
+    .map(entry => entry.rule);
 }
 
 /**
@@ -74,8 +87,13 @@ export async function searchLegalLookup(query: string): Promise<LegalRule[]> {
  * @returns True if matches are found, false otherwise
  */
 export async function hasLegalLookupMatch(query: string): Promise<boolean> {
-  const matches = await searchLegalLookup(query);
-  return matches.length > 0;
+  if (!query) {
+    return false;
+  }
+
+  // Stop at the first hit instead of collecting every match
+  const searchTerm = query.toLowerCase().trim();
+  return procedureRuleIndex.some(entry => entry.text.includes(searchTerm));
 }
 
 /**
@@ -84,17 +102,23 @@ export async function hasLegalLookupMatch(query: string): Promise<boolean> {
  * @returns Array of matching ex parte notice rules
  */
 export async function searchExParteRules(jurisdiction: string): Promise<ExParteNoticeRule[]> {
-  const db = await loadLegalLookupDb();
-  
-  if (!jurisdiction || !db?.ex_parte_notice_rules) {
+  if (!jurisdiction) {
     return [];
   }
 
   const searchTerm = jurisdiction.toLowerCase().trim();
-  
-  return db.ex_parte_notice_rules.filter(rule => {
-    return rule.jurisdiction.toLowerCase().includes(searchTerm);
-  });
+
+  const cached = exParteRulesByJurisdiction.get(searchTerm);
+  if (cached) {
+    return cached;
+  }
+
+  const rules = exParteRuleIndex
+    .filter(entry => entry.jurisdiction.includes(searchTerm))
+    .map(entry => entry.rule);
+
+  exParteRulesByJurisdiction.set(searchTerm, rules);
+  return rules;
 }
 
 /**
@@ -109,22 +133,21 @@ export async function getLegalLookupResponse(query: string): Promise<LegalResult
     return null;
   }
 
-  // Format the matches into a legal result
-  let responseText = `LEGAL RESEARCH RESULTS:\n\n`;
-  
-  matches.forEach((rule, index) => {
-    responseText += `${index + 1}. ${rule.rule_number}: ${rule.title}\n`;
-    responseText += `   Category: ${rule.category} | Jurisdiction: ${rule.jurisdiction}\n`;
-    responseText += `   Description: ${rule.description}\n\n`;
-  });
-
-  // Limit to top 10 matches to avoid overly long responses
-  if (matches.length > 10) {
-    responseText += `...(showing first 10 of ${matches.length} matches)\n\n`;
-  }
-
-  responseText += `SOURCE: Federal Rules of Civil Procedure and Pro Se Procedural Guide\n`;
-  responseText += `DISCLAIMER: This is legal information, not legal advice. Consult with a qualified attorney.\n`;
+  // Format the matches into a legal result; limit to the top matches to
+  // avoid overly long responses
+  const formattedMatches = matches.slice(0, MAX_FORMATTED_MATCHES).map((rule, index) =>
+    `${index + 1}. ${rule.rule_number}: ${rule.title}\n` +
+    `   Category: ${rule.category} | Jurisdiction: ${rule.jurisdiction}\n` +
+    `   Description: ${rule.description}\n\n`
+  );
+
+  const truncationNote = matches.length > MAX_FORMATTED_MATCHES
+    ? `...(showing first ${MAX_FORMATTED_MATCHES} of ${matches.length} matches)\n\n`
+    : '';
+
+  const responseText = `LEGAL RESEARCH RESULTS:\n\n${formattedMatches.join('')}${truncationNote}` +
+    `SOURCE: Federal Rules of Civil Procedure and Pro Se Procedural Guide\n` +
+    `DISCLAIMER: This is legal information, not legal advice. Consult with a qualified attorney.\n`;
 
   return {
     text: responseText,
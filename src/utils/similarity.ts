@@ -44,10 +44,14 @@ export function termFrequency(tokens: string[]): Map<string, number> {
  */
 export function dotProduct(tf1: Map<string, number>, tf2: Map<string, number>): number {
   let product = 0;
-  
-  for (const [term, freq1] of tf1.entries()) {
-    const freq2 = tf2.get(term) || 0;
-    product += freq1 * freq2;
+
+  // Iterate the smaller map so the cost is bounded by the shorter text
+  const [smaller, larger] = tf1.size <= tf2.size ? [tf1, tf2] : [tf2, tf1];
+  for (const [term, freq1] of smaller.entries()) {
+    const freq2 = larger.get(term);
+    if (freq2 !== undefined) {
+      product += freq1 * freq2;
+    }
   }
   
   return product;
@@ -8,10 +8,6 @@
 import { getDatabase } from '../../lib/offline-vault';
 import { safeLog, safeError } from '../../lib/pii-redactor';
 
-// IndexedDB table name for state storage
-// eslint-disable-next-line @typescript-eslint/no-unused-vars
-const STATE_STORE_NAME = 'cases';
-
 /**
  * Generate a secure case ID using crypto API
  */
@@ -64,10 +60,12 @@ export function updateUrlWithCaseId(caseId: string): void {
 
 /**
  * Save state to IndexedDB
+ * Pass `stateJson` when the caller has already serialized the state.
  */
 export async function saveStateToIndexedDB(
   caseId: string,
-  state: unknown
+  state: unknown,
+  stateJson: string = JSON.stringify(state)
 ): Promise<void> {
   try {
     const db = getDatabase();
@@ -77,8 +75,6 @@ export async function saveStateToIndexedDB(
     // Check if case already exists
     const existingCase = await db.cases.get({ caseId });
     
-    const stateJson = JSON.stringify(state);
-    
     const caseData = {
       caseId,
       caseName: existingCase?.caseName || `Case ${caseId}`,
@@ -248,14 +244,14 @@ export async function saveCurrentState(state: unknown): Promise<void> {
 }
 
 let globalWatcherTimeoutId: unknown = null;
-let globalLastStateHash: string | null = null;
+let globalLastStateJson: string | null = null;
 
 export function resetWatcherState(): void {
   if (globalWatcherTimeoutId) {
     clearTimeout(globalWatcherTimeoutId as ReturnType<typeof setTimeout>);
     globalWatcherTimeoutId = null;
   }
-  globalLastStateHash = null;
+  globalLastStateJson = null;
 }
 
 /**
@@ -271,16 +267,15 @@ export function watchStateAndSyncToUrl(
       
       if (!currentState) return;
       
-      // Create a hash to detect changes
+      // Serialize once: the same string detects changes and is what gets stored
       const currentStateJson = JSON.stringify(currentState);
-      const currentStateHash = btoa(encodeURIComponent(currentStateJson)).substring(0, 32);
       
       // Only save if state has changed
-      if (currentStateHash !== globalLastStateHash) {
+      if (currentStateJson !== globalLastStateJson) {
         const caseId = getCaseIdFromUrl();
         if (caseId) {
-          await saveStateToIndexedDB(caseId, currentState);
-          globalLastStateHash = currentStateHash;
+          await saveStateToIndexedDB(caseId, currentState, currentStateJson);
+          globalLastStateJson = currentStateJson;
         }
       }
     } catch (error) {
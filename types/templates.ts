@@ -284,15 +284,24 @@ export function findBestTemplate(
   return best.score > 0 ? best.id : null;
 }
 
+/**
+ * Parsed manifest, built on first load and reused for the life of the process
+ */
+let cachedManifest: TemplateMetadata[] | null = null;
+
 /**
  * Load template manifest (typed version)
  */
 export async function loadTemplateManifest(): Promise<TemplateMetadata[]> {
+  if (cachedManifest) {
+    return cachedManifest;
+  }
+
   // In Next.js, import the JSON directly
   const manifest = await import('../public/templates/manifest.json');
   
   // Validate and cast to typed format
-  return manifest.templates.map((t: Record<string, unknown>) => ({
+  cachedManifest = manifest.templates.map((t: Record<string, unknown>) => ({
     id: t.id as TemplateId,
     title: t.title as string,
     category: t.category as TemplateCategory,
@@ -300,4 +309,6 @@ export async function loadTemplateManifest(): Promise<TemplateMetadata[]> {
     keywords: t.keywords as string[],
     templatePath: t.templatePath as string,
   }));
+
+  return cachedManifest;
 }